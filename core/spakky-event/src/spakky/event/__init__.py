@@ -40,6 +40,7 @@ from spakky.event.publisher import (
     AsyncEventPublisher,
     EventPublisher,
 )
+from spakky.event.serialization import event_type_adapter
 
 __all__ = [
     # Publisher Interfaces
@@ -67,6 +68,8 @@ __all__ = [
     "AuthContextSnapshotHeaderInjector",
     "AsyncDirectEventBus",
     "DirectEventBus",
+    # Serialization
+    "event_type_adapter",
     # Post-Processors
     "EventHandlerRegistrationPostProcessor",
     # Aspects
@@ -36,8 +36,7 @@ class AsyncTransactionalEventPublishingAspect(IAsyncAspect):
     async def after_returning_async(self, result: Any) -> None:
         """Publish domain events from collected aggregates after successful commit."""
         for aggregate in self._collector.all():
-            for event in aggregate.events:
-                await self._publisher.publish(event)
+            await self._publisher.publish_many(aggregate.events)
             aggregate.clear_events()
 
     @After(lambda x: Transactional.exists(x) and iscoroutinefunction(x))
@@ -66,8 +65,7 @@ class TransactionalEventPublishingAspect(IAspect):
     def after_returning(self, result: Any) -> None:
         """Publish domain events from collected aggregates after successful commit."""
         for aggregate in self._collector.all():
-            for event in aggregate.events:
-                self._publisher.publish(event)
+            self._publisher.publish_many(aggregate.events)
             aggregate.clear_events()
 
     @After(lambda x: Transactional.exists(x) and not iscoroutinefunction(x))
@@ -1,10 +1,15 @@
 """Default EventBus implementations that delegate to EventTransport."""
 
-from typing import override
+from collections.abc import Callable, Iterable
+from dataclasses import fields
+from datetime import datetime
+from functools import lru_cache
+from typing import get_type_hints, override
+from uuid import UUID
 
-from pydantic import TypeAdapter
+import orjson
 from spakky.core.pod.annotations.pod import Pod
-from spakky.domain.models.event import AbstractIntegrationEvent
+from spakky.domain.models.event import AbstractEvent, AbstractIntegrationEvent
 from spakky.tracing.propagator import ITracePropagator
 
 from spakky.event.auth_propagation import AuthContextSnapshotHeaderInjector
@@ -14,6 +19,74 @@ from spakky.event.event_publisher import (
     IEventBus,
     IEventTransport,
 )
+from spakky.event.serialization import TYPE_ADAPTER_CACHE_SIZE, event_type_adapter
+
+FLAT_EVENT_FIELD_TYPES: frozenset[type] = frozenset({str, int, bool, UUID, datetime})
+"""Field types that orjson encodes byte-for-byte like pydantic's dump_json."""
+
+
+def _flat_event_field_names(
+    event_type: type[AbstractIntegrationEvent],
+) -> tuple[str, ...] | None:
+    hints = get_type_hints(event_type, include_extras=True)
+    field_names = tuple(field.name for field in fields(event_type))
+    if all(
+        type(hints[name]) is type and hints[name] in FLAT_EVENT_FIELD_TYPES
+        for name in field_names
+    ):
+        return field_names
+    return None
+
+
+@lru_cache(maxsize=TYPE_ADAPTER_CACHE_SIZE)
+def _json_dumper(
+    event_type: type[AbstractIntegrationEvent],
+) -> Callable[[AbstractIntegrationEvent], bytes]:
+    # The adapter comes from the process-wide cache shared with consumers;
+    # the bound dump_json is cached so send() makes a single call per event.
+    dump_json = event_type_adapter(event_type).dump_json
+    flat_field_names = _flat_event_field_names(event_type)
+    if flat_field_names is None:
+        return dump_json
+    field_names: tuple[str, ...] = flat_field_names
+
+    def dump_flat(event: AbstractIntegrationEvent) -> bytes:
+        # Flat events skip pydantic's schema walk; values orjson rejects
+        # (e.g. integers beyond 64 bits) still go through pydantic.
+        try:
+            return orjson.dumps(
+                {
+                    name: getattr(event, name)  # dataclass field names of the event
+                    for name in field_names
+                },
+                option=orjson.OPT_UTC_Z,
+            )
+        except orjson.JSONEncodeError:
+            return dump_json(event)
+
+    return dump_flat
+
+
+def _class_event_name(event_type: type[AbstractIntegrationEvent]) -> str | None:
+    # Only the inherited event_name is a pure function of the class; any
+    # override may read instance state (including defaulted fields), so it
+    # is resolved per event instead.
+    if event_type.event_name is AbstractEvent.event_name:
+        return event_type.__name__
+    return None
+
+
+@lru_cache(maxsize=TYPE_ADAPTER_CACHE_SIZE)
+def _publish_plan(
+    event_type: type[AbstractIntegrationEvent],
+) -> tuple[str | None, Callable[[AbstractIntegrationEvent], bytes]]:
+    # One cache lookup per event yields both the routing name and the dumper.
+    return _class_event_name(event_type), _json_dumper(event_type)
+
+
+def _serialize(event: AbstractIntegrationEvent) -> tuple[str, bytes]:
+    event_name, dump = _publish_plan(type(event))
+    return event_name or event.event_name, dump(event)
 
 
 @Pod()
@@ -23,7 +96,6 @@ class DirectEventBus(IEventBus):
     _transport: IEventTransport
     _propagator: ITracePropagator
     _auth_snapshot_headers: AuthContextSnapshotHeaderInjector
-    _adapters: dict[type, TypeAdapter[AbstractIntegrationEvent]]
 
     def __init__(
         self,
@@ -37,22 +109,28 @@ class DirectEventBus(IEventBus):
         self._auth_snapshot_headers = (
             auth_snapshot_headers or AuthContextSnapshotHeaderInjector()
         )
-        self._adapters = {}
 
-    @override
-    def send(self, event: AbstractIntegrationEvent) -> None:
-        """Serialize and send an integration event via transport."""
-        event_type = type(event)
-        if event_type not in self._adapters:
-            self._adapters[event_type] = TypeAdapter(event_type)
-        adapter = self._adapters[event_type]
+    def _headers(self) -> dict[str, str]:
         headers: dict[str, str] = {}
         self._propagator.inject(headers)
         self._auth_snapshot_headers.inject(headers)
-        self._transport.send(
-            event.event_name,
-            adapter.dump_json(event),
-            headers,
+        return headers
+
+    @override
+    def send(self, event: AbstractIntegrationEvent) -> None:
+        """Serialize and send an integration event via transport."""
+        event_name, payload = _serialize(event)
+        self._transport.send(event_name, payload, self._headers())
+
+    @override
+    def send_many(self, events: Iterable[AbstractIntegrationEvent]) -> None:
+        """Serialize integration events and hand them to the transport as one batch.
+
+        Trace and auth headers are injected once and shared by the batch.
+        """
+        headers = self._headers()
+        self._transport.send_many(
+            [(*_serialize(event), dict(headers)) for event in events]
         )
 
 
@@ -63,7 +141,6 @@ class AsyncDirectEventBus(IAsyncEventBus):
     _transport: IAsyncEventTransport
     _propagator: ITracePropagator
     _auth_snapshot_headers: AuthContextSnapshotHeaderInjector
-    _adapters: dict[type, TypeAdapter[AbstractIntegrationEvent]]
 
     def __init__(
         self,
@@ -77,20 +154,26 @@ class AsyncDirectEventBus(IAsyncEventBus):
         self._auth_snapshot_headers = (
             auth_snapshot_headers or AuthContextSnapshotHeaderInjector()
         )
-        self._adapters = {}
 
-    @override
-    async def send(self, event: AbstractIntegrationEvent) -> None:
-        """Serialize and send an integration event via async transport."""
-        event_type = type(event)
-        if event_type not in self._adapters:
-            self._adapters[event_type] = TypeAdapter(event_type)
-        adapter = self._adapters[event_type]
+    def _headers(self) -> dict[str, str]:
         headers: dict[str, str] = {}
         self._propagator.inject(headers)
         self._auth_snapshot_headers.inject(headers)
-        await self._transport.send(
-            event.event_name,
-            adapter.dump_json(event),
-            headers,
+        return headers
+
+    @override
+    async def send(self, event: AbstractIntegrationEvent) -> None:
+        """Serialize and send an integration event via async transport."""
+        event_name, payload = _serialize(event)
+        await self._transport.send(event_name, payload, self._headers())
+
+    @override
+    async def send_many(self, events: Iterable[AbstractIntegrationEvent]) -> None:
+        """Serialize integration events and hand them to the async transport as one batch.
+
+        Trace and auth headers are injected once and shared by the batch.
+        """
+        headers = self._headers()
+        await self._transport.send_many(
+            [(*_serialize(event), dict(headers)) for event in events]
         )
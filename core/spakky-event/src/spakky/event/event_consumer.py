@@ -1,7 +1,8 @@
 """Event consumer interfaces for registering event handlers."""
 
 from abc import ABC, abstractmethod
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any
 
 from spakky.domain.models.event import AbstractEvent
 
@@ -27,6 +28,18 @@ class IEventConsumer(ABC):
         """Register a handler callback for the given event type."""
         ...
 
+    def register_many(
+        self,
+        routes: Iterable[tuple[type[AbstractEvent], EventHandlerCallback[Any]]],
+    ) -> None:
+        """Register several ``(event type, handler)`` pairs in order.
+
+        The default implementation registers them one by one; broker consumers
+        may override it to update their routing state once per batch.
+        """
+        for event, handler in routes:
+            self.register(event, handler)
+
 
 class IAsyncEventConsumer(ABC):
     """Asynchronous event consumer interface for registering event handlers."""
@@ -39,3 +52,15 @@ class IAsyncEventConsumer(ABC):
     ) -> None:
         """Register an async handler callback for the given event type."""
         ...
+
+    def register_many(
+        self,
+        routes: Iterable[tuple[type[AbstractEvent], AsyncEventHandlerCallback[Any]]],
+    ) -> None:
+        """Register several ``(event type, async handler)`` pairs in order.
+
+        The default implementation registers them one by one; broker consumers
+        may override it to update their routing state once per batch.
+        """
+        for event, handler in routes:
+            self.register(event, handler)
@@ -7,6 +7,7 @@ Provides publisher, bus, and transport abstractions for event routing:
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 
 from spakky.domain.models.event import AbstractEvent, AbstractIntegrationEvent
 
@@ -19,6 +20,15 @@ class IEventPublisher(ABC):
         """Publish an event (domain → dispatcher, integration → bus)."""
         ...
 
+    def publish_many(self, events: Iterable[AbstractEvent]) -> None:
+        """Publish several events in order.
+
+        The default implementation publishes them one by one; implementations
+        may override it to hand integration events to the bus as a batch.
+        """
+        for event in events:
+            self.publish(event)
+
 
 class IAsyncEventPublisher(ABC):
     """Async counterpart of IEventPublisher."""
@@ -28,6 +38,15 @@ class IAsyncEventPublisher(ABC):
         """Publish an event asynchronously."""
         ...
 
+    async def publish_many(self, events: Iterable[AbstractEvent]) -> None:
+        """Publish several events asynchronously in order.
+
+        The default implementation publishes them one by one; implementations
+        may override it to hand integration events to the bus as a batch.
+        """
+        for event in events:
+            await self.publish(event)
+
 
 class IEventBus(ABC):
     """Synchronous event bus for sending integration events."""
@@ -37,6 +56,11 @@ class IEventBus(ABC):
         """Serialize and send an integration event via transport."""
         ...
 
+    def send_many(self, events: Iterable[AbstractIntegrationEvent]) -> None:
+        """Serialize and send several integration events in order."""
+        for event in events:
+            self.send(event)
+
 
 class IAsyncEventBus(ABC):
     """Asynchronous event bus for sending integration events."""
@@ -46,6 +70,11 @@ class IAsyncEventBus(ABC):
         """Serialize and send an integration event via transport."""
         ...
 
+    async def send_many(self, events: Iterable[AbstractIntegrationEvent]) -> None:
+        """Serialize and send several integration events in order."""
+        for event in events:
+            await self.send(event)
+
 
 class IEventTransport(ABC):
     """Low-level synchronous transport for pre-serialized event payloads."""
@@ -60,6 +89,15 @@ class IEventTransport(ABC):
         """Send a serialized event payload to the message broker."""
         ...
 
+    def send_many(self, messages: Iterable[tuple[str, bytes, dict[str, str]]]) -> None:
+        """Send several serialized ``(event_name, payload, headers)`` messages.
+
+        The default implementation sends them one by one; broker transports
+        may override it to enqueue the whole batch before waiting on I/O.
+        """
+        for event_name, payload, headers in messages:
+            self.send(event_name, payload, headers)
+
 
 class IAsyncEventTransport(ABC):
     """Low-level asynchronous transport for pre-serialized event payloads."""
@@ -73,3 +111,14 @@ class IAsyncEventTransport(ABC):
     ) -> None:
         """Send a serialized event payload to the message broker."""
         ...
+
+    async def send_many(
+        self, messages: Iterable[tuple[str, bytes, dict[str, str]]]
+    ) -> None:
+        """Send several serialized ``(event_name, payload, headers)`` messages.
+
+        The default implementation sends them one by one; broker transports
+        may override it to enqueue the whole batch before waiting on I/O.
+        """
+        for event_name, payload, headers in messages:
+            await self.send(event_name, payload, headers)
@@ -1,6 +1,6 @@
 """Event handler registration post-processor."""
 
-from inspect import getmembers, iscoroutinefunction, ismethod
+from inspect import getmembers, ismethod
 from logging import getLogger
 from typing import override
 
@@ -50,7 +50,7 @@ class EventHandlerRegistrationPostProcessor(IPostProcessor, IContainerAware):
 
             event_type = route.event_type
 
-            if iscoroutinefunction(method):
+            if route.is_async:
                 async_consumer.register(event_type, method)
                 logger.debug(
                     f"Registered async handler {pod_type.__name__}.{name} "
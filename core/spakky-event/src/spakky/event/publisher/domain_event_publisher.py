@@ -5,6 +5,7 @@ This module provides event publishers that route events by type:
 - AbstractIntegrationEvent → IEventBus (external transport)
 """
 
+from collections.abc import Iterable
 from typing import override
 
 from spakky.core.pod.annotations.pod import Pod
@@ -54,6 +55,21 @@ class EventPublisher(IEventPublisher):
             case _:  # pragma: no cover - 방어적 분기 (정상 흐름 불가)
                 raise UnknownEventTypeError(type(event))
 
+    @override
+    def publish_many(self, events: Iterable[AbstractEvent]) -> None:
+        """Publish events in order, sending consecutive integration events as one batch."""
+        pending: list[AbstractIntegrationEvent] = []
+        for event in events:
+            if isinstance(event, AbstractIntegrationEvent):
+                pending.append(event)
+                continue
+            if pending:
+                self._bus.send_many(pending)
+                pending = []
+            self.publish(event)
+        if pending:
+            self._bus.send_many(pending)
+
 
 @Pod()
 class AsyncEventPublisher(IAsyncEventPublisher):
@@ -81,3 +97,18 @@ class AsyncEventPublisher(IAsyncEventPublisher):
                 await self._bus.send(event)
             case _:  # pragma: no cover - 방어적 분기 (정상 흐름 불가)
                 raise UnknownEventTypeError(type(event))
+
+    @override
+    async def publish_many(self, events: Iterable[AbstractEvent]) -> None:
+        """Publish events in order, sending consecutive integration events as one batch."""
+        pending: list[AbstractIntegrationEvent] = []
+        for event in events:
+            if isinstance(event, AbstractIntegrationEvent):
+                pending.append(event)
+                continue
+            if pending:
+                await self._bus.send_many(pending)
+                pending = []
+            await self.publish(event)
+        if pending:
+            await self._bus.send_many(pending)
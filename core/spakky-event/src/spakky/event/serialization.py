@@ -0,0 +1,26 @@
+"""Process-wide pydantic TypeAdapter cache for event payloads.
+
+Publishing buses and broker consumers share these adapters so that each event
+type compiles its pydantic core schema only once per process.
+"""
+
+from functools import lru_cache
+from typing import cast
+
+from pydantic import TypeAdapter
+from spakky.domain.models.event import AbstractEvent
+
+TYPE_ADAPTER_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=TYPE_ADAPTER_CACHE_SIZE)
+def event_type_adapter(event_type: type[AbstractEvent]) -> TypeAdapter[AbstractEvent]:
+    """Return the shared TypeAdapter for an event type.
+
+    Args:
+        event_type: The event class to (de)serialize.
+
+    Returns:
+        The cached TypeAdapter for the event type.
+    """
+    return cast(TypeAdapter[AbstractEvent], TypeAdapter(event_type))
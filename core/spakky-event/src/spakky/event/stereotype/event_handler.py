@@ -4,7 +4,8 @@ This module provides @EventHandler stereotype and @on_event decorator
 for organizing event-driven architectures.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from inspect import iscoroutinefunction
 from typing import Any
 from collections.abc import Awaitable, Callable
 
@@ -27,6 +28,8 @@ class EventRoute[EventT_contra: AbstractEvent](FunctionAnnotation):
 
     event_type: type[EventT_contra]
     """The domain event type this handler processes."""
+    is_async: bool = field(init=False, default=False)
+    """Whether the handler is a coroutine function, resolved once at decoration."""
 
     def __call__(
         self, obj: EventHandlerMethod[EventT_contra]
@@ -39,6 +42,7 @@ class EventRoute[EventT_contra: AbstractEvent](FunctionAnnotation):
         Returns:
             The annotated method.
         """
+        self.is_async = iscoroutinefunction(obj)
         return super().__call__(obj)
 
 
@@ -1,11 +1,19 @@
 """Unit tests for DirectEventBus and AsyncDirectEventBus."""
 
+from typing import override
+
 import pytest
+from pydantic import TypeAdapter
 from spakky.core.common.mutability import immutable
 from spakky.domain.models.event import AbstractIntegrationEvent
 from spakky.tracing import W3CTracePropagator
 
-from spakky.event.bus.transport_event_bus import AsyncDirectEventBus, DirectEventBus
+from spakky.event.bus.transport_event_bus import (
+    AsyncDirectEventBus,
+    DirectEventBus,
+    _json_dumper,
+    _publish_plan,
+)
 from spakky.event.event_publisher import IAsyncEventTransport, IEventTransport
 
 
@@ -16,6 +24,57 @@ class SampleIntegrationEvent(AbstractIntegrationEvent):
     message: str
 
 
+@immutable
+class NestedIntegrationEvent(AbstractIntegrationEvent):
+    """Integration event with non-flat fields for testing."""
+
+    tags: list[str]
+    ratio: float
+
+
+@immutable
+class CountIntegrationEvent(AbstractIntegrationEvent):
+    """Integration event with an integer field for testing."""
+
+    count: int
+
+
+@immutable
+class RenamedIntegrationEvent(AbstractIntegrationEvent):
+    """Integration event overriding event_name at class level for testing."""
+
+    message: str
+
+    @property
+    @override
+    def event_name(self) -> str:
+        return "renamed.event"
+
+
+@immutable
+class DefaultedTenantIntegrationEvent(AbstractIntegrationEvent):
+    """Integration event whose event_name reads a defaulted field for testing."""
+
+    tenant: str = "default"
+
+    @property
+    @override
+    def event_name(self) -> str:
+        return f"{self.tenant}.event"
+
+
+@immutable
+class TenantIntegrationEvent(AbstractIntegrationEvent):
+    """Integration event whose event_name depends on instance fields for testing."""
+
+    tenant: str
+
+    @property
+    @override
+    def event_name(self) -> str:
+        return f"{self.tenant}.event"
+
+
 class RecordingTransport(IEventTransport):
     """Transport that records sent events."""
 
@@ -58,8 +117,8 @@ def test_direct_event_bus_send_single_expect_transport_called() -> None:
     assert transport.sent[0][0] == "SampleIntegrationEvent"
 
 
-def test_direct_event_bus_send_same_type_twice_expect_adapter_cached() -> None:
-    """동일 이벤트 타입 재전송 시 TypeAdapter가 캐시됨을 검증한다."""
+def test_direct_event_bus_send_same_type_twice_expect_dumper_cached() -> None:
+    """동일 이벤트 타입 재전송 시 JSON dumper가 캐시됨을 검증한다."""
     transport = RecordingTransport()
     bus = DirectEventBus(transport, W3CTracePropagator())
     event1 = SampleIntegrationEvent(message="first")
@@ -69,8 +128,7 @@ def test_direct_event_bus_send_same_type_twice_expect_adapter_cached() -> None:
     bus.send(event2)
 
     assert len(transport.sent) == 2
-    assert SampleIntegrationEvent in bus._adapters
-    assert len(bus._adapters) == 1
+    assert _json_dumper(SampleIntegrationEvent) is _json_dumper(SampleIntegrationEvent)
 
 
 @pytest.mark.asyncio
@@ -87,10 +145,10 @@ async def test_async_direct_event_bus_send_single_expect_transport_called() -> N
 
 
 @pytest.mark.asyncio
-async def test_async_direct_event_bus_send_same_type_twice_expect_adapter_cached() -> (
+async def test_async_direct_event_bus_send_same_type_twice_expect_dumper_cached() -> (
     None
 ):
-    """동일 이벤트 타입 재전송 시 TypeAdapter가 캐시됨을 검증한다."""
+    """동일 이벤트 타입 재전송 시 JSON dumper가 캐시됨을 검증한다."""
     transport = AsyncRecordingTransport()
     bus = AsyncDirectEventBus(transport, W3CTracePropagator())
     event1 = SampleIntegrationEvent(message="first")
@@ -100,5 +158,125 @@ async def test_async_direct_event_bus_send_same_type_twice_expect_adapter_cached
     await bus.send(event2)
 
     assert len(transport.sent) == 2
-    assert SampleIntegrationEvent in bus._adapters
-    assert len(bus._adapters) == 1
+    assert _json_dumper(SampleIntegrationEvent) is _json_dumper(SampleIntegrationEvent)
+
+
+def test_json_dumper_flat_event_expect_same_bytes_as_pydantic() -> None:
+    """평탄한 이벤트는 orjson으로 직렬화하되 pydantic과 동일한 bytes를 만드는지 검증한다."""
+    event = SampleIntegrationEvent(message='안녕 "world"')
+
+    payload = _json_dumper(SampleIntegrationEvent)(event)
+
+    assert payload == TypeAdapter(SampleIntegrationEvent).dump_json(event)
+
+
+def test_json_dumper_nested_event_expect_pydantic_dump_json() -> None:
+    """평탄하지 않은 필드가 있는 이벤트는 pydantic dump_json을 그대로 사용하는지 검증한다."""
+    event = NestedIntegrationEvent(tags=["a", "b"], ratio=0.5)
+
+    dumper = _json_dumper(NestedIntegrationEvent)
+
+    # getattr: Callable 타입에는 __name__이 선언되어 있지 않다
+    assert getattr(dumper, "__name__") == "dump_json"
+    assert dumper(event) == TypeAdapter(NestedIntegrationEvent).dump_json(event)
+
+
+def test_json_dumper_value_rejected_by_orjson_expect_pydantic_fallback() -> None:
+    """orjson이 처리하지 못하는 값(64bit 초과 정수)은 pydantic으로 직렬화하는지 검증한다."""
+    event = CountIntegrationEvent(count=2**70)
+
+    payload = _json_dumper(CountIntegrationEvent)(event)
+
+    assert payload == TypeAdapter(CountIntegrationEvent).dump_json(event)
+
+
+def test_direct_event_bus_send_many_expect_transport_receives_batch() -> None:
+    """DirectEventBus.send_many가 직렬화한 이벤트들을 순서대로 transport에 넘김을 검증한다."""
+    transport = RecordingTransport()
+    bus = DirectEventBus(transport, W3CTracePropagator())
+    events = [
+        SampleIntegrationEvent(message="first"),
+        SampleIntegrationEvent(message="second"),
+    ]
+
+    bus.send_many(events)
+
+    assert [payload for _, payload, _ in transport.sent] == [
+        _json_dumper(SampleIntegrationEvent)(event) for event in events
+    ]
+    assert transport.sent[0][2] == transport.sent[1][2]
+    assert transport.sent[0][2] is not transport.sent[1][2]
+
+
+@pytest.mark.asyncio
+async def test_async_direct_event_bus_send_many_expect_transport_receives_batch() -> (
+    None
+):
+    """AsyncDirectEventBus.send_many가 직렬화한 이벤트들을 순서대로 transport에 넘김을 검증한다."""
+    transport = AsyncRecordingTransport()
+    bus = AsyncDirectEventBus(transport, W3CTracePropagator())
+    events = [
+        SampleIntegrationEvent(message="first"),
+        SampleIntegrationEvent(message="second"),
+    ]
+
+    await bus.send_many(events)
+
+    assert [payload for _, payload, _ in transport.sent] == [
+        _json_dumper(SampleIntegrationEvent)(event) for event in events
+    ]
+
+
+def test_publish_plan_same_type_expect_cached_name_and_dumper() -> None:
+    """이벤트 타입별 이름과 dumper가 한 번만 계산되어 캐시됨을 검증한다."""
+    plan = _publish_plan(SampleIntegrationEvent)
+
+    assert plan is _publish_plan(SampleIntegrationEvent)
+    assert plan == ("SampleIntegrationEvent", _json_dumper(SampleIntegrationEvent))
+
+
+def test_publish_plan_overridden_event_name_expect_not_cached() -> None:
+    """event_name을 재정의한 이벤트 타입은 이름을 캐시하지 않음을 검증한다."""
+    assert _publish_plan(RenamedIntegrationEvent)[0] is None
+
+
+def test_direct_event_bus_send_class_level_event_name_expect_override_used() -> None:
+    """클래스 수준에서 재정의한 event_name이 전송 이름으로 사용됨을 검증한다."""
+    transport = RecordingTransport()
+    bus = DirectEventBus(transport, W3CTracePropagator())
+
+    bus.send(RenamedIntegrationEvent(message="hello"))
+
+    assert transport.sent[0][0] == "renamed.event"
+
+
+def test_direct_event_bus_send_many_instance_event_name_expect_resolved_per_event() -> (
+    None
+):
+    """인스턴스 필드에 의존하는 event_name은 이벤트마다 계산됨을 검증한다."""
+    transport = RecordingTransport()
+    bus = DirectEventBus(transport, W3CTracePropagator())
+
+    bus.send_many(
+        [TenantIntegrationEvent(tenant="a"), TenantIntegrationEvent(tenant="b")]
+    )
+
+    assert _publish_plan(TenantIntegrationEvent)[0] is None
+    assert [name for name, _, _ in transport.sent] == ["a.event", "b.event"]
+
+
+def test_direct_event_bus_send_defaulted_field_event_name_expect_instance_value() -> (
+    None
+):
+    """기본값이 있는 필드에 의존하는 event_name은 인스턴스 값으로 계산됨을 검증한다."""
+    transport = RecordingTransport()
+    bus = DirectEventBus(transport, W3CTracePropagator())
+
+    bus.send_many(
+        [
+            DefaultedTenantIntegrationEvent(tenant="acme"),
+            DefaultedTenantIntegrationEvent(),
+        ]
+    )
+
+    assert [name for name, _, _ in transport.sent] == ["acme.event", "default.event"]
@@ -1,5 +1,7 @@
 """Tests for event publisher implementations (type-based router)."""
 
+from collections.abc import Iterable
+
 import pytest
 from spakky.core.common.mutability import immutable
 from spakky.domain.models.event import (
@@ -68,6 +70,24 @@ class InMemoryAsyncBus(IAsyncEventBus):
         self.sent_events.append(event)
 
 
+class BatchRecordingSyncBus(InMemorySyncBus):
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: list[list[AbstractIntegrationEvent]] = []
+
+    def send_many(self, events: Iterable[AbstractIntegrationEvent]) -> None:
+        self.batches.append(list(events))
+
+
+class BatchRecordingAsyncBus(InMemoryAsyncBus):
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: list[list[AbstractIntegrationEvent]] = []
+
+    async def send_many(self, events: Iterable[AbstractIntegrationEvent]) -> None:
+        self.batches.append(list(events))
+
+
 def test_sync_publisher_routes_domain_event_to_dispatcher() -> None:
     """sync publisher가 domain event를 dispatcher에 위임함을 검증한다."""
     dispatcher = InMemorySyncDispatcher()
@@ -122,3 +142,46 @@ async def test_async_publisher_routes_integration_event_to_bus() -> None:
     assert len(dispatcher.dispatched_events) == 0
     assert len(bus.sent_events) == 1
     assert bus.sent_events[0] is event
+
+
+def test_sync_publisher_publish_many_expect_consecutive_integration_events_batched() -> (
+    None
+):
+    """publish_many가 순서를 지키며 연속된 integration event를 한 번에 bus로 보냄을 검증한다."""
+    dispatcher = InMemorySyncDispatcher()
+    bus = BatchRecordingSyncBus()
+    publisher = EventPublisher(dispatcher, bus)
+    first_domain = SampleDomainEvent(data="d1")
+    second_domain = SampleDomainEvent(data="d2")
+    first = SampleIntegrationEvent(data="i1")
+    second = SampleIntegrationEvent(data="i2")
+    third = SampleIntegrationEvent(data="i3")
+
+    publisher.publish_many([first_domain, first, second, second_domain])
+    publisher.publish_many([third])
+
+    assert dispatcher.dispatched_events == [first_domain, second_domain]
+    assert bus.batches == [[first, second], [third]]
+    assert bus.sent_events == []
+
+
+@pytest.mark.asyncio
+async def test_async_publisher_publish_many_expect_consecutive_integration_events_batched() -> (
+    None
+):
+    """비동기 publish_many가 순서를 지키며 연속된 integration event를 한 번에 bus로 보냄을 검증한다."""
+    dispatcher = InMemoryAsyncDispatcher()
+    bus = BatchRecordingAsyncBus()
+    publisher = AsyncEventPublisher(dispatcher, bus)
+    first_domain = SampleDomainEvent(data="d1")
+    second_domain = SampleDomainEvent(data="d2")
+    first = SampleIntegrationEvent(data="i1")
+    second = SampleIntegrationEvent(data="i2")
+    third = SampleIntegrationEvent(data="i3")
+
+    await publisher.publish_many([first_domain, first, second, second_domain])
+    await publisher.publish_many([third])
+
+    assert dispatcher.dispatched_events == [first_domain, second_domain]
+    assert bus.batches == [[first, second], [third]]
+    assert bus.sent_events == []
@@ -38,3 +38,20 @@ def test_event_handler_with_callback() -> None:
     assert EventRoute.get_or_none(SampleEventHandler.handle) is not None
     assert EventRoute.get_or_none(SampleEventHandler().handle) is not None
     assert EventHandler.get_or_none(NonAnnotated) is None
+
+
+def test_on_event_expect_is_async_resolved_at_decoration() -> None:
+    """@on_event가 데코레이션 시점에 핸들러의 코루틴 여부를 기록함을 검증한다."""
+
+    @immutable
+    class SampleEvent(AbstractDomainEvent): ...
+
+    class SampleEventHandler:
+        @on_event(SampleEvent)
+        async def handle_async(self, event: SampleEvent) -> None: ...
+
+        @on_event(SampleEvent)
+        def handle_sync(self, event: SampleEvent) -> None: ...
+
+    assert EventRoute.get(SampleEventHandler.handle_async).is_async is True
+    assert EventRoute.get(SampleEventHandler.handle_sync).is_async is False
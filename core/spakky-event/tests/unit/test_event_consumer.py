@@ -1,4 +1,11 @@
+from typing import override
+from unittest.mock import AsyncMock, Mock
+
+from spakky.domain.models.event import AbstractEvent
+
 from spakky.event.event_consumer import (
+    AsyncEventHandlerCallback,
+    EventHandlerCallback,
     IAsyncEventConsumer,
     IEventConsumer,
 )
@@ -12,3 +19,43 @@ def test_event_consumer_interface() -> None:
 def test_async_event_consumer_interface() -> None:
     """IAsyncEventConsumer 인터페이스가 올바르게 정의되어 있음을 검증한다."""
     assert hasattr(IAsyncEventConsumer, "register")
+
+
+def test_event_consumer_register_many_default_expect_register_per_route() -> None:
+    """register_many 기본 구현이 route마다 순서대로 register를 호출함을 검증한다."""
+    registered: list[tuple[type[AbstractEvent], object]] = []
+
+    class RecordingConsumer(IEventConsumer):
+        @override
+        def register[EventT_contra: AbstractEvent](
+            self,
+            event: type[EventT_contra],
+            handler: EventHandlerCallback[EventT_contra],
+        ) -> None:
+            registered.append((event, handler))
+
+    first, second = Mock(), Mock()
+
+    RecordingConsumer().register_many([(AbstractEvent, first), (AbstractEvent, second)])
+
+    assert registered == [(AbstractEvent, first), (AbstractEvent, second)]
+
+
+def test_async_event_consumer_register_many_default_expect_register_per_route() -> None:
+    """비동기 register_many 기본 구현이 route마다 순서대로 register를 호출함을 검증한다."""
+    registered: list[tuple[type[AbstractEvent], object]] = []
+
+    class RecordingConsumer(IAsyncEventConsumer):
+        @override
+        def register[EventT_contra: AbstractEvent](
+            self,
+            event: type[EventT_contra],
+            handler: AsyncEventHandlerCallback[EventT_contra],
+        ) -> None:
+            registered.append((event, handler))
+
+    first, second = AsyncMock(), AsyncMock()
+
+    RecordingConsumer().register_many([(AbstractEvent, first), (AbstractEvent, second)])
+
+    assert registered == [(AbstractEvent, first), (AbstractEvent, second)]
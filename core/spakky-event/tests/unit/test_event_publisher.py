@@ -1,3 +1,7 @@
+import pytest
+from spakky.core.common.mutability import immutable
+from spakky.domain.models.event import AbstractEvent, AbstractIntegrationEvent
+
 from spakky.event.event_publisher import (
     IAsyncEventBus,
     IAsyncEventPublisher,
@@ -36,3 +40,69 @@ def test_event_transport_interface() -> None:
 def test_async_event_transport_interface() -> None:
     """IAsyncEventTransport 인터페이스가 send 메서드를 가짐을 검증한다."""
     assert hasattr(IAsyncEventTransport, "send")
+
+
+@immutable
+class SampleIntegrationEvent(AbstractIntegrationEvent):
+    """기본 batch 구현 검증용 integration event."""
+
+    data: str
+
+
+class RecordingPublisher(IEventPublisher):
+    def __init__(self) -> None:
+        self.published: list[AbstractEvent] = []
+
+    def publish(self, event: AbstractEvent) -> None:
+        self.published.append(event)
+
+
+class RecordingAsyncPublisher(IAsyncEventPublisher):
+    def __init__(self) -> None:
+        self.published: list[AbstractEvent] = []
+
+    async def publish(self, event: AbstractEvent) -> None:
+        self.published.append(event)
+
+
+class RecordingBus(IEventBus):
+    def __init__(self) -> None:
+        self.sent: list[AbstractIntegrationEvent] = []
+
+    def send(self, event: AbstractIntegrationEvent) -> None:
+        self.sent.append(event)
+
+
+class RecordingAsyncBus(IAsyncEventBus):
+    def __init__(self) -> None:
+        self.sent: list[AbstractIntegrationEvent] = []
+
+    async def send(self, event: AbstractIntegrationEvent) -> None:
+        self.sent.append(event)
+
+
+def test_default_publish_many_and_send_many_expect_one_by_one() -> None:
+    """publish_many/send_many 기본 구현이 이벤트를 순서대로 하나씩 처리함을 검증한다."""
+    events = [SampleIntegrationEvent(data="a"), SampleIntegrationEvent(data="b")]
+    publisher = RecordingPublisher()
+    bus = RecordingBus()
+
+    publisher.publish_many(events)
+    bus.send_many(events)
+
+    assert publisher.published == events
+    assert bus.sent == events
+
+
+@pytest.mark.asyncio
+async def test_async_default_publish_many_and_send_many_expect_one_by_one() -> None:
+    """비동기 publish_many/send_many 기본 구현이 이벤트를 순서대로 하나씩 처리함을 검증한다."""
+    events = [SampleIntegrationEvent(data="a"), SampleIntegrationEvent(data="b")]
+    publisher = RecordingAsyncPublisher()
+    bus = RecordingAsyncBus()
+
+    await publisher.publish_many(events)
+    await bus.send_many(events)
+
+    assert publisher.published == events
+    assert bus.sent == events
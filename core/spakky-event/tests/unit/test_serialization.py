@@ -0,0 +1,22 @@
+"""Tests for the shared event TypeAdapter cache."""
+
+from spakky.core.common.mutability import immutable
+from spakky.domain.models.event import AbstractIntegrationEvent
+
+from spakky.event.serialization import event_type_adapter
+
+
+@immutable
+class SampleIntegrationEvent(AbstractIntegrationEvent):
+    """Sample integration event for testing."""
+
+    message: str
+
+
+def test_event_type_adapter_same_type_expect_shared_instance() -> None:
+    """같은 이벤트 타입에 대해 하나의 TypeAdapter를 공유함을 검증한다."""
+    adapter = event_type_adapter(SampleIntegrationEvent)
+    event = SampleIntegrationEvent(message="hello")
+
+    assert adapter is event_type_adapter(SampleIntegrationEvent)
+    assert adapter.validate_json(adapter.dump_json(event)) == event
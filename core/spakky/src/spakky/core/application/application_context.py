@@ -81,6 +81,9 @@ STARTUP_PHASE_INSTANTIATION = "instantiation"
 STARTUP_PHASE_POST_PROCESSING = "post_processing"
 STARTUP_PHASE_SERVICE_START = "service_start"
 
+# Read-only stand-in for a context that has not stored anything yet.
+_EMPTY_CONTEXT_CACHE: MappingProxyType[str, object] = MappingProxyType({})
+
 
 @dataclass
 class _ApplicationContextStartupMetrics:
@@ -734,9 +737,9 @@ class ApplicationContext(IApplicationContext):
         self.__context_cache.set(cache)
 
     def __get_context_cache(self, pod: Pod) -> object | None:
-        cache = self.__context_cache.get({})
-        cached = cache.get(pod.name)
-        return cached
+        # Reads share one empty mapping instead of allocating a dict per
+        # lookup; only writes create the context's own cache.
+        return self.__context_cache.get(_EMPTY_CONTEXT_CACHE).get(pod.name)
 
     def __get_internal[T: object](
         self,
@@ -1227,8 +1230,7 @@ class ApplicationContext(IApplicationContext):
         """
         if key == CONTEXT_ID:
             return self.get_context_id()
-        context = self.__context_cache.get({})
-        return context.get(key)
+        return self.__context_cache.get(_EMPTY_CONTEXT_CACHE).get(key)
 
     @override
     def set_context_value(self, key: str, value: object) -> None:
@@ -1247,4 +1249,9 @@ class ApplicationContext(IApplicationContext):
     @override
     def clear_context(self) -> None:
         """Clear context-scoped cache for current context."""
+        # A context that never stored anything has nothing to drop. Any cache
+        # that exists, even an empty one inherited from a parent context, is
+        # replaced so concurrent contexts never write into a shared dict.
+        if self.__context_cache.get(None) is None:
+            return
         self.__context_cache.set({})
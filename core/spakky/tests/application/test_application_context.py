@@ -1,5 +1,6 @@
 import asyncio
 from abc import abstractmethod
+from contextvars import copy_context
 from dataclasses import dataclass
 from typing import Annotated, Any, cast, override
 from collections.abc import Callable
@@ -2246,6 +2247,26 @@ def test_application_context_clear_context_expect_success() -> None:
     assert isinstance(new_context_id, UUID)
 
 
+def test_application_context_clear_context_concurrent_contexts_expect_isolated() -> (
+    None
+):
+    """비어 있거나 상속된 캐시를 clear해도 동시 컨텍스트끼리 값을 공유하지 않음을 검증한다."""
+    context = ApplicationContext()
+
+    def handle_message(value: str) -> object | None:
+        context.clear_context()
+        context.set_context_value("key", value)
+        return context.get_context_value("key")
+
+    assert copy_context().run(handle_message, "first") == "first"
+    assert copy_context().run(handle_message, "second") == "second"
+    assert context.get_context_value("key") is None
+
+    context.set_context_value("key", "parent")
+    assert copy_context().run(handle_message, "third") == "third"
+    assert context.get_context_value("key") == "parent"
+
+
 def test_application_context_get_qualified_multiple_candidates_none_match_expect_error() -> (
     None
 ):
@@ -0,0 +1,28 @@
+"""FastAPI configuration for response compression."""
+
+from typing import ClassVar
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from spakky.core.stereotype.configuration import Configuration
+
+SPAKKY_FASTAPI_COMPRESSION_CONFIG_ENV_PREFIX = "SPAKKY_FASTAPI_COMPRESSION_"
+DEFAULT_COMPRESSION_MINIMUM_SIZE = 1024
+DEFAULT_COMPRESSION_LEVEL = 5
+
+
+@Configuration()
+class FastAPICompressionConfig(BaseSettings):
+    """GZip response compression settings loaded from environment."""
+
+    model_config: ClassVar[SettingsConfigDict] = SettingsConfigDict(
+        env_prefix=SPAKKY_FASTAPI_COMPRESSION_CONFIG_ENV_PREFIX,
+        env_file_encoding="utf-8",
+        env_nested_delimiter="__",
+    )
+
+    enabled: bool = True
+    minimum_size: int = DEFAULT_COMPRESSION_MINIMUM_SIZE
+    compress_level: int = DEFAULT_COMPRESSION_LEVEL
+
+    def __init__(self) -> None:
+        super().__init__()
@@ -5,14 +5,18 @@ with FastAPI's error handling system. All errors can be converted to JSON
 responses with appropriate HTTP status codes.
 """
 
-import traceback
+import sys
 from abc import ABC
+from traceback import StackSummary, walk_tb
 from typing import ClassVar
 
+import orjson
 from spakky.core.common.error import AbstractSpakkyFrameworkError
 
-from fastapi import status
-from fastapi.responses import JSONResponse
+from fastapi import Response, status
+from spakky.plugins.fastapi.responses import ORJSONResponse
+
+type TracebackFrame = dict[str, str | int | None]
 
 
 class AbstractSpakkyFastAPIError(AbstractSpakkyFrameworkError, ABC):
@@ -29,20 +33,61 @@ class AbstractSpakkyFastAPIError(AbstractSpakkyFrameworkError, ABC):
     status_code: ClassVar[int]
     """HTTP status code returned for this error type."""
 
-    def to_response(self, show_traceback: bool = False) -> JSONResponse:
+    __default_bodies: ClassVar[dict[type["AbstractSpakkyFastAPIError"], bytes]] = {}
+    """Pre-serialized bodies for errors without args or traceback, keyed by class."""
+
+    def __extract_traceback(self) -> list[TracebackFrame]:
+        handled = sys.exception()
+        error = handled if handled is not None else self
+        frames = StackSummary.extract(walk_tb(error.__traceback__), lookup_lines=False)
+        return [
+            {"file": frame.filename, "line": frame.lineno, "name": frame.name}
+            for frame in frames
+        ]
+
+    def __serialize_args(self) -> list[str]:
+        args = self.args
+        if not args or (len(args) == 1 and args[0] == self.message):
+            return []
+        return [str(x) for x in args]
+
+    def to_response(self, show_traceback: bool = False) -> Response:
         """Convert the error to a FastAPI JSON response.
 
+        Errors raised without arguments and without a traceback always render
+        the same body, so that body is serialized once per error class and
+        reused on subsequent calls. A single argument equal to ``message``
+        only repeats it and is treated as no arguments.
+
+        When ``show_traceback`` is set, the traceback is rendered as a list of
+        ``{"file", "line", "name"}`` frames of the exception currently being
+        handled (or this error when none is), without reading source lines.
+
         Args:
-            show_traceback: Whether to include the full traceback in the response.
+            show_traceback: Whether to include the traceback in the response.
 
         Returns:
             A JSON response containing the error message, args, and optional traceback.
         """
-        return JSONResponse(
+        args = self.__serialize_args()
+        if not show_traceback and not args:
+            error_type = type(self)
+            body = self.__default_bodies.get(error_type)
+            if body is None:
+                body = orjson.dumps(
+                    {"message": self.message, "args": [], "traceback": None}
+                )
+                self.__default_bodies[error_type] = body
+            return Response(
+                content=body,
+                status_code=self.status_code,
+                media_type="application/json",
+            )
+        return ORJSONResponse(
             content={
                 "message": self.message,
-                "args": [str(x) for x in self.args],
-                "traceback": traceback.format_exc() if show_traceback else None,
+                "args": args,
+                "traceback": self.__extract_traceback() if show_traceback else None,
             },
             status_code=self.status_code,
         )
@@ -88,3 +133,13 @@ class InternalServerError(AbstractSpakkyFastAPIError):
 
     message = "Internal Server Error"
     status_code: ClassVar[int] = status.HTTP_500_INTERNAL_SERVER_ERROR
+
+
+class InvalidControllerPrefixError(AbstractSpakkyFrameworkError):
+    """Raised when an API controller prefix does not start with '/' or ends with '/'."""
+
+    message = "A path prefix must start with '/' and must not end with '/'"
+
+    def __init__(self, prefix: str) -> None:
+        super().__init__()
+        self.prefix = prefix
@@ -7,6 +7,7 @@ built-in middleware injection for FastAPI applications.
 from spakky.core.application.application import SpakkyApplication
 
 from spakky.plugins.fastapi.actuator import FastAPIActuatorConfig
+from spakky.plugins.fastapi.compression import FastAPICompressionConfig
 from spakky.plugins.fastapi.post_processors.add_builtin_middlewares import (
     AddBuiltInMiddlewaresPostProcessor,
 )
@@ -32,6 +33,7 @@ def initialize(app: SpakkyApplication) -> None:
         app: The Spakky application instance.
     """
     app.add(FastAPIActuatorConfig)
+    app.add(FastAPICompressionConfig)
     app.add(BindLifespanPostProcessor)
     app.add(AddBuiltInMiddlewaresPostProcessor)
     app.add(RegisterActuatorPostProcessor)
@@ -5,62 +5,79 @@ to appropriate JSON responses and handles unexpected exceptions gracefully.
 """
 
 from logging import getLogger
-from collections.abc import Awaitable, Callable
 
-from starlette.middleware.base import BaseHTTPMiddleware, DispatchFunction
-from starlette.responses import Response
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from fastapi import Request
 from spakky.plugins.fastapi.error import AbstractSpakkyFastAPIError, InternalServerError
 
 logger = getLogger(__name__)
-type Next = Callable[[Request], Awaitable[Response]]
 
 
-class ErrorHandlingMiddleware(BaseHTTPMiddleware):
+class ErrorHandlingMiddleware:
     """Middleware that catches and converts exceptions to JSON responses.
 
     Handles both Spakky FastAPI errors and unexpected exceptions, converting
     them to appropriate JSON responses with correct HTTP status codes.
+
+    Implemented as a pure ASGI middleware so that successful responses are
+    streamed through untouched instead of being relayed by a background task.
     """
 
+    __app: ASGIApp
     __debug: bool
 
     def __init__(
         self,
         app: ASGIApp,
-        dispatch: DispatchFunction | None = None,
         debug: bool = False,
     ) -> None:
         """Initialize the error handling middleware.
 
         Args:
             app: The ASGI application.
-            dispatch: Optional custom dispatch function.
             debug: Whether to include tracebacks in error responses.
         """
-        super().__init__(app, dispatch)
+        self.__app = app
         self.__debug = debug
 
-    async def dispatch(self, request: Request, call_next: Next) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process the request with error handling.
 
         Catches exceptions during request processing and converts them to
         appropriate JSON responses. Spakky FastAPI errors are converted using
         their to_response() method, while unexpected exceptions return 500.
+        Exceptions raised after the response has started are re-raised, since
+        a second response can no longer be sent. Non-HTTP scopes are passed
+        through unchanged.
 
         Args:
-            request: The incoming HTTP request.
-            call_next: Function to call the next middleware or route handler.
-
-        Returns:
-            The HTTP response, either from successful processing or error handling.
+            scope: The ASGI connection scope.
+            receive: The ASGI receive channel.
+            send: The ASGI send channel.
         """
+        if scope["type"] != "http":
+            await self.__app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_tracking_start(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
         try:
-            return await call_next(request)
+            await self.__app(scope, receive, send_tracking_start)
         except AbstractSpakkyFastAPIError as e:
-            return e.to_response()
+            if response_started:
+                raise
+            await e.to_response()(scope, receive, send)
         except Exception as e:
-            logger.exception(f"Unhandled exception during request processing: {e!r}")
-            return InternalServerError().to_response(self.__debug)
+            if response_started:
+                raise
+            logger.exception(
+                "Unhandled exception during request processing: %r",
+                e,
+            )
+            await InternalServerError().to_response(self.__debug)(scope, receive, send)
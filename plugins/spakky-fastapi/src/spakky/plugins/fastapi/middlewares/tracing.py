@@ -5,34 +5,32 @@ child span for the request lifetime, and injects trace context into
 response headers.
 """
 
-from collections.abc import Awaitable, Callable
-
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware, DispatchFunction
-from starlette.responses import Response
-from starlette.types import ASGIApp
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from spakky.tracing.context import TraceContext
 from spakky.tracing.propagator import ITracePropagator
 
-type Next = Callable[[Request], Awaitable[Response]]
-
 
-class TracingMiddleware(BaseHTTPMiddleware):
+class TracingMiddleware:
     """Middleware that propagates W3C Trace Context across HTTP boundaries.
 
     Extracts ``traceparent`` from request headers, activates a child span
     for the request lifetime, and injects ``traceparent`` into response
     headers.  When no incoming trace context is present, a new root trace
     is started.
+
+    Implemented as a pure ASGI middleware so that requests are not wrapped
+    in an extra task group and ``Request``/``Response`` objects are not
+    allocated only to read and write headers.
     """
 
+    __app: ASGIApp
     __propagator: ITracePropagator
 
     def __init__(
         self,
         app: ASGIApp,
-        dispatch: DispatchFunction | None = None,
         *,
         propagator: ITracePropagator,
     ) -> None:
@@ -40,32 +38,41 @@ class TracingMiddleware(BaseHTTPMiddleware):
 
         Args:
             app: The ASGI application.
-            dispatch: Optional custom dispatch function.
             propagator: Trace context propagator for extract/inject.
         """
-        super().__init__(app, dispatch)
+        self.__app = app
         self.__propagator = propagator
 
-    async def dispatch(self, request: Request, call_next: Next) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Extract trace context, process request, and inject into response.
 
-        Args:
-            request: The incoming HTTP request.
-            call_next: Function to call the next middleware or route handler.
+        Non-HTTP scopes (``websocket``, ``lifespan``) are passed through
+        unchanged.
 
-        Returns:
-            The HTTP response with trace context headers injected.
+        Args:
+            scope: The ASGI connection scope.
+            receive: The ASGI receive channel.
+            send: The ASGI send channel.
         """
-        carrier: dict[str, str] = dict(request.headers)
+        if scope["type"] != "http":
+            await self.__app(scope, receive, send)
+            return
+
+        carrier: dict[str, str] = dict(Headers(scope=scope))
         parent = self.__propagator.extract(carrier)
         ctx = parent.child() if parent is not None else TraceContext.new_root()
         TraceContext.set(ctx)
+
+        async def send_with_trace_context(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                response_carrier: dict[str, str] = {}
+                self.__propagator.inject(response_carrier)
+                headers = MutableHeaders(scope=message)
+                for key, value in response_carrier.items():
+                    headers[key] = value
+            await send(message)
+
         try:
-            response = await call_next(request)
-            response_carrier: dict[str, str] = {}
-            self.__propagator.inject(response_carrier)
-            for key, value in response_carrier.items():
-                response.headers[key] = value
-            return response
+            await self.__app(scope, receive, send_with_trace_context)
         finally:
             TraceContext.clear()
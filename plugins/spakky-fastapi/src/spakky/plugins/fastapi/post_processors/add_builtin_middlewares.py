@@ -1,8 +1,8 @@
 """Post-processor for adding built-in middleware to FastAPI applications.
 
-Automatically injects error handling and context management middleware
-into FastAPI instances registered in the container.  When the tracing
-plugin is loaded, tracing middleware is also added.
+Automatically injects error handling, response compression and context
+management middleware into FastAPI instances registered in the container.
+When the tracing plugin is loaded, tracing middleware is also added.
 """
 
 from spakky.core.pod.annotations.order import Order
@@ -16,6 +16,8 @@ from spakky.tracing.propagator import ITracePropagator
 from typing import override
 
 from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
+from spakky.plugins.fastapi.compression import FastAPICompressionConfig
 from spakky.plugins.fastapi.middlewares.error_handling import ErrorHandlingMiddleware
 from spakky.plugins.fastapi.middlewares.tracing import TracingMiddleware
 
@@ -25,8 +27,9 @@ from spakky.plugins.fastapi.middlewares.tracing import TracingMiddleware
 class AddBuiltInMiddlewaresPostProcessor(IPostProcessor, IApplicationContextAware):
     """Post-processor that adds built-in middleware to FastAPI instances.
 
-    Injects error handling and tracing middleware into any FastAPI instance
-    created as a Pod.  Tracing middleware is only added when the tracing
+    Injects error handling, GZip compression and tracing middleware into any
+    FastAPI instance created as a Pod.  Compression can be tuned or disabled
+    through ``FastAPICompressionConfig``.  Tracing middleware is only added when the tracing
     plugin is loaded.  Runs early in the post-processor chain (Order 0).
     """
 
@@ -45,12 +48,13 @@ class AddBuiltInMiddlewaresPostProcessor(IPostProcessor, IApplicationContextAwar
     def post_process(self, pod: object) -> object:
         """Add built-in middleware to FastAPI instances.
 
-        If the Pod is a FastAPI instance, adds error handling middleware and
-        optionally tracing middleware.  Non-FastAPI Pods are returned unchanged.
+        If the Pod is a FastAPI instance, adds error handling middleware,
+        GZip compression middleware and optionally tracing middleware.  Non-FastAPI Pods are returned unchanged.
 
         Middleware execution order (outermost first):
         1. ``TracingMiddleware`` — extract/inject W3C Trace Context
-        2. ``ErrorHandlingMiddleware`` — catch exceptions → JSON responses
+        2. ``GZipMiddleware`` — compress large bodies, error responses included
+        3. ``ErrorHandlingMiddleware`` — catch exceptions → JSON responses
 
         ``add_middleware`` prepends, so the last added middleware executes first.
 
@@ -68,6 +72,16 @@ class AddBuiltInMiddlewaresPostProcessor(IPostProcessor, IApplicationContextAwar
             debug=pod.debug,
         )
 
+        compression = self.__application_context.get_or_none(FastAPICompressionConfig)
+        if compression is None:
+            compression = FastAPICompressionConfig()
+        if compression.enabled:
+            pod.add_middleware(
+                GZipMiddleware,
+                minimum_size=compression.minimum_size,
+                compresslevel=compression.compress_level,
+            )
+
         propagator = self.__application_context.get_or_none(ITracePropagator)
         if propagator is not None:
             pod.add_middleware(
@@ -4,13 +4,15 @@ Automatically discovers and registers routes from @ApiController decorated
 classes, creating FastAPI endpoints with proper dependency injection.
 """
 
-from dataclasses import asdict
-from functools import wraps
-from inspect import getmembers, isawaitable, signature
+from dataclasses import fields
+from enum import Enum
+from functools import lru_cache, partial
+from inspect import Signature, get_annotations, isawaitable
 from logging import getLogger
-from typing import Any
+from typing import Any, get_type_hints
 
 from spakky.auth import AbstractSpakkyAuthError
+from spakky.core.common.types import Func
 from spakky.core.pod.annotations.order import Order
 from spakky.core.pod.annotations.pod import Pod
 from spakky.core.pod.interfaces.application_context import IApplicationContext
@@ -22,7 +24,7 @@ from spakky.core.pod.interfaces.container import IContainer
 from spakky.core.pod.interfaces.post_processor import IPostProcessor
 from typing import override
 
-from fastapi import APIRouter, FastAPI
+from fastapi import FastAPI, Response
 from fastapi.exceptions import FastAPIError
 from fastapi.utils import (
     create_model_field,  # type: ignore[import-untyped] - fastapi.utils 내부 모듈, 타입 스텁 미제공
@@ -32,12 +34,48 @@ from spakky.plugins.fastapi.auth import (
     WEBSOCKET_AUTH_PARAMETER,
     FastAPIAuthBoundary,
 )
+from spakky.plugins.fastapi.error import InvalidControllerPrefixError
 from spakky.plugins.fastapi.routes.route import Route
 from spakky.plugins.fastapi.routes.websocket import WebSocketRoute
 from spakky.plugins.fastapi.stereotypes.api_controller import ApiController
 
 logger = getLogger(__name__)
 
+_RESPONSE_MODEL_CACHE_SIZE = 512
+_ROUTE_FIELD_NAMES: tuple[str, ...] = tuple(field.name for field in fields(Route))
+_WEBSOCKET_ROUTE_FIELD_NAMES: tuple[str, ...] = tuple(
+    field.name for field in fields(WebSocketRoute)
+)
+
+
+@lru_cache(maxsize=_RESPONSE_MODEL_CACHE_SIZE)
+def _is_valid_response_model(annotation: object) -> bool:
+    try:
+        create_model_field("", annotation)
+    except FastAPIError:
+        return False
+    return True
+
+
+def _is_response_model(annotation: object) -> bool:
+    # Controllers commonly return the same DTO from many handlers, so the
+    # throwaway ModelField built for validation is memoized per annotation.
+    try:
+        return _is_valid_response_model(annotation)
+    except TypeError:
+        # Unhashable annotations (e.g. Annotated with dict metadata)
+        return _is_valid_response_model.__wrapped__(annotation)
+
+
+def _is_response_class(annotation: object) -> bool:
+    # Handlers returning a Response are sent as-is by FastAPI, so there is
+    # no response model to infer for them.
+    return isinstance(annotation, type) and issubclass(annotation, Response)
+
+
+def _humanize_route_name(name: str) -> str:
+    return " ".join(word.capitalize() for word in name.split("_"))
+
 
 async def _resolve_route_result(result: Any) -> Any:
     if isawaitable(result):
@@ -45,6 +83,79 @@ async def _resolve_route_result(result: Any) -> Any:
     return result
 
 
+async def _dispatch_http(
+    controller_type: type[object],
+    method_name: str,
+    container: IContainer,
+    application_context: IApplicationContext,
+    *args: Any,
+    **kwargs: Any,
+) -> Any:
+    # Reset context so request-scoped Pods do not leak between
+    # consecutive FastAPI requests processed on the same worker.
+    application_context.clear_context()
+    auth_request = kwargs.pop(HTTP_AUTH_REQUEST_PARAMETER)
+    controller_instance = container.get(controller_type)
+    method_to_call = getattr(  # route decorator method lookup
+        controller_instance, method_name
+    )  # 프레임워크 내부: 컨트롤러 메서드 동적 디스패치
+    auth_boundary = FastAPIAuthBoundary(container, application_context)
+    try:
+        auth_boundary.seed_http_auth_context(auth_request, method_to_call)
+        for request_name in auth_boundary.request_argument_names(method_to_call):
+            kwargs[request_name] = auth_request
+        return await _resolve_route_result(method_to_call(*args, **kwargs))
+    except AbstractSpakkyAuthError as e:
+        auth_boundary.map_http_auth_error(e)
+
+
+async def _dispatch_websocket(
+    controller_type: type[object],
+    method_name: str,
+    container: IContainer,
+    application_context: IApplicationContext,
+    *args: Any,
+    **kwargs: Any,
+) -> Any:
+    # WebSocket sessions reuse the same event loop task, so we
+    # clear the context to guarantee per-connection isolation.
+    application_context.clear_context()
+    websocket = kwargs.pop(WEBSOCKET_AUTH_PARAMETER)
+    controller_instance = container.get(controller_type)
+    method_to_call = getattr(  # websocket decorator method lookup
+        controller_instance, method_name
+    )  # 프레임워크 내부: 컨트롤러 메서드 동적 디스패치
+    auth_boundary = FastAPIAuthBoundary(container, application_context)
+    try:
+        auth_boundary.seed_websocket_auth_context(websocket, method_to_call)
+        for websocket_name in auth_boundary.websocket_argument_names(method_to_call):
+            kwargs[websocket_name] = websocket
+        return await _resolve_route_result(method_to_call(*args, **kwargs))
+    except AbstractSpakkyAuthError as e:
+        await auth_boundary.close_websocket_for_auth_error(websocket, e)
+        return None
+
+
+def _bind_endpoint(
+    dispatcher: Func,
+    method: Func,
+    endpoint_signature: Signature,
+    *bound_args: object,
+) -> Func:
+    # Bind the shared dispatcher instead of defining a closure per route, and
+    # copy only the attributes FastAPI reads: name/doc for OpenAPI, the
+    # signature for dependency analysis and __wrapped__ for annotation globals.
+    endpoint = partial(dispatcher, *bound_args)
+    endpoint.__dict__.update(
+        __name__=method.__name__,
+        __qualname__=method.__qualname__,
+        __doc__=method.__doc__,
+        __wrapped__=method,
+        __signature__=endpoint_signature,
+    )
+    return endpoint
+
+
 @Order(0)
 @Pod()
 class RegisterRoutesPostProcessor(
@@ -59,6 +170,11 @@ class RegisterRoutesPostProcessor(
 
     __container: IContainer
     __application_context: IApplicationContext
+    __fast_api: FastAPI | None
+
+    def __init__(self) -> None:
+        """Initialize the post-processor with no FastAPI instance resolved yet."""
+        self.__fast_api = None
 
     @override
     def set_container(self, container: IContainer) -> None:
@@ -78,6 +194,47 @@ class RegisterRoutesPostProcessor(
         """
         self.__application_context = application_context
 
+    @staticmethod
+    def __get_route_methods(
+        pod: object,
+    ) -> list[tuple[str, Func, Route | None, WebSocketRoute | None]]:
+        """Collect route-annotated methods of a controller.
+
+        Walks the class dictionaries along the MRO instead of calling
+        ``inspect.getmembers``, so only annotated functions are resolved
+        through ``getattr`` and unrelated descriptors are never triggered.
+        Dunder members are skipped without checking them for HTTP or
+        WebSocket route annotations, and every other member has its route
+        annotations read once here so registration does not look them up again.
+        Results are sorted by name to keep the registration order stable.
+
+        Args:
+            pod: The controller instance to scan.
+
+        Returns:
+            Attribute name, bound method, HTTP route and WebSocket route for
+            each route handler.
+        """
+        seen: set[str] = set()
+        routes: dict[str, tuple[Route | None, WebSocketRoute | None]] = {}
+        for klass in type(pod).__mro__:
+            for name, member in vars(klass).items():
+                if name in seen or name.startswith("__"):
+                    continue
+                seen.add(name)
+                route = Route.get_or_none(member)
+                websocket_route = WebSocketRoute.get_or_none(member)
+                if route is not None or websocket_route is not None:
+                    routes[name] = (route, websocket_route)
+        return [
+            (
+                name,
+                getattr(pod, name),  # 프레임워크 내부: proxy를 거친 바운드 메서드 조회
+                *routes[name],
+            )
+            for name in sorted(routes)
+        ]
+
     @override
     def post_process(self, pod: object) -> object:
         """Register routes from API controllers.
@@ -95,133 +252,117 @@ class RegisterRoutesPostProcessor(
         if not ApiController.exists(pod):
             return pod
 
-        fast_api = self.__container.get(FastAPI)
+        # Routes are added straight to the application's router with the
+        # controller prefix and tags applied here. Building an intermediate
+        # APIRouter and including it would analyze every endpoint twice.
+        if self.__fast_api is None:
+            self.__fast_api = self.__container.get(FastAPI)
+        router = self.__fast_api.router
         controller = ApiController.get(pod)
-        router: APIRouter = APIRouter(prefix=controller.prefix, tags=controller.tags)
-        for name, method in getmembers(pod, callable):
-            route: Route | None = Route.get_or_none(method)
-            websocket_route: WebSocketRoute | None = WebSocketRoute.get_or_none(method)
-            if route is None and websocket_route is None:
-                continue
-
+        # The same prefix rules APIRouter enforced before routes were added
+        # to the application router directly.
+        if controller.prefix and (
+            not controller.prefix.startswith("/") or controller.prefix.endswith("/")
+        ):
+            raise InvalidControllerPrefixError(controller.prefix)
+        controller_tags: list[str | Enum] = list(controller.tags or [])
+        for name, method, route, websocket_route in self.__get_route_methods(pod):
             if route is not None:
-                # pylint: disable=line-too-long
                 logger.debug(
-                    f"{route.methods!r} {controller.prefix}{route.path} -> {method.__qualname__}"
+                    "%r %s%s -> %s",
+                    route.methods,
+                    controller.prefix,
+                    route.path,
+                    method.__qualname__,
                 )
                 if route.name is None:
-                    route.name = " ".join([x.capitalize() for x in name.split("_")])
+                    route.name = _humanize_route_name(name)
                 if route.description is None:
                     route.description = method.__doc__
                 if route.response_model is None:
-                    return_annotation: type | None = signature(method).return_annotation
-                    if return_annotation is not None:
+                    return_annotation: type | str | None = get_annotations(method).get(
+                        "return"
+                    )
+                    if isinstance(return_annotation, str):
                         try:
-                            create_model_field("", return_annotation)
+                            return_annotation = get_type_hints(method).get("return")
+                        except (NameError, TypeError):
+                            # e.g. a return type imported only under TYPE_CHECKING
+                            logger.debug(
+                                "Failed to resolve return annotation for %s",
+                                method.__qualname__,
+                            )
+                            return_annotation = None
+                    if return_annotation is not None and not _is_response_class(
+                        return_annotation
+                    ):
+                        if _is_response_model(return_annotation):
                             route.response_model = return_annotation
-                        except FastAPIError as e:
+                        else:
                             logger.debug(
-                                f"Failed to infer response model for {method.__qualname__}: {type(e).__name__}"
+                                "Failed to infer response model for %s",
+                                method.__qualname__,
                             )
 
-                @wraps(method)
-                async def endpoint(
-                    *args: Any,
-                    method_name: str = name,
-                    controller_type: type[object] = controller.type_,
-                    context: IContainer = self.__container,
-                    **kwargs: Any,
-                ) -> Any:
-                    # Reset context so request-scoped Pods do not leak between
-                    # consecutive FastAPI requests processed on the same worker.
-                    self.__application_context.clear_context()
-                    auth_request = kwargs.pop(HTTP_AUTH_REQUEST_PARAMETER)
-                    controller_instance = context.get(controller_type)
-                    method_to_call = getattr(  # route decorator method lookup
-                        controller_instance, method_name
-                    )  # 프레임워크 내부: 컨트롤러 메서드 동적 디스패치
-                    auth_boundary = FastAPIAuthBoundary(
-                        context,
-                        self.__application_context,
-                    )
-                    try:
-                        auth_boundary.seed_http_auth_context(
-                            auth_request,
-                            method_to_call,
-                        )
-                        for request_name in auth_boundary.request_argument_names(
-                            method_to_call
-                        ):
-                            kwargs[request_name] = auth_request
-                        return await _resolve_route_result(
-                            method_to_call(*args, **kwargs)
-                        )
-                    except AbstractSpakkyAuthError as e:
-                        auth_boundary.map_http_auth_error(e)
-
                 auth_boundary = FastAPIAuthBoundary(
                     self.__container,
                     self.__application_context,
                 )
-                endpoint.__dict__["__signature__"] = (
-                    auth_boundary.signature_with_request(method)
+                route_fields: dict[str, Any] = {  # Any: Route 필드별 타입이 상이함
+                    field_name: getattr(  # dataclass 필드 얕은 복사
+                        route, field_name
+                    )
+                    for field_name in _ROUTE_FIELD_NAMES
+                }
+                route_fields["path"] = controller.prefix + route.path
+                route_fields["tags"] = controller_tags + (route.tags or [])
+                router.add_api_route(
+                    endpoint=_bind_endpoint(
+                        _dispatch_http,
+                        method,
+                        auth_boundary.signature_with_request(method),
+                        controller.type_,
+                        name,
+                        self.__container,
+                        self.__application_context,
+                    ),
+                    **route_fields,
                 )
-                router.add_api_route(endpoint=endpoint, **asdict(route))
             if websocket_route is not None:
-                # pylint: disable=line-too-long
                 logger.debug(
-                    f"[WebSocket] {controller.prefix}{websocket_route.path} -> {method.__qualname__}"
+                    "[WebSocket] %s%s -> %s",
+                    controller.prefix,
+                    websocket_route.path,
+                    method.__qualname__,
                 )
                 if websocket_route.name is None:
-                    websocket_route.name = " ".join(
-                        [x.capitalize() for x in name.split("_")]
-                    )
-
-                @wraps(method)
-                async def websocket_endpoint(
-                    *args: Any,
-                    method_name: str = name,
-                    controller_type: type[object] = controller.type_,
-                    context: IContainer = self.__container,
-                    **kwargs: Any,
-                ) -> Any:
-                    # WebSocket sessions reuse the same event loop task, so we
-                    # clear the context to guarantee per-connection isolation.
-                    self.__application_context.clear_context()
-                    websocket = kwargs.pop(WEBSOCKET_AUTH_PARAMETER)
-                    controller_instance = context.get(controller_type)
-                    method_to_call = getattr(  # websocket decorator method lookup
-                        controller_instance, method_name
-                    )  # 프레임워크 내부: 컨트롤러 메서드 동적 디스패치
-                    auth_boundary = FastAPIAuthBoundary(
-                        context,
-                        self.__application_context,
-                    )
-                    try:
-                        auth_boundary.seed_websocket_auth_context(
-                            websocket,
-                            method_to_call,
-                        )
-                        for websocket_name in auth_boundary.websocket_argument_names(
-                            method_to_call
-                        ):
-                            kwargs[websocket_name] = websocket
-                        return await _resolve_route_result(
-                            method_to_call(*args, **kwargs)
-                        )
-                    except AbstractSpakkyAuthError as e:
-                        await auth_boundary.close_websocket_for_auth_error(websocket, e)
-                        return None
+                    websocket_route.name = _humanize_route_name(name)
 
                 auth_boundary = FastAPIAuthBoundary(
                     self.__container,
                     self.__application_context,
                 )
-                websocket_endpoint.__dict__["__signature__"] = (
-                    auth_boundary.signature_with_websocket(method)
+                websocket_route_fields: dict[
+                    str, Any
+                ] = {  # Any: WebSocketRoute 필드별 타입이 상이함
+                    field_name: getattr(  # dataclass 필드 얕은 복사
+                        websocket_route, field_name
+                    )
+                    for field_name in _WEBSOCKET_ROUTE_FIELD_NAMES
+                }
+                websocket_route_fields["path"] = (
+                    controller.prefix + websocket_route.path
                 )
                 router.add_api_websocket_route(
-                    endpoint=websocket_endpoint, **asdict(websocket_route)
+                    endpoint=_bind_endpoint(
+                        _dispatch_websocket,
+                        method,
+                        auth_boundary.signature_with_websocket(method),
+                        controller.type_,
+                        name,
+                        self.__container,
+                        self.__application_context,
+                    ),
+                    **websocket_route_fields,
                 )
-        fast_api.include_router(router)
         return pod
@@ -0,0 +1,46 @@
+"""Response classes for FastAPI integration.
+
+Provides an orjson-backed JSON response used as the default response class
+for routes registered from ``@ApiController`` classes.
+"""
+
+from typing import Any, override
+
+import orjson
+
+from fastapi.responses import JSONResponse
+
+ORJSON_OPTIONS = (
+    orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+)
+"""orjson option flags used by ``ORJSONResponse``.
+
+Naive datetimes are rendered as UTC, numpy arrays are serialized natively
+and non-string dictionary keys are allowed, so content that did not go
+through ``jsonable_encoder`` can be rendered without a ``default`` callback.
+"""
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response that renders content with ``orjson``.
+
+    FastAPI's own ``ORJSONResponse`` is deprecated, so the plugin ships its
+    own variant.  Routes without a response model go through
+    ``jsonable_encoder`` first, so the content is already JSON-compatible
+    when it reaches ``render``.
+    """
+
+    @override
+    def render(
+        self,
+        content: Any,  # Any: JSONResponse.render accepts arbitrary encoded content
+    ) -> bytes:
+        """Serialize content to JSON bytes.
+
+        Args:
+            content: The JSON-compatible content to serialize.
+
+        Returns:
+            The UTF-8 encoded JSON body.
+        """
+        return orjson.dumps(content, option=ORJSON_OPTIONS)
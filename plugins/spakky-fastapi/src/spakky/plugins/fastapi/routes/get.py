@@ -10,8 +10,9 @@ from collections.abc import Callable, Sequence
 from starlette.routing import Route as StarletteRoute
 
 from fastapi import Response, params
-from fastapi.responses import JSONResponse
+from fastapi.datastructures import Default
 from fastapi.routing import APIRoute
+from spakky.plugins.fastapi.responses import ORJSONResponse
 from spakky.plugins.fastapi.routes.route import (
     DictIntStrAny,
     HTTPMethod,
@@ -39,7 +40,7 @@ def get[T](
     response_model_exclude_defaults: bool = False,
     response_model_exclude_none: bool = False,
     include_in_schema: bool = True,
-    response_class: type[Response] = JSONResponse,
+    response_class: type[Response] = Default(ORJSONResponse),
     name: str | None = None,
     route_class_override: type[APIRoute] | None = None,
     callbacks: list[StarletteRoute] | None = None,
@@ -69,7 +70,8 @@ def get[T](
         response_model_exclude_defaults: Exclude fields with default values.
         response_model_exclude_none: Exclude None values from response.
         include_in_schema: Include in OpenAPI schema.
-        response_class: FastAPI response class to use.
+        response_class: FastAPI response class to use. Defaults to
+            ``ORJSONResponse``.
         name: Display name for the route.
         route_class_override: Custom APIRoute class.
         callbacks: OpenAPI callbacks configuration.
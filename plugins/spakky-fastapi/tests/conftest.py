@@ -1,7 +1,7 @@
 import logging
 from logging import Formatter, StreamHandler, getLogger
 from typing import Any, override
-from collections.abc import AsyncGenerator, Generator
+from collections.abc import Generator
 
 import pytest
 from fastapi import FastAPI
@@ -46,8 +46,8 @@ def get_name_fixture() -> Generator[str, Any, None]:
     yield name
 
 
-@pytest.fixture(name="app", scope="function")
-async def get_app_fixture(name: str) -> AsyncGenerator[SpakkyApplication, Any]:
+@pytest.fixture(scope="package", autouse=True)
+def debug_logger_fixture() -> Generator[None, Any, None]:
     logger = getLogger("debug")
     logger.setLevel(logging.DEBUG)
     console = StreamHandler()
@@ -55,6 +55,13 @@ async def get_app_fixture(name: str) -> AsyncGenerator[SpakkyApplication, Any]:
     console.setFormatter(Formatter("[%(levelname)s][%(asctime)s]: %(message)s"))
     logger.addHandler(console)
 
+    yield
+
+    logger.removeHandler(console)
+
+
+@pytest.fixture(name="app", scope="function")
+def get_app_fixture(name: str) -> Generator[SpakkyApplication, Any, None]:
     @Pod(name="key")
     def get_name() -> str:
         return name
@@ -79,13 +86,11 @@ async def get_app_fixture(name: str) -> AsyncGenerator[SpakkyApplication, Any]:
 
     yield app
 
-    logger.removeHandler(console)
-
 
 @pytest.fixture(name="api_without_auth_provider", scope="function")
-async def get_api_without_auth_provider_fixture(
+def get_api_without_auth_provider_fixture(
     name: str,
-) -> AsyncGenerator[FastAPI, Any]:
+) -> Generator[FastAPI, Any, None]:
     @Pod(name="key")
     def get_name() -> str:
         return name
@@ -111,5 +116,5 @@ async def get_api_without_auth_provider_fixture(
 
 
 @pytest.fixture(name="api", scope="function")
-async def get_api_fixture(app: SpakkyApplication) -> AsyncGenerator[FastAPI, Any]:
+def get_api_fixture(app: SpakkyApplication) -> Generator[FastAPI, Any, None]:
     yield app.container.get(type_=FastAPI)
@@ -0,0 +1,67 @@
+"""GZip 응답 압축 middleware 등록 테스트."""
+
+from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import PlainTextResponse
+from fastapi.testclient import TestClient
+from pytest import MonkeyPatch
+from spakky.core.application.application_context import ApplicationContext
+
+from spakky.plugins.fastapi.compression import (
+    DEFAULT_COMPRESSION_LEVEL,
+    DEFAULT_COMPRESSION_MINIMUM_SIZE,
+)
+from spakky.plugins.fastapi.post_processors.add_builtin_middlewares import (
+    AddBuiltInMiddlewaresPostProcessor,
+)
+
+
+def _process(api: FastAPI) -> FastAPI:
+    """빈 ApplicationContext로 built-in middleware를 추가한다."""
+    processor = AddBuiltInMiddlewaresPostProcessor()
+    processor.set_application_context(ApplicationContext())
+    processor.post_process(api)
+    return api
+
+
+def test_builtin_middlewares_default_compression_expect_gzip_for_large_body() -> None:
+    """기본 설정에서 최소 크기 이상의 응답만 gzip으로 압축됨을 검증한다."""
+    api = _process(FastAPI())
+
+    @api.get("/large", response_class=PlainTextResponse)
+    async def large() -> str:
+        return "a" * DEFAULT_COMPRESSION_MINIMUM_SIZE
+
+    @api.get("/small", response_class=PlainTextResponse)
+    async def small() -> str:
+        return "a"
+
+    gzip = next(
+        middleware
+        for middleware in api.user_middleware
+        if middleware.cls is GZipMiddleware
+    )
+    assert gzip.kwargs == {
+        "minimum_size": DEFAULT_COMPRESSION_MINIMUM_SIZE,
+        "compresslevel": DEFAULT_COMPRESSION_LEVEL,
+    }
+    with TestClient(api) as client:
+        large_response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+        small_response = client.get("/small", headers={"Accept-Encoding": "gzip"})
+
+    assert large_response.headers["content-encoding"] == "gzip"
+    assert large_response.text == "a" * DEFAULT_COMPRESSION_MINIMUM_SIZE
+    assert "content-encoding" not in small_response.headers
+
+
+def test_builtin_middlewares_compression_disabled_expect_no_gzip_middleware(
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """SPAKKY_FASTAPI_COMPRESSION_ENABLED=false이면 GZip middleware가 추가되지 않음을 검증한다."""
+    monkeypatch.setenv("SPAKKY_FASTAPI_COMPRESSION_ENABLED", "false")
+
+    api = _process(FastAPI())
+
+    assert all(
+        middleware.cls is not GZipMiddleware for middleware in api.user_middleware
+    )
@@ -0,0 +1,134 @@
+"""AbstractSpakkyFastAPIError 응답 변환 테스트."""
+
+from http import HTTPStatus
+
+import orjson
+import pytest
+from fastapi import Response
+
+from spakky.plugins.fastapi.error import (
+    AbstractSpakkyFastAPIError,
+    BadRequest,
+    Conflict,
+    Forbidden,
+    InternalServerError,
+    NotFound,
+    Unauthorized,
+)
+
+
+class InvalidPayload(BadRequest):
+    """BadRequest를 상속하면서 메시지만 바꾼 사용자 정의 에러."""
+
+    message = "Invalid Payload"
+
+
+@pytest.mark.parametrize(
+    ("error_class", "expected_status"),
+    [
+        (BadRequest, HTTPStatus.BAD_REQUEST),
+        (Unauthorized, HTTPStatus.UNAUTHORIZED),
+        (Forbidden, HTTPStatus.FORBIDDEN),
+        (NotFound, HTTPStatus.NOT_FOUND),
+        (Conflict, HTTPStatus.CONFLICT),
+        (InternalServerError, HTTPStatus.INTERNAL_SERVER_ERROR),
+    ],
+)
+def test_concrete_error_status_code_expect_plain_int(
+    error_class: type[AbstractSpakkyFastAPIError],
+    expected_status: HTTPStatus,
+) -> None:
+    """각 HTTP 에러 클래스가 올바른 상태 코드를 정수 클래스 변수로 가짐을 검증한다."""
+    assert type(error_class.status_code) is int
+    assert error_class.status_code == expected_status
+    assert error_class().to_response().status_code == expected_status
+
+
+def test_to_response_without_args_expect_cached_default_body() -> None:
+    """인자 없는 에러는 클래스별로 미리 직렬화된 동일한 body를 재사용함을 검증한다."""
+    first = NotFound().to_response()
+    second = NotFound().to_response()
+
+    assert first.status_code == HTTPStatus.NOT_FOUND
+    assert first.media_type == "application/json"
+    assert orjson.loads(first.body) == {
+        "message": "Not Found",
+        "args": [],
+        "traceback": None,
+    }
+    assert second.body is first.body
+
+
+def test_to_response_subclass_without_args_expect_own_message() -> None:
+    """하위 클래스는 상위 클래스의 캐시된 body가 아닌 자신의 메시지로 응답함을 검증한다."""
+    BadRequest().to_response()
+
+    response = InvalidPayload().to_response()
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert orjson.loads(response.body)["message"] == "Invalid Payload"
+
+
+def test_to_response_with_message_as_only_arg_expect_empty_args() -> None:
+    """메시지와 같은 단일 인자는 중복으로 보고 빈 args로 응답함을 검증한다."""
+    response = NotFound(NotFound.message).to_response()
+
+    assert orjson.loads(response.body)["args"] == []
+    assert response.body is NotFound().to_response().body
+
+
+def test_to_response_with_args_expect_args_in_body() -> None:
+    """인자가 있는 에러는 캐시를 거치지 않고 인자를 문자열로 포함함을 검증한다."""
+    response = BadRequest("Invalid email", 42).to_response()
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert orjson.loads(response.body) == {
+        "message": "Bad Request",
+        "args": ["Invalid email", "42"],
+        "traceback": None,
+    }
+
+
+def test_to_response_show_traceback_expect_structured_frames() -> None:
+    """show_traceback 시 처리 중인 예외의 프레임이 file/line/name 구조로 포함됨을 검증한다."""
+
+    def fail() -> None:
+        raise NotFound()
+
+    response: Response | None = None
+    try:
+        fail()
+    except NotFound as e:
+        response = e.to_response(show_traceback=True)
+
+    assert response is not None
+    frames = orjson.loads(response.body)["traceback"]
+    assert frames[-1]["name"] == "fail"
+    assert frames[-1]["file"] == __file__
+    assert isinstance(frames[-1]["line"], int)
+
+
+def test_to_response_show_traceback_while_handling_other_error_expect_its_frames() -> (
+    None
+):
+    """다른 예외 처리 중 생성된 에러는 처리 중인 원본 예외의 프레임을 포함함을 검증한다."""
+
+    def explode() -> None:
+        raise ValueError("boom")
+
+    response: Response | None = None
+    try:
+        explode()
+    except ValueError:
+        response = InternalServerError().to_response(show_traceback=True)
+
+    assert response is not None
+    frames = orjson.loads(response.body)["traceback"]
+    assert frames[-1]["name"] == "explode"
+
+
+def test_to_response_show_traceback_outside_handler_expect_empty_frames() -> None:
+    """처리 중인 예외도 없고 raise되지 않은 에러는 빈 traceback 목록을 반환함을 검증한다."""
+    response = NotFound().to_response(show_traceback=True)
+
+    assert orjson.loads(response.body)["traceback"] == []
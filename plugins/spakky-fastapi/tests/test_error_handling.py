@@ -1,17 +1,18 @@
+from collections.abc import AsyncGenerator
+
+import pytest
+from fastapi.responses import StreamingResponse
 from fastapi.testclient import TestClient
+from spakky.plugins.fastapi.error import NotFound
 from spakky.plugins.fastapi.middlewares.error_handling import ErrorHandlingMiddleware
-from starlette.middleware.base import BaseHTTPMiddleware
 
-from fastapi import FastAPI
+from fastapi import FastAPI, WebSocket
 
 
 def test_error_handling_middleware_debug_mode() -> None:
     """ErrorHandlingMiddleware가 debug 모드에서 traceback을 출력함을 검증한다."""
     api = FastAPI()
-
-    # Add middleware with debug=True
-    middleware = ErrorHandlingMiddleware(api, debug=True)
-    api.add_middleware(BaseHTTPMiddleware, dispatch=middleware.dispatch)
+    api.add_middleware(ErrorHandlingMiddleware, debug=True)
 
     @api.get("/error")
     async def error_endpoint() -> None:
@@ -21,15 +22,13 @@ def test_error_handling_middleware_debug_mode() -> None:
         response = client.get("/error")
         assert response.status_code == 500
         assert "message" in response.json()
+        assert response.json()["traceback"]
 
 
 def test_error_handling_middleware_no_debug() -> None:
     """ErrorHandlingMiddleware가 debug 모드가 아닐 때 traceback을 출력하지 않음을 검증한다."""
     api = FastAPI()
-
-    # Add middleware with debug=False
-    middleware = ErrorHandlingMiddleware(api, debug=False)
-    api.add_middleware(BaseHTTPMiddleware, dispatch=middleware.dispatch)
+    api.add_middleware(ErrorHandlingMiddleware, debug=False)
 
     @api.get("/error")
     async def error_endpoint() -> None:
@@ -39,3 +38,54 @@ def test_error_handling_middleware_no_debug() -> None:
         response = client.get("/error")
         assert response.status_code == 500
         assert "message" in response.json()
+        assert response.json()["traceback"] is None
+
+
+def test_error_handling_middleware_spakky_error_expect_error_response() -> None:
+    """Spakky FastAPI 에러는 해당 에러의 상태 코드와 메시지로 응답함을 검증한다."""
+    api = FastAPI()
+    api.add_middleware(ErrorHandlingMiddleware)
+
+    @api.get("/missing")
+    async def missing_endpoint() -> None:
+        raise NotFound()
+
+    with TestClient(api) as client:
+        response = client.get("/missing")
+        assert response.status_code == 404
+        assert response.json()["message"] == "Not Found"
+
+
+@pytest.mark.parametrize("error", [NotFound(), ValueError("Test error")])
+def test_error_handling_middleware_error_after_response_start_expect_reraised(
+    error: Exception,
+) -> None:
+    """응답 시작 이후 발생한 예외는 새 응답을 보내지 않고 다시 전파됨을 검증한다."""
+    api = FastAPI()
+    api.add_middleware(ErrorHandlingMiddleware)
+
+    @api.get("/stream")
+    async def stream_endpoint() -> StreamingResponse:
+        async def chunks() -> AsyncGenerator[bytes, None]:
+            yield b"partial"
+            raise error
+
+        return StreamingResponse(chunks())
+
+    with TestClient(api) as client, pytest.raises(type(error)):
+        client.get("/stream")
+
+
+def test_error_handling_middleware_websocket_scope_expect_passthrough() -> None:
+    """WebSocket 연결은 ErrorHandlingMiddleware를 그대로 통과함을 검증한다."""
+    api = FastAPI()
+    api.add_middleware(ErrorHandlingMiddleware)
+
+    @api.websocket("/ws")
+    async def websocket_endpoint(websocket: WebSocket) -> None:
+        await websocket.accept()
+        await websocket.send_text("ok")
+        await websocket.close()
+
+    with TestClient(api) as client, client.websocket_connect("/ws") as websocket:
+        assert websocket.receive_text() == "ok"
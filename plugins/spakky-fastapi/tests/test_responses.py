@@ -0,0 +1,59 @@
+"""ORJSONResponse 단위 및 라우팅 통합 테스트."""
+
+from datetime import datetime
+from http import HTTPStatus
+
+from fastapi import FastAPI
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+
+from spakky.plugins.fastapi.responses import ORJSONResponse
+
+
+def test_orjson_response_render_expect_compact_json_bytes() -> None:
+    """ORJSONResponse가 orjson으로 공백 없는 JSON 바이트를 생성함을 검증한다."""
+    response = ORJSONResponse({"name": "John", "tags": ["a", "b"]})
+
+    assert response.body == b'{"name":"John","tags":["a","b"]}'
+    assert response.media_type == "application/json"
+
+
+def test_orjson_response_render_non_str_keys_expect_stringified_keys() -> None:
+    """문자열이 아닌 dict 키도 JSON 문자열 키로 직렬화됨을 검증한다."""
+    response = ORJSONResponse({1: "one"})
+
+    assert response.body == b'{"1":"one"}'
+
+
+def test_orjson_response_render_naive_datetime_expect_utc_offset() -> None:
+    """타임존 정보가 없는 datetime이 UTC 오프셋과 함께 직렬화됨을 검증한다."""
+    response = ORJSONResponse({"at": datetime(2024, 1, 2, 3, 4, 5)})
+
+    assert response.body == b'{"at":"2024-01-02T03:04:05+00:00"}'
+
+
+def test_controller_route_default_response_class_expect_orjson_response(
+    api: FastAPI,
+) -> None:
+    """response_class를 지정하지 않은 컨트롤러 라우트가 ORJSONResponse를 기본값으로 사용함을 검증한다."""
+    route = next(
+        route
+        for route in api.routes
+        if isinstance(route, APIRoute) and route.path == "/dummy/sync"
+    )
+
+    assert isinstance(route.response_class, DefaultPlaceholder)
+    assert route.response_class.value is ORJSONResponse
+
+
+def test_controller_route_without_response_model_expect_orjson_body(
+    api: FastAPI,
+) -> None:
+    """응답 모델이 없는 라우트도 ORJSONResponse로 JSON 응답을 반환함을 검증한다."""
+    with TestClient(api) as client:
+        response = client.get("/dummy/verify-email", params={"email": "a@b.c"})
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["content-type"] == "application/json"
+    assert response.content == b"null"
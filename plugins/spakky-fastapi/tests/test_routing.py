@@ -1,13 +1,19 @@
 from http import HTTPStatus
 from inspect import Parameter
+from typing import TYPE_CHECKING, Annotated
+from unittest.mock import Mock
 from uuid import UUID, uuid4
 
 import pytest
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, WebSocket
+from fastapi.responses import FileResponse
+from fastapi.routing import APIRoute, APIWebSocketRoute
 from fastapi.testclient import TestClient
+from pydantic import BaseModel
 from starlette.websockets import WebSocketDisconnect
 from spakky.auth import AbstractSpakkyAuthError
 from spakky.core.application.application_context import ApplicationContext
+from spakky.core.pod.interfaces.container import IContainer
 from spakky.plugins.fastapi.auth import (
     HTTP_AUTH_REQUEST_PARAMETER,
     FastAPIAuthBoundary,
@@ -17,8 +23,17 @@ from spakky.plugins.fastapi.error import (
     BadRequest,
     Forbidden,
     InternalServerError,
+    InvalidControllerPrefixError,
     Unauthorized,
 )
+from spakky.plugins.fastapi.post_processors.register_routes import (
+    RegisterRoutesPostProcessor,
+)
+from spakky.plugins.fastapi.routes import get, websocket
+from spakky.plugins.fastapi.stereotypes.api_controller import ApiController
+
+if TYPE_CHECKING:
+    from decimal import Decimal
 
 
 class FallbackAuthError(AbstractSpakkyAuthError):
@@ -364,3 +379,304 @@ def test_when_unexpected_error_with_debug_mode(api: FastAPI) -> None:
             assert "message" in response.json()
     finally:
         api.debug = original_debug
+
+
+def test_register_routes_inherited_routes_expect_subclass_override_wins() -> None:
+    """상속된 route는 등록되고, 데코레이터 없이 재정의된 메서드는 route에서 제외된다."""
+    api = FastAPI()
+    container = Mock(spec=IContainer)
+    container.get.return_value = api
+    processor = RegisterRoutesPostProcessor()
+    processor.set_container(container)
+    processor.set_application_context(ApplicationContext())
+
+    class BaseController:
+        @get("/inherited")
+        async def inherited(self) -> dict[str, str]:
+            return {"source": "base"}
+
+        @get("/overridden")
+        async def overridden(self) -> dict[str, str]:
+            return {"source": "base"}
+
+    @ApiController("/child")
+    class ChildController(BaseController):
+        async def overridden(self) -> dict[str, str]:
+            return {"source": "child"}
+
+    processor.post_process(ChildController())
+
+    paths = {route.path for route in api.routes if isinstance(route, APIRoute)}
+    assert "/child/inherited" in paths
+    assert "/child/overridden" not in paths
+
+
+def test_register_routes_method_named_like_framework_hook_expect_registered() -> None:
+    """프레임워크 훅과 이름이 같은 메서드도 route 어노테이션이 있으면 등록된다."""
+    api = FastAPI()
+    container = Mock(spec=IContainer)
+    container.get.return_value = api
+    processor = RegisterRoutesPostProcessor()
+    processor.set_container(container)
+    processor.set_application_context(ApplicationContext())
+
+    @ApiController("/hooks")
+    class HookNamedController:
+        @get("/post-process")
+        async def post_process(self) -> dict[str, str]:
+            return {"source": "controller"}
+
+    processor.post_process(HookNamedController())
+
+    paths = {route.path for route in api.routes if isinstance(route, APIRoute)}
+    assert "/hooks/post-process" in paths
+
+
+@pytest.mark.parametrize("prefix", ["x", "/x/"])
+def test_register_routes_invalid_controller_prefix_expect_error(prefix: str) -> None:
+    """'/'로 시작하지 않거나 '/'로 끝나는 컨트롤러 prefix는 route 등록 전에 거부된다."""
+    api = FastAPI()
+    container = Mock(spec=IContainer)
+    container.get.return_value = api
+    processor = RegisterRoutesPostProcessor()
+    processor.set_container(container)
+    processor.set_application_context(ApplicationContext())
+
+    @ApiController(prefix)
+    class InvalidPrefixController:
+        @get("/a")
+        async def get_a(self) -> dict[str, str]:
+            return {}
+
+    with pytest.raises(InvalidControllerPrefixError):
+        processor.post_process(InvalidPrefixController())
+
+    assert not [route for route in api.routes if isinstance(route, APIRoute)]
+
+
+class ForwardReferencedModel(BaseModel):
+    """String 반환 어노테이션으로 참조되는 응답 모델."""
+
+    value: str
+
+
+def test_register_routes_string_return_annotation_expect_resolved_response_model() -> (
+    None
+):
+    """문자열 forward reference 반환 어노테이션도 실제 응답 모델로 해석된다."""
+    api = FastAPI()
+    container = Mock(spec=IContainer)
+    container.get.return_value = api
+    processor = RegisterRoutesPostProcessor()
+    processor.set_container(container)
+    processor.set_application_context(ApplicationContext())
+
+    @ApiController("/forward")
+    class ForwardController:
+        @get("")
+        async def get_forward(self) -> "ForwardReferencedModel":
+            return ForwardReferencedModel(value="ok")
+
+    processor.post_process(ForwardController())
+
+    route = next(
+        route
+        for route in api.routes
+        if isinstance(route, APIRoute) and route.path == "/forward"
+    )
+    assert route.response_model is ForwardReferencedModel
+
+
+def test_register_routes_unresolvable_return_annotation_expect_inference_skipped() -> (
+    None
+):
+    """해석할 수 없는 문자열 반환 어노테이션은 응답 모델 추론만 건너뛰고 route는 등록된다."""
+    api = FastAPI()
+    container = Mock(spec=IContainer)
+    container.get.return_value = api
+    processor = RegisterRoutesPostProcessor()
+    processor.set_container(container)
+    processor.set_application_context(ApplicationContext())
+
+    @ApiController("/hidden")
+    class HiddenController:
+        @get("")
+        async def get_hidden(self) -> "Decimal":
+            return Decimal("1")
+
+    processor.post_process(HiddenController())
+
+    route = next(
+        route
+        for route in api.routes
+        if isinstance(route, APIRoute) and route.path == "/hidden"
+    )
+    assert route.response_model is None
+
+
+def test_register_routes_default_names_expect_humanized_method_names(
+    api: FastAPI,
+) -> None:
+    """name 미지정 라우트는 메서드 이름을 단어 단위로 대문자화한 이름을 사용한다."""
+    names = {
+        route.path: route.name
+        for route in api.routes
+        if isinstance(route, (APIRoute, APIWebSocketRoute))
+    }
+
+    assert names["/dummy/sync"] == "Get Sync Dummy"
+    assert names["/dummy/named"] == "Named Endpoint"
+    assert names["/dummy/ws"] == "Websocket Dummy"
+
+
+def test_register_routes_unhashable_return_annotation_expect_response_model() -> None:
+    """해시 불가능한 메타데이터를 가진 반환 어노테이션도 응답 모델로 추론된다."""
+    api = FastAPI()
+    container = Mock(spec=IContainer)
+    container.get.return_value = api
+    processor = RegisterRoutesPostProcessor()
+    processor.set_container(container)
+    processor.set_application_context(ApplicationContext())
+
+    @ApiController("/annotated")
+    class AnnotatedController:
+        @get("")
+        async def get_annotated(
+            self,
+        ) -> Annotated[ForwardReferencedModel, {"source": "metadata"}]:
+            return ForwardReferencedModel(value="ok")
+
+    processor.post_process(AnnotatedController())
+
+    route = next(
+        route
+        for route in api.routes
+        if isinstance(route, APIRoute) and route.path == "/annotated"
+    )
+    assert (
+        route.response_model
+        == Annotated[ForwardReferencedModel, {"source": "metadata"}]
+    )
+
+
+def test_register_routes_controller_tags_expect_merged_with_route_tags() -> None:
+    """컨트롤러 prefix와 tag가 route에 직접 적용되어 애플리케이션 라우터에 등록된다."""
+    api = FastAPI()
+    container = Mock(spec=IContainer)
+    container.get.return_value = api
+    processor = RegisterRoutesPostProcessor()
+    processor.set_container(container)
+    processor.set_application_context(ApplicationContext())
+
+    @ApiController("/tagged", tags=["controller"])
+    class TaggedController:
+        @get("/items", tags=["route"])
+        async def get_items(self) -> list[str]:
+            return []
+
+        @websocket("/stream")
+        async def stream(self, socket: WebSocket) -> None:
+            await socket.close()
+
+    processor.post_process(TaggedController())
+
+    routes = [route for route in api.routes if isinstance(route, APIRoute)]
+    websocket_routes = [
+        route for route in api.routes if isinstance(route, APIWebSocketRoute)
+    ]
+    assert [(route.path, route.tags) for route in routes] == [
+        ("/tagged/items", ["controller", "route"])
+    ]
+    assert [route.path for route in websocket_routes] == ["/tagged/stream"]
+
+
+def test_register_routes_http_and_websocket_on_same_method_expect_both_registered() -> (
+    None
+):
+    """HTTP와 WebSocket 어노테이션을 함께 가진 메서드는 양쪽 route로 모두 등록된다."""
+    api = FastAPI()
+    container = Mock(spec=IContainer)
+    container.get.return_value = api
+    processor = RegisterRoutesPostProcessor()
+    processor.set_container(container)
+    processor.set_application_context(ApplicationContext())
+
+    @ApiController("/dual")
+    class DualController:
+        @websocket("/stream")
+        @get("/stream")
+        async def stream(self, socket: WebSocket) -> None:
+            await socket.close()
+
+    processor.post_process(DualController())
+
+    assert [route.path for route in api.routes if isinstance(route, APIRoute)] == [
+        "/dual/stream"
+    ]
+    assert [
+        route.path for route in api.routes if isinstance(route, APIWebSocketRoute)
+    ] == ["/dual/stream"]
+
+
+class PlainResult:
+    """pydantic이 검증할 수 없는 일반 반환 타입."""
+
+
+def test_register_routes_response_and_plain_return_annotation_expect_no_response_model() -> (
+    None
+):
+    """Response 반환 핸들러는 추론을 건너뛰고, 검증 불가 타입은 응답 모델 없이 등록된다."""
+    api = FastAPI()
+    container = Mock(spec=IContainer)
+    container.get.return_value = api
+    processor = RegisterRoutesPostProcessor()
+    processor.set_container(container)
+    processor.set_application_context(ApplicationContext())
+
+    @ApiController("/untyped")
+    class UntypedController:
+        @get("/file")
+        async def get_file(self) -> FileResponse:
+            return FileResponse("tests/apps/dummy.txt")
+
+        @get("/plain")
+        async def get_plain(self) -> PlainResult:
+            return PlainResult()
+
+    processor.post_process(UntypedController())
+
+    response_models = {
+        route.path: route.response_model
+        for route in api.routes
+        if isinstance(route, APIRoute)
+    }
+    assert response_models == {"/untyped/file": None, "/untyped/plain": None}
+
+
+def test_register_routes_multiple_controllers_expect_fastapi_resolved_once() -> None:
+    """여러 컨트롤러를 처리해도 FastAPI 인스턴스는 컨테이너에서 한 번만 조회된다."""
+    api = FastAPI()
+    container = Mock(spec=IContainer)
+    container.get.return_value = api
+    processor = RegisterRoutesPostProcessor()
+    processor.set_container(container)
+    processor.set_application_context(ApplicationContext())
+
+    @ApiController("/first")
+    class FirstController:
+        @get("")
+        async def get_first(self) -> str:
+            return "first"
+
+    @ApiController("/second")
+    class SecondController:
+        @get("")
+        async def get_second(self) -> str:
+            return "second"
+
+    processor.post_process(FirstController())
+    processor.post_process(SecondController())
+
+    container.get.assert_called_once_with(FastAPI)
+    paths = {route.path for route in api.routes if isinstance(route, APIRoute)}
+    assert {"/first", "/second"} <= paths
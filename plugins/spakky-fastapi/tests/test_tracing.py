@@ -2,7 +2,7 @@
 
 import re
 
-from fastapi import FastAPI
+from fastapi import FastAPI, WebSocket
 from fastapi.responses import JSONResponse
 from fastapi.testclient import TestClient
 
@@ -148,6 +148,29 @@ def test_tracing_middleware_clears_context_on_error_expect_none() -> None:
     assert TraceContext.get() is None
 
 
+def test_tracing_middleware_websocket_scope_expect_passthrough() -> None:
+    """WebSocket 연결은 trace context 처리 없이 그대로 전달됨을 검증한다."""
+    api = _create_app_with_tracing()
+    captured_context: list[TraceContext | None] = []
+
+    @api.websocket("/ws")
+    async def websocket_endpoint(websocket: WebSocket) -> None:
+        captured_context.append(TraceContext.get())
+        await websocket.accept()
+        await websocket.send_text("pong")
+        await websocket.close()
+
+    with (
+        TestClient(api) as client,
+        client.websocket_connect(
+            "/ws", headers={"traceparent": SAMPLE_TRACEPARENT}
+        ) as websocket,
+    ):
+        assert websocket.receive_text() == "pong"
+
+    assert captured_context == [None]
+
+
 # --- PostProcessor 통합 테스트 ---
 
 
@@ -21,6 +21,24 @@ class AutoOffsetResetType(StrEnum):
     NONE = "none"
 
 
+class CompressionType(StrEnum):
+    """Kafka producer compression codecs."""
+
+    NONE = "none"
+    GZIP = "gzip"
+    SNAPPY = "snappy"
+    LZ4 = "lz4"
+    ZSTD = "zstd"
+
+
+class ProducerAcksType(StrEnum):
+    """Kafka producer acknowledgement levels."""
+
+    NONE = "0"
+    LEADER = "1"
+    ALL = "all"
+
+
 @Configuration()
 class KafkaConnectionConfig(BaseSettings):
     """Kafka connection configuration loaded from environment variables."""
@@ -64,6 +82,52 @@ class KafkaConnectionConfig(BaseSettings):
     poll_timeout: float = 1.0
     """Consumer poll timeout in seconds."""
 
+    flush_timeout: float = 10.0
+    """Producer flush timeout in seconds applied once at shutdown."""
+
+    metadata_timeout: float = 5.0
+    """Timeout in seconds for topic metadata and topic creation requests."""
+
+    linger_ms: int = 50
+    """Time in milliseconds the sync producer waits to fill a batch before sending."""
+
+    async_linger_ms: int = 0
+    """Time in milliseconds the async producer waits to fill a batch before sending.
+
+    Every awaited ``send`` waits for its own delivery, so a non-zero linger is
+    added to each single publish.  ``send_many`` enqueues its messages before
+    awaiting them and batches them even with no linger; raise this only when
+    many concurrent publishers should share batches at the cost of latency.
+    """
+
+    batch_size: int = 65536
+    """Maximum size in bytes of a producer batch per partition."""
+
+    compression_type: CompressionType = CompressionType.LZ4
+    """Compression codec applied to sync producer batches."""
+
+    async_compression_type: CompressionType = CompressionType.GZIP
+    """Compression codec applied to async producer batches.
+
+    aiokafka only ships the gzip codec; lz4, snappy and zstd need their optional
+    codec packages, and without them the async producer sends uncompressed.
+    """
+
+    acks: ProducerAcksType = ProducerAcksType.ALL
+    """Number of broker acknowledgements the producer waits for (0, 1, all)."""
+
+    enable_idempotence: bool = False
+    """Whether the producer guarantees exactly-once delivery per partition."""
+
+    queue_buffering_max_messages: int = 1_000_000
+    """Maximum number of messages buffered in the producer queue."""
+
+    enable_delivery_logging: bool = False
+    """Whether the sync producer registers a per-message delivery report callback."""
+
+    poll_interval_messages: int = 64
+    """Number of sync sends between producer polls that serve delivery reports."""
+
     def __init__(self) -> None:
         super().__init__()
 
@@ -84,3 +148,14 @@ class KafkaConnectionConfig(BaseSettings):
         if self.sasl_password:
             config["sasl.password"] = self.sasl_password
         return config
+
+    @property
+    def producer_configuration_dict(self) -> dict[str, str | int | float | bool]:
+        return self.configuration_dict | {
+            "linger.ms": self.linger_ms,
+            "batch.size": self.batch_size,
+            "compression.type": self.compression_type.value,
+            "acks": self.acks.value,
+            "enable.idempotence": self.enable_idempotence,
+            "queue.buffering.max.messages": self.queue_buffering_max_messages,
+        }
@@ -1,4 +1,6 @@
+from collections.abc import Awaitable, Callable, Mapping
 from logging import getLogger
+from types import MappingProxyType
 from typing import Any, cast
 
 from spakky.auth import (
@@ -23,6 +25,7 @@ from spakky.event.event_consumer import (
     IAsyncEventConsumer,
     IEventConsumer,
 )
+from spakky.event.serialization import event_type_adapter
 from spakky.tracing.context import TraceContext
 from spakky.tracing.propagator import ITracePropagator
 from typing import override
@@ -41,6 +44,54 @@ def _event_routing_name(event: type[AbstractEvent]) -> str:
     return event.__name__
 
 
+type KafkaEventDispatcher = Callable[[bytes, dict[str, str]], None]
+type AsyncKafkaEventDispatcher = Callable[[bytes, dict[str, str]], Awaitable[None]]
+
+
+def _compile_dispatcher(
+    type_adapter: TypeAdapter[AbstractEvent],
+    handlers: list[EventHandlerCallback[Any]],
+    auth_boundary_handlers: set[EventHandlerCallback[Any]],
+) -> KafkaEventDispatcher:
+    # Everything the consume loop would otherwise resolve per message is bound
+    # here once: the adapter's validator and each handler's calling convention.
+    validate_json = type_adapter.validate_json
+    bound_handlers = tuple(
+        (handler, handler in auth_boundary_handlers) for handler in handlers
+    )
+
+    def dispatch(payload: bytes, headers: dict[str, str]) -> None:
+        event = validate_json(payload)
+        for handler, receives_auth_headers in bound_handlers:
+            if receives_auth_headers:
+                handler(event, **{KAFKA_AUTH_HEADERS_PARAMETER: headers})
+                continue
+            handler(event)
+
+    return dispatch
+
+
+def _compile_async_dispatcher(
+    type_adapter: TypeAdapter[AbstractEvent],
+    handlers: list[AsyncEventHandlerCallback[Any]],
+    auth_boundary_handlers: set[AsyncEventHandlerCallback[Any]],
+) -> AsyncKafkaEventDispatcher:
+    validate_json = type_adapter.validate_json
+    bound_handlers = tuple(
+        (handler, handler in auth_boundary_handlers) for handler in handlers
+    )
+
+    async def dispatch(payload: bytes, headers: dict[str, str]) -> None:
+        event = validate_json(payload)
+        for handler, receives_auth_headers in bound_handlers:
+            if receives_auth_headers:
+                await handler(event, **{KAFKA_AUTH_HEADERS_PARAMETER: headers})
+                continue
+            await handler(event)
+
+    return dispatch
+
+
 @Pod()
 class KafkaEventConsumer(IEventConsumer, AbstractBackgroundService):
     """Synchronous Kafka event consumer that polls messages and dispatches to handlers."""
@@ -49,6 +100,7 @@ class KafkaEventConsumer(IEventConsumer, AbstractBackgroundService):
     type_lookup: dict[str, type[AbstractEvent]]
     type_adapters: dict[type[AbstractEvent], TypeAdapter[AbstractEvent]]
     handlers: dict[type[AbstractEvent], list[EventHandlerCallback[Any]]]
+    dispatchers: Mapping[str, KafkaEventDispatcher]
     admin: AdminClient
     consumer: Consumer
     _propagator: ITracePropagator | None
@@ -61,6 +113,7 @@ class KafkaEventConsumer(IEventConsumer, AbstractBackgroundService):
         self.type_lookup = {}
         self.type_adapters = {}
         self.handlers = {}
+        self.dispatchers = MappingProxyType({})
         self._propagator = None
         self._auth_boundary_handlers = set()
         self.admin = AdminClient(self.config.configuration_dict)
@@ -80,6 +133,21 @@ class KafkaEventConsumer(IEventConsumer, AbstractBackgroundService):
     def register_auth_boundary(self, handler: EventHandlerCallback[Any]) -> None:
         """Mark a registered post-processor endpoint as Kafka auth-aware."""
         self._auth_boundary_handlers.add(handler)
+        self._compile_dispatchers()
+
+    def _compile_dispatchers(self) -> None:
+        # Registration happens during startup wiring; the consume loop only
+        # reads this snapshot and makes one call per message.
+        self.dispatchers = MappingProxyType(
+            {
+                topic: _compile_dispatcher(
+                    self.type_adapters[event_type],
+                    self.handlers[event_type],
+                    self._auth_boundary_handlers,
+                )
+                for topic, event_type in self.type_lookup.items()
+            }
+        )
 
     @staticmethod
     def _to_string_headers(
@@ -113,8 +181,12 @@ class KafkaEventConsumer(IEventConsumer, AbstractBackgroundService):
     def _create_topics(self, topics: list[str]) -> None:
         if not topics:  # pragma: no cover - 등록된 핸들러 없을 때 조기 반환
             return
-        existing_topics: set[str] = set(self.admin.list_topics().topics.keys())
-        topics_to_create: set[str] = set(topics) - existing_topics
+        existing_topics = self.admin.list_topics(
+            timeout=self.config.metadata_timeout
+        ).topics
+        topics_to_create: set[str] = {
+            topic for topic in topics if topic not in existing_topics
+        }
         if not topics_to_create:  # pragma: no cover - 모든 토픽이 이미 존재
             return
         self.admin.create_topics(
@@ -136,8 +208,8 @@ class KafkaEventConsumer(IEventConsumer, AbstractBackgroundService):
         if topic is None:  # pragma: no cover - Kafka 메시지 비정상 상태
             logger.warning("Received message with no topic.")
             return
-        event_type: type[AbstractEvent] | None = self.type_lookup.get(topic)
-        if event_type is None:  # pragma: no cover - 미등록 이벤트 타입 수신 방어
+        dispatch = self.dispatchers.get(topic)
+        if dispatch is None:  # pragma: no cover - 미등록 이벤트 타입 수신 방어
             logger.warning(f"Received message for unknown event type: {topic}")
             return
         headers = self._to_string_headers(message.headers())
@@ -151,13 +223,7 @@ class KafkaEventConsumer(IEventConsumer, AbstractBackgroundService):
             if event_message is None:  # pragma: no cover - Kafka 메시지 본문 누락 방어
                 logger.warning(f"Received empty message for event type: {topic}")
                 return
-            event_data = self.type_adapters[event_type].validate_json(event_message)
-            handlers = self.handlers[event_type]
-            for handler in handlers:
-                if handler in self._auth_boundary_handlers:
-                    handler(event_data, **{KAFKA_AUTH_HEADERS_PARAMETER: headers})
-                    continue
-                handler(event_data)
+            dispatch(event_message, headers)
         except (
             AuthVerificationProviderUnavailableError,
             AuthRequirementProviderUnavailableError,
@@ -180,11 +246,10 @@ class KafkaEventConsumer(IEventConsumer, AbstractBackgroundService):
         """Register a handler for the given event type."""
         if event not in self.handlers:
             self.handlers[event] = []
-            self.type_adapters[event] = cast(
-                TypeAdapter[AbstractEvent], TypeAdapter(event)
-            )
+            self.type_adapters[event] = event_type_adapter(event)
             self.type_lookup[_event_routing_name(event)] = event
         self.handlers[event].append(handler)
+        self._compile_dispatchers()
 
     @override
     def initialize(self) -> None:
@@ -220,6 +285,7 @@ class AsyncKafkaEventConsumer(IAsyncEventConsumer, AbstractAsyncBackgroundServic
     type_lookup: dict[str, type[AbstractEvent]]
     type_adapters: dict[type[AbstractEvent], TypeAdapter[AbstractEvent]]
     handlers: dict[type[AbstractEvent], list[AsyncEventHandlerCallback[Any]]]
+    dispatchers: Mapping[str, AsyncKafkaEventDispatcher]
     admin: AdminClient
     consumer: AIOConsumer
     _propagator: ITracePropagator | None
@@ -232,6 +298,7 @@ class AsyncKafkaEventConsumer(IAsyncEventConsumer, AbstractAsyncBackgroundServic
         self.type_lookup = {}
         self.type_adapters = {}
         self.handlers = {}
+        self.dispatchers = MappingProxyType({})
         self._propagator = None
         self._auth_boundary_handlers = set()
         self.admin = AdminClient(self.config.configuration_dict)
@@ -247,6 +314,21 @@ class AsyncKafkaEventConsumer(IAsyncEventConsumer, AbstractAsyncBackgroundServic
     def register_auth_boundary(self, handler: AsyncEventHandlerCallback[Any]) -> None:
         """Mark a registered post-processor endpoint as Kafka auth-aware."""
         self._auth_boundary_handlers.add(handler)
+        self._compile_dispatchers()
+
+    def _compile_dispatchers(self) -> None:
+        # Registration happens during startup wiring; the consume loop only
+        # reads this snapshot and makes one call per message.
+        self.dispatchers = MappingProxyType(
+            {
+                topic: _compile_async_dispatcher(
+                    self.type_adapters[event_type],
+                    self.handlers[event_type],
+                    self._auth_boundary_handlers,
+                )
+                for topic, event_type in self.type_lookup.items()
+            }
+        )
 
     @staticmethod
     def _to_string_headers(
@@ -280,8 +362,12 @@ class AsyncKafkaEventConsumer(IAsyncEventConsumer, AbstractAsyncBackgroundServic
     def _create_topics(self, topics: list[str]) -> None:
         if not topics:  # pragma: no cover - 등록된 핸들러 없을 때 조기 반환
             return
-        existing_topics: set[str] = set(self.admin.list_topics().topics.keys())
-        topics_to_create: set[str] = set(topics) - existing_topics
+        existing_topics = self.admin.list_topics(
+            timeout=self.config.metadata_timeout
+        ).topics
+        topics_to_create: set[str] = {
+            topic for topic in topics if topic not in existing_topics
+        }
         if not topics_to_create:  # pragma: no cover - 모든 토픽이 이미 존재
             return
         self.admin.create_topics(
@@ -305,8 +391,8 @@ class AsyncKafkaEventConsumer(IAsyncEventConsumer, AbstractAsyncBackgroundServic
         if topic is None:  # pragma: no cover - Kafka 메시지 비정상 상태
             logger.warning("Received message with no topic.")
             return
-        event_type: type[AbstractEvent] | None = self.type_lookup.get(topic)
-        if event_type is None:  # pragma: no cover - 미등록 이벤트 타입 수신 방어
+        dispatch = self.dispatchers.get(topic)
+        if dispatch is None:  # pragma: no cover - 미등록 이벤트 타입 수신 방어
             logger.warning(f"Received message for unknown event type: {topic}")
             return
         headers = self._to_string_headers(message.headers())
@@ -320,16 +406,7 @@ class AsyncKafkaEventConsumer(IAsyncEventConsumer, AbstractAsyncBackgroundServic
             if event_message is None:  # pragma: no cover - Kafka 메시지 본문 누락 방어
                 logger.warning(f"Received empty message for event type: {topic}")
                 return
-            event_data = self.type_adapters[event_type].validate_json(event_message)
-            handlers = self.handlers[event_type]
-            for handler in handlers:
-                if handler in self._auth_boundary_handlers:
-                    await handler(
-                        event_data,
-                        **{KAFKA_AUTH_HEADERS_PARAMETER: headers},
-                    )
-                    continue
-                await handler(event_data)
+            await dispatch(event_message, headers)
         except (
             AuthVerificationProviderUnavailableError,
             AuthRequirementProviderUnavailableError,
@@ -352,11 +429,10 @@ class AsyncKafkaEventConsumer(IAsyncEventConsumer, AbstractAsyncBackgroundServic
         """Register an async handler for the given event type."""
         if event not in self.handlers:
             self.handlers[event] = []
-            self.type_adapters[event] = cast(
-                TypeAdapter[AbstractEvent], TypeAdapter(event)
-            )
+            self.type_adapters[event] = event_type_adapter(event)
             self.type_lookup[_event_routing_name(event)] = event
         self.handlers[event].append(handler)
+        self._compile_dispatchers()
 
     @override
     async def initialize_async(self) -> None:
@@ -1,61 +1,190 @@
-from logging import getLogger
+import threading
+from asyncio import (
+    AbstractEventLoop,
+    Future,
+    Lock,
+    gather,
+    get_running_loop,
+    locks,
+    to_thread,
+)
+from abc import ABC
+from collections.abc import Iterable
+from dataclasses import dataclass
+from logging import DEBUG, getLogger
 
 from aiokafka import AIOKafkaProducer
-from confluent_kafka import KafkaError, Message, Producer
+from aiokafka.codec import has_gzip, has_lz4, has_snappy, has_zstd
+from aiokafka.structs import RecordMetadata
+from confluent_kafka import KafkaError, KafkaException, Message, Producer
 from confluent_kafka.admin import AdminClient, NewTopic
 from typing import override
 
 from spakky.core.pod.annotations.pod import Pod
+from spakky.core.service.interfaces.service import IAsyncService, IService
 from spakky.event.event_publisher import (
     IAsyncEventTransport,
     IEventTransport,
 )
 
-from spakky.plugins.kafka.common.config import KafkaConnectionConfig
+from spakky.plugins.kafka.common.config import (
+    CompressionType,
+    KafkaConnectionConfig,
+    ProducerAcksType,
+)
 
 logger = getLogger(__name__)
 
+AIOKAFKA_CODEC_AVAILABILITY = {
+    CompressionType.GZIP: has_gzip,
+    CompressionType.SNAPPY: has_snappy,
+    CompressionType.LZ4: has_lz4,
+    CompressionType.ZSTD: has_zstd,
+}
+"""aiokafka codec probes; codecs other than gzip need optional packages."""
 
-@Pod()
-class KafkaEventTransport(IEventTransport):
-    """Synchronous Kafka event transport using confluent_kafka Producer."""
+
+class AbstractKafkaEventTransport(ABC):
+    """Topic bookkeeping shared by the sync and async Kafka transports.
+
+    Topics are created on demand the first time they are sent to, so each
+    topic costs a broker round-trip only once.
+    """
 
     config: KafkaConnectionConfig
     admin: AdminClient
-    producer: Producer
+    _known_topics: set[str]
 
     def __init__(self, config: KafkaConnectionConfig) -> None:
-        """Initialize the Kafka producer with connection config."""
+        """Initialize the admin client and topic caches."""
         self.config = config
         self.admin = AdminClient(self.config.configuration_dict)
-        self.producer = Producer(self.config.configuration_dict, logger=logger)
+        self._known_topics = set()
 
     def _create_topic(self, topic: str) -> None:
-        existing_topics: set[str] = set(self.admin.list_topics().topics.keys())
-        if topic in existing_topics:
+        # Topics are created on their first send; afterwards this is a set
+        # lookup with no broker round-trip.
+        if topic in self._known_topics:
             return
-        self.admin.create_topics(
-            [
-                NewTopic(
-                    topic=topic,
-                    num_partitions=self.config.number_of_partitions,
-                    replication_factor=self.config.replication_factor,
-                )
-            ]
-        )
+        # The metadata topics mapping answers membership directly; copying it
+        # into a set would cost O(cluster topics) per lookup.
+        existing_topics = self.admin.list_topics(
+            timeout=self.config.metadata_timeout
+        ).topics
+        if topic not in existing_topics:
+            futures = self.admin.create_topics(
+                [
+                    NewTopic(
+                        topic=topic,
+                        num_partitions=self.config.number_of_partitions,
+                        replication_factor=self.config.replication_factor,
+                    )
+                ]
+            )
+            try:
+                futures[topic].result(timeout=self.config.metadata_timeout)
+            except KafkaException as e:
+                # Another producer may have created the topic in the meantime.
+                if e.args[0].code() != KafkaError.TOPIC_ALREADY_EXISTS:
+                    logger.warning("Failed to create Kafka topic %s: %s", topic, e)
+                    return
+            except TimeoutError:
+                # Left unknown so the next send checks the topic again.
+                logger.warning("Timed out creating Kafka topic %s", topic)
+                return
+        self._known_topics.add(topic)
+
+
+@dataclass(frozen=True, slots=True)
+class KafkaDeliveryStats:
+    """Delivery report counts aggregated by the synchronous transport.
+
+    Attributes:
+        delivered: Messages the broker acknowledged.
+        failed: Messages librdkafka reported as failed.
+    """
+
+    delivered: int
+    failed: int
+
+
+@Pod()
+class KafkaEventTransport(AbstractKafkaEventTransport, IEventTransport, IService):
+    """Synchronous Kafka event transport using confluent_kafka Producer.
+
+    Messages are enqueued to the producer without flushing on every send so
+    that librdkafka can batch them.  Buffered messages are flushed once when
+    the application stops.  A per-message delivery report callback is only
+    registered when ``enable_delivery_logging`` is set.  Delivery reports are
+    served with ``poll(0)`` once every ``poll_interval_messages`` sends rather
+    than after each one.
+    """
+
+    producer: Producer
+    _unpolled_sends: int
+    _delivered: int
+    _failed: int
+
+    def __init__(self, config: KafkaConnectionConfig) -> None:
+        """Initialize the Kafka producer with connection config."""
+        super().__init__(config)
+        self.producer = Producer(self.config.producer_configuration_dict, logger=logger)
+        self._unpolled_sends = 0
+        self._delivered = 0
+        self._failed = 0
+
+    def _poll(self) -> None:
+        self._unpolled_sends = 0
+        self.producer.poll(0)
 
     def _message_delivery_report(
         self,
         error: KafkaError | None,
         message: Message,
     ) -> None:
-        if (
-            error is not None
-        ):  # pragma: no cover - Kafka 브로커 콜백으로 커버리지 수집 불가
-            logger.error(f"Message delivery failed: {error}")
+        # Reports are only counted here; the per-message success line is
+        # formatted solely when DEBUG is on, and a summary is logged at stop.
+        if error is not None:
+            self._failed += 1
+            logger.error("Message delivery failed: %s", error)
+            return
+        self._delivered += 1
+        if logger.isEnabledFor(DEBUG):
+            logger.debug(
+                "Message delivered to %s [%d] at offset %d",
+                message.topic(),
+                message.partition(),
+                message.offset(),
+            )
+
+    def delivery_stats(self) -> KafkaDeliveryStats | None:
+        """Return the delivery report counts served so far.
+
+        Returns:
+            Delivered and failed message counts, or ``None`` when
+            ``enable_delivery_logging`` is off and no delivery reports are
+            collected.
+        """
+        if not self.config.enable_delivery_logging:
+            return None
+        return KafkaDeliveryStats(delivered=self._delivered, failed=self._failed)
+
+    def _produce(
+        self, event_name: str, payload: bytes, headers: dict[str, str]
+    ) -> None:
+        self._create_topic(topic=event_name)
+        if self.config.enable_delivery_logging:
+            self.producer.produce(
+                topic=event_name,
+                value=payload,
+                headers=dict(headers),
+                callback=self._message_delivery_report,
+            )
         else:
-            logger.info(
-                f"Message delivered to {message.topic()} [{message.partition()}] at offset {message.offset()}"
+            self.producer.produce(
+                topic=event_name,
+                value=payload,
+                headers=dict(headers),
             )
 
     @override
@@ -72,45 +201,121 @@ class KafkaEventTransport(IEventTransport):
             payload: Pre-serialized JSON bytes.
             headers: Metadata headers for trace propagation.
         """
-        self._create_topic(topic=event_name)
-        self.producer.produce(
-            topic=event_name,
-            value=payload,
-            headers=dict(headers),
-            callback=self._message_delivery_report,
-        )
-        self.producer.poll(0)
-        self.producer.flush()
+        self._produce(event_name, payload, headers)
+        # Each poll takes librdkafka's queue lock, so delivery reports are
+        # drained in bursts; stop() flushes whatever is still pending.
+        self._unpolled_sends += 1
+        if self._unpolled_sends >= self.config.poll_interval_messages:
+            self._poll()
+
+    @override
+    def send_many(self, messages: Iterable[tuple[str, bytes, dict[str, str]]]) -> None:
+        """Enqueue several pre-serialized payloads, then serve callbacks once.
+
+        Args:
+            messages: ``(event_name, payload, headers)`` tuples to send in order.
+        """
+        for event_name, payload, headers in messages:
+            self._produce(event_name, payload, headers)
+        self._poll()
+
+    @override
+    def set_stop_event(self, stop_event: threading.Event) -> None:
+        """Accept the lifecycle stop event; the transport runs no loop of its own."""
+        return
+
+    @override
+    def start(self) -> None:
+        """No-op start; the producer is created eagerly in ``__init__``."""
+        return
+
+    @override
+    def stop(self) -> None:
+        """Flush messages still buffered in the producer before shutdown."""
+        remaining = self.producer.flush(self.config.flush_timeout)
+        if remaining > 0:
+            logger.warning(
+                "%d Kafka messages were not delivered before shutdown", remaining
+            )
+        if self.config.enable_delivery_logging:
+            logger.info(
+                "Kafka delivery reports: %d delivered, %d failed",
+                self._delivered,
+                self._failed,
+            )
 
 
 @Pod()
-class AsyncKafkaEventTransport(IAsyncEventTransport):
-    """Asynchronous Kafka event transport using aiokafka AIOKafkaProducer."""
+class AsyncKafkaEventTransport(
+    AbstractKafkaEventTransport, IAsyncEventTransport, IAsyncService
+):
+    """Asynchronous Kafka event transport using aiokafka AIOKafkaProducer.
 
-    config: KafkaConnectionConfig
-    admin: AdminClient
+    The producer is started on the first send and reused afterwards.  aiokafka
+    producers are bound to the event loop that started them, so sends from any
+    other loop fall back to a short-lived producer.
+    """
+
+    _loop: AbstractEventLoop | None
+    _lock: Lock | None
+    _producer: AIOKafkaProducer | None
+    _compression_type: str | None
 
     def __init__(self, config: KafkaConnectionConfig) -> None:
         """Initialize the async Kafka transport with connection config."""
-        self.config = config
-        self.admin = AdminClient(self.config.configuration_dict)
+        super().__init__(config)
+        self._loop = None
+        self._lock = None
+        self._producer = None
+        # Resolved once so short-lived producers neither re-probe the codec
+        # nor repeat the fallback warning on every send.
+        self._compression_type = self._resolve_compression_type()
 
-    def _create_topic(  # pragma: no cover - Kafka 브로커 콜백으로 커버리지 수집 불가
-        self, topic: str
-    ) -> None:
-        existing_topics: set[str] = set(self.admin.list_topics().topics.keys())
-        if topic in existing_topics:
-            return
-        self.admin.create_topics(
-            [
-                NewTopic(
-                    topic=topic,
-                    num_partitions=self.config.number_of_partitions,
-                    replication_factor=self.config.replication_factor,
-                )
-            ]
+    def _resolve_compression_type(self) -> str | None:
+        compression_type = self.config.async_compression_type
+        if compression_type is CompressionType.NONE:
+            return None
+        if not AIOKAFKA_CODEC_AVAILABILITY[compression_type]():
+            logger.warning(
+                "aiokafka cannot use the %s codec; async producer sends uncompressed batches",
+                compression_type.value,
+            )
+            return None
+        return compression_type.value
+
+    def _create_producer(self) -> AIOKafkaProducer:
+        acks = self.config.acks
+        return AIOKafkaProducer(
+            bootstrap_servers=self.config.bootstrap_servers,
+            linger_ms=self.config.async_linger_ms,
+            max_batch_size=self.config.batch_size,
+            compression_type=self._compression_type,
+            acks=acks.value if acks is ProducerAcksType.ALL else int(acks.value),
+            enable_idempotence=self.config.enable_idempotence,
         )
 
+    async def _create_topic_async(self, topic: str) -> None:
+        # Topic creation blocks on admin round-trips for up to twice
+        # metadata_timeout, so it runs in a worker thread instead of stalling
+        # the event loop; known topics stay a plain set lookup.
+        if topic in self._known_topics:
+            return
+        await to_thread(self._create_topic, topic)
+
+    async def _get_producer(self) -> AIOKafkaProducer | None:
+        loop = get_running_loop()
+        if self._loop is None:
+            self._loop = loop
+            self._lock = Lock()
+        if loop is not self._loop or self._lock is None:
+            return None
+        async with self._lock:
+            if self._producer is None:
+                producer = self._create_producer()
+                await producer.start()
+                self._producer = producer
+            return self._producer
+
     @override
     async def send(
         self,
@@ -125,16 +330,70 @@ class AsyncKafkaEventTransport(IAsyncEventTransport):
             payload: Pre-serialized JSON bytes.
             headers: Metadata headers for trace propagation.
         """
-        self._create_topic(topic=event_name)
-        producer = AIOKafkaProducer(
-            bootstrap_servers=self.config.bootstrap_servers,
-        )
+        await self._create_topic_async(event_name)
+        encoded_headers = [(k, v.encode()) for k, v in headers.items()]
+        producer = await self._get_producer()
+        if producer is not None:
+            await producer.send_and_wait(
+                topic=event_name,
+                value=payload,
+                headers=encoded_headers,
+            )
+            return
+        producer = self._create_producer()
         await producer.start()
         try:
             await producer.send_and_wait(
                 topic=event_name,
                 value=payload,
-                headers=[(k, v.encode()) for k, v in headers.items()],
+                headers=encoded_headers,
             )
         finally:
             await producer.stop()
+
+    @override
+    async def send_many(
+        self, messages: Iterable[tuple[str, bytes, dict[str, str]]]
+    ) -> None:
+        """Enqueue several pre-serialized payloads and await their delivery together.
+
+        Args:
+            messages: ``(event_name, payload, headers)`` tuples to send in order.
+        """
+        producer = await self._get_producer()
+        if producer is None:
+            await super().send_many(messages)
+            return
+        deliveries: list[Future[RecordMetadata]] = []
+        for event_name, payload, headers in messages:
+            await self._create_topic_async(event_name)
+            deliveries.append(
+                await producer.send(
+                    topic=event_name,
+                    value=payload,
+                    headers=[(k, v.encode()) for k, v in headers.items()],
+                )
+            )
+        await gather(*deliveries)
+
+    @override
+    def set_stop_event(self, stop_event: locks.Event) -> None:
+        """Accept the lifecycle stop event; the transport runs no loop of its own."""
+        return
+
+    @override
+    async def start_async(self) -> None:
+        """No-op start; the producer is started lazily on the first send."""
+        return
+
+    @override
+    async def stop_async(self) -> None:
+        """Stop the reused producer, flushing any pending messages."""
+        producer = self._producer
+        owned = self._loop is get_running_loop()
+        self._loop = None
+        self._lock = None
+        self._producer = None
+        if not owned or producer is None:
+            return
+        await producer.stop()
@@ -1,6 +1,5 @@
-from functools import wraps
-from inspect import getmembers, iscoroutinefunction, ismethod
-from logging import getLogger
+from inspect import getmembers, ismethod
+from logging import INFO, getLogger
 from typing import Any
 
 from spakky.auth import AuthorizationDecisionState, get_effective_auth_metadata
@@ -42,6 +41,8 @@ class KafkaPostProcessor(IPostProcessor, IContainerAware, IApplicationContextAwa
 
     __container: IContainer
     __application_context: IApplicationContext
+    __consumer: IEventConsumer | None
+    __async_consumer: IAsyncEventConsumer | None
 
     @override
     def set_container(self, container: IContainer) -> None:
@@ -51,6 +52,34 @@ class KafkaPostProcessor(IPostProcessor, IContainerAware, IApplicationContextAwa
             container: The IoC container.
         """
         self.__container = container
+        self.__consumer = None
+        self.__async_consumer = None
+
+    def __inject_propagator(self, consumer: object) -> None:
+        propagator = self.__application_context.get_or_none(ITracePropagator)
+        if propagator is None:
+            return
+        # 프레임워크 내부: consumer 인터페이스가 선택적 propagator를 지원하는지 확인
+        if hasattr(consumer, "set_propagator"):  # optional tracing bridge injection
+            consumer.set_propagator(propagator)
+
+    def __get_consumer(self) -> IEventConsumer:
+        # Resolved on the first sync route, so async-only applications never
+        # need a sync consumer bound, and reused for later handler pods.
+        if self.__consumer is None:
+            consumer = self.__container.get(IEventConsumer)
+            self.__inject_propagator(consumer)
+            self.__consumer = consumer
+        return self.__consumer
+
+    def __get_async_consumer(self) -> IAsyncEventConsumer:
+        # Resolved on the first async route, so sync-only applications never
+        # need an async consumer bound, and reused for later handler pods.
+        if self.__async_consumer is None:
+            async_consumer = self.__container.get(IAsyncEventConsumer)
+            self.__inject_propagator(async_consumer)
+            self.__async_consumer = async_consumer
+        return self.__async_consumer
 
     @override
     def set_application_context(self, application_context: IApplicationContext) -> None:
@@ -78,19 +107,10 @@ class KafkaPostProcessor(IPostProcessor, IContainerAware, IApplicationContextAwa
         if not EventHandler.exists(pod):
             return pod
         handler: EventHandler = EventHandler.get(pod)
-        consumer = self.__container.get(IEventConsumer)
-        async_consumer = self.__container.get(IAsyncEventConsumer)
         auth_boundary = KafkaAuthBoundary(self.__container, self.__application_context)
-        propagator = self.__application_context.get_or_none(ITracePropagator)
-        if propagator is not None:
-            if hasattr(  # optional tracing bridge injection
-                consumer, "set_propagator"
-            ):  # 프레임워크 내부: consumer가 선택적 propagator를 지원하는지 확인
-                consumer.set_propagator(propagator)
-            if hasattr(  # optional tracing bridge injection
-                async_consumer, "set_propagator"
-            ):  # 프레임워크 내부: consumer가 선택적 propagator를 지원하는지 확인
-                async_consumer.set_propagator(propagator)
+        # Route lines are only built when INFO is enabled for this logger.
+        log_routes = logger.isEnabledFor(INFO)
+        processor_name = type(self).__name__
         for name, method in getmembers(pod, ismethod):
             route: EventRoute[AbstractEvent] | None = EventRoute[
                 AbstractEvent
@@ -100,10 +120,13 @@ class KafkaPostProcessor(IPostProcessor, IContainerAware, IApplicationContextAwa
             if not issubclass(route.event_type, AbstractIntegrationEvent):
                 continue
 
-            # pylint: disable=line-too-long
-            logger.info(
-                f"[{type(self).__name__}] {route.event_type.__name__} -> {method.__qualname__}"
-            )
+            if log_routes:
+                logger.info(
+                    "[%s] %s -> %s",
+                    processor_name,
+                    route.event_type.__name__,
+                    method.__qualname__,
+                )
             auth_metadata = get_effective_auth_metadata(
                 method,
                 owner_type=handler.type_,
@@ -113,9 +136,8 @@ class KafkaPostProcessor(IPostProcessor, IContainerAware, IApplicationContextAwa
                 protected=auth_metadata.protected,
             )
 
-            if iscoroutinefunction(method):
+            if route.is_async:
 
-                @wraps(method)
                 async def async_endpoint(
                     *args: Any,
                     _spakky_kafka_headers: dict[str, str] | None = None,
@@ -141,6 +163,14 @@ class KafkaPostProcessor(IPostProcessor, IContainerAware, IApplicationContextAwa
                     )  # 프레임워크 내부: 이벤트 핸들러 메서드 동적 디스패치
                     return await method_to_call(*args, **kwargs)
 
+                # Only the names consumers log are copied; update_wrapper's
+                # full attribute sweep is startup cost no caller reads.
+                async_endpoint.__name__ = method.__name__
+                async_endpoint.__qualname__ = method.__qualname__
+                setattr(  # functions accept arbitrary attributes; stubs omit __wrapped__
+                    async_endpoint, "__wrapped__", method
+                )
+                async_consumer = self.__get_async_consumer()
                 async_consumer.register(route.event_type, async_endpoint)
                 if hasattr(  # optional auth-aware Kafka consumer bridge
                     async_consumer,
@@ -149,7 +179,6 @@ class KafkaPostProcessor(IPostProcessor, IContainerAware, IApplicationContextAwa
                     async_consumer.register_auth_boundary(async_endpoint)
                 continue
 
-            @wraps(method)
             def endpoint(
                 *args: Any,
                 _spakky_kafka_headers: dict[str, str] | None = None,
@@ -175,6 +204,12 @@ class KafkaPostProcessor(IPostProcessor, IContainerAware, IApplicationContextAwa
                 )  # 프레임워크 내부: 이벤트 핸들러 메서드 동적 디스패치
                 return method_to_call(*args, **kwargs)
 
+            endpoint.__name__ = method.__name__
+            endpoint.__qualname__ = method.__qualname__
+            setattr(  # functions accept arbitrary attributes; stubs omit __wrapped__
+                endpoint, "__wrapped__", method
+            )
+            consumer = self.__get_consumer()
             consumer.register(route.event_type, endpoint)
             if hasattr(  # optional auth-aware Kafka consumer bridge
                 consumer,
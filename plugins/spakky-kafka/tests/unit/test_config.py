@@ -12,6 +12,7 @@ import pytest
 
 from spakky.plugins.kafka.common.config import (
     AutoOffsetResetType,
+    CompressionType,
     KafkaConnectionConfig,
 )
 from spakky.plugins.kafka.common.constants import SPAKKY_KAFKA_CONFIG_ENV_PREFIX
@@ -97,6 +98,10 @@ def test_kafka_config_default_values(clean_env: None) -> None:
     assert config.number_of_partitions == 1
     assert config.replication_factor == 1
     assert config.auto_offset_reset == AutoOffsetResetType.EARLIEST
+    assert config.linger_ms == 50
+    assert config.async_linger_ms == 0
+    assert config.compression_type == CompressionType.LZ4
+    assert config.async_compression_type == CompressionType.GZIP
 
 
 def test_kafka_config_configuration_dict_basic(clean_env: None) -> None:
@@ -141,6 +146,28 @@ def test_kafka_config_configuration_dict_with_sasl(clean_env: None) -> None:
     assert config_dict["sasl.password"] == "kafka-pass"
 
 
+def test_kafka_config_producer_configuration_dict_expect_batching_defaults(
+    clean_env: None,
+) -> None:
+    """producer_configuration_dict가 연결 설정에 throughput용 batching 기본값을 더하는지 검증한다."""
+    environ[f"{SPAKKY_KAFKA_CONFIG_ENV_PREFIX}GROUP_ID"] = "test-group"
+    environ[f"{SPAKKY_KAFKA_CONFIG_ENV_PREFIX}CLIENT_ID"] = "test-client"
+    environ[f"{SPAKKY_KAFKA_CONFIG_ENV_PREFIX}BOOTSTRAP_SERVERS"] = "localhost:9092"
+    environ[f"{SPAKKY_KAFKA_CONFIG_ENV_PREFIX}LINGER_MS"] = "100"
+
+    config = KafkaConnectionConfig()
+    producer_dict = config.producer_configuration_dict
+
+    assert producer_dict["bootstrap.servers"] == "localhost:9092"
+    assert producer_dict["linger.ms"] == 100
+    assert producer_dict["batch.size"] == 65536
+    assert producer_dict["compression.type"] == "lz4"
+    assert producer_dict["acks"] == "all"
+    assert producer_dict["enable.idempotence"] is False
+    assert producer_dict["queue.buffering.max.messages"] == 1_000_000
+    assert "linger.ms" not in config.configuration_dict
+
+
 def test_kafka_config_auto_offset_reset_values(clean_env: None) -> None:
     """모든 AutoOffsetResetType 열거형 값이 올바르게 동작하는지 검증한다."""
     environ[f"{SPAKKY_KAFKA_CONFIG_ENV_PREFIX}GROUP_ID"] = "test-group"
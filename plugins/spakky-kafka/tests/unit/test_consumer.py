@@ -20,6 +20,7 @@ from spakky.domain.models.event import AbstractIntegrationEvent
 from spakky.tracing.context import TraceContext
 from spakky.tracing.w3c_propagator import W3CTracePropagator
 
+from spakky.plugins.kafka.auth import KAFKA_AUTH_HEADERS_PARAMETER
 from spakky.plugins.kafka.common.config import KafkaConnectionConfig
 from spakky.plugins.kafka.event.consumer import (
     AsyncKafkaEventConsumer,
@@ -150,6 +151,56 @@ def test_sync_consumer_register_multiple_handlers_expect_all_stored(
     assert len(consumer.handlers[SampleEvent]) == 2
 
 
+@patch("spakky.plugins.kafka.event.consumer.Consumer")
+@patch("spakky.plugins.kafka.event.consumer.AdminClient")
+def test_sync_consumer_register_expect_dispatcher_compiled_by_topic(
+    mock_admin_cls: MagicMock,
+    mock_consumer_cls: MagicMock,
+    config: KafkaConnectionConfig,
+) -> None:
+    """등록된 핸들러가 토픽별 읽기 전용 dispatcher로 컴파일되어 헤더 전달 방식까지 반영하는지 검증한다."""
+    consumer = KafkaEventConsumer(config)
+    handler1 = MagicMock()
+    handler2 = MagicMock()
+    headers = {"traceparent": "value"}
+
+    consumer.register(SampleEvent, handler1)
+    consumer.register(SampleEvent, handler2)
+    consumer.register_auth_boundary(handler2)
+    consumer.dispatchers["SampleEvent"](b'{"data": "hello"}', headers)
+
+    assert handler1.call_args.args[0].data == "hello"
+    assert handler1.call_args.kwargs == {}
+    assert handler2.call_args.args[0].data == "hello"
+    assert handler2.call_args.kwargs == {KAFKA_AUTH_HEADERS_PARAMETER: headers}
+    with pytest.raises(TypeError):
+        consumer.dispatchers["OtherEvent"] = handler1  # type: ignore[index]  # 읽기 전용 매핑 검증
+
+
+@pytest.mark.asyncio
+@patch("spakky.plugins.kafka.event.consumer.AdminClient")
+async def test_async_consumer_register_expect_dispatcher_compiled_by_topic(
+    mock_admin_cls: MagicMock,
+    config: KafkaConnectionConfig,
+) -> None:
+    """비동기 consumer의 dispatcher가 검증한 이벤트를 각 핸들러에 await하는지 검증한다."""
+    del mock_admin_cls
+    consumer = AsyncKafkaEventConsumer(config)
+    handler1 = AsyncMock()
+    handler2 = AsyncMock()
+    headers = {"traceparent": "value"}
+
+    consumer.register(SampleEvent, handler1)
+    consumer.register(SampleEvent, handler2)
+    consumer.register_auth_boundary(handler2)
+    await consumer.dispatchers["SampleEvent"](b'{"data": "hello"}', headers)
+
+    assert handler1.call_args.args[0].data == "hello"
+    assert handler1.call_args.kwargs == {}
+    assert handler2.call_args.args[0].data == "hello"
+    assert handler2.call_args.kwargs == {KAFKA_AUTH_HEADERS_PARAMETER: headers}
+
+
 @patch("spakky.plugins.kafka.event.consumer.Consumer")
 @patch("spakky.plugins.kafka.event.consumer.AdminClient")
 def test_sync_consumer_create_topics_expect_topics_created(
@@ -159,7 +210,7 @@ def test_sync_consumer_create_topics_expect_topics_created(
 ) -> None:
     """동기 consumer의 _create_topics가 존재하지 않는 토픽을 생성하는지 검증한다."""
     mock_admin = MagicMock()
-    mock_admin.list_topics.return_value.topics.keys.return_value = set()
+    mock_admin.list_topics.return_value.topics = {}
     mock_admin_cls.return_value = mock_admin
 
     consumer = KafkaEventConsumer(config)
@@ -180,7 +231,7 @@ def test_sync_consumer_initialize_expect_subscribe(
 ) -> None:
     """동기 consumer의 initialize가 토픽 생성 및 구독을 수행하는지 검증한다."""
     mock_admin = MagicMock()
-    mock_admin.list_topics.return_value.topics.keys.return_value = set()
+    mock_admin.list_topics.return_value.topics = {}
     mock_admin_cls.return_value = mock_admin
 
     mock_inner_consumer = MagicMock()
@@ -203,7 +254,7 @@ def test_sync_consumer_initialize_custom_event_name_expect_subscribe_to_event_na
 ) -> None:
     """Custom event_name topic을 생성하고 구독한다."""
     mock_admin = MagicMock()
-    mock_admin.list_topics.return_value.topics.keys.return_value = set()
+    mock_admin.list_topics.return_value.topics = {}
     mock_admin_cls.return_value = mock_admin
 
     mock_inner_consumer = MagicMock()
@@ -516,6 +567,7 @@ def test_async_consumer_register_auth_boundary_expect_handler_marked(
     consumer.register_auth_boundary(handler)
 
     assert handler in consumer._auth_boundary_handlers
+    assert "SampleEvent" in consumer.dispatchers
 
 
 @patch("spakky.plugins.kafka.event.consumer.AdminClient")
@@ -525,7 +577,7 @@ def test_async_consumer_create_topics_expect_topics_created(
 ) -> None:
     """비동기 consumer의 _create_topics가 존재하지 않는 토픽을 생성하는지 검증한다."""
     mock_admin = MagicMock()
-    mock_admin.list_topics.return_value.topics.keys.return_value = set()
+    mock_admin.list_topics.return_value.topics = {}
     mock_admin_cls.return_value = mock_admin
 
     consumer = AsyncKafkaEventConsumer(config)
@@ -544,7 +596,7 @@ async def test_async_consumer_initialize_async_expect_subscribe(
 ) -> None:
     """비동기 consumer의 initialize_async가 토픽 생성 및 구독을 수행하는지 검증한다."""
     mock_admin = MagicMock()
-    mock_admin.list_topics.return_value.topics.keys.return_value = set()
+    mock_admin.list_topics.return_value.topics = {}
     mock_admin_cls.return_value = mock_admin
 
     mock_aio_consumer = AsyncMock()
@@ -568,7 +620,7 @@ async def test_async_consumer_initialize_custom_event_name_expect_subscribe_to_e
 ) -> None:
     """Async consumer도 custom event_name topic을 생성하고 구독한다."""
     mock_admin = MagicMock()
-    mock_admin.list_topics.return_value.topics.keys.return_value = set()
+    mock_admin.list_topics.return_value.topics = {}
     mock_admin_cls.return_value = mock_admin
 
     mock_aio_consumer = AsyncMock()
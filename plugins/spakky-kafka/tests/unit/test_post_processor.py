@@ -4,6 +4,7 @@ Tests that the Kafka PostProcessor only registers IntegrationEvent handlers
 and correctly ignores DomainEvent handlers.
 """
 
+from logging import INFO, WARNING
 from unittest.mock import Mock
 
 from typing import override
@@ -100,6 +101,9 @@ def test_kafka_post_processor_registers_integration_event_expect_success() -> No
     mock_consumer.register.assert_called_once()
     call_args = mock_consumer.register.call_args
     assert call_args[0][0] == SampleIntegrationEvent
+    endpoint = call_args[0][1]
+    assert endpoint.__name__ == "handle_integration_event"
+    assert endpoint.__wrapped__ == handler_instance.handle_integration_event
 
 
 def test_kafka_post_processor_registers_async_integration_event_expect_success() -> (
@@ -141,6 +145,11 @@ def test_kafka_post_processor_registers_async_integration_event_expect_success()
     mock_async_consumer.register.assert_called_once()
     call_args = mock_async_consumer.register.call_args
     assert call_args[0][0] == SampleIntegrationEvent
+    endpoint = call_args[0][1]
+    assert endpoint.__name__ == "handle_integration_event"
+    assert (
+        endpoint.__qualname__ == handler_instance.handle_integration_event.__qualname__
+    )
 
 
 def test_kafka_post_processor_ignores_domain_event_expect_no_registration() -> None:
@@ -593,7 +602,7 @@ def test_kafka_post_processor_handler_with_non_decorated_method_expect_skip() ->
 def test_kafka_post_processor_with_tracing_available_expect_propagator_injected() -> (
     None
 ):
-    """tracing이 가용하면 consumer에 propagator가 주입됨을 검증한다."""
+    """tracing이 가용하면 사용하는 consumer에만 propagator가 주입됨을 검증한다."""
 
     @EventHandler()
     class SampleEventHandler:
@@ -624,7 +633,8 @@ def test_kafka_post_processor_with_tracing_available_expect_propagator_injected(
     post_processor.post_process(handler_instance)
 
     mock_consumer.set_propagator.assert_called_once_with(mock_propagator)
-    mock_async_consumer.set_propagator.assert_called_once_with(mock_propagator)
+    # 동기 핸들러만 있으므로 async consumer는 조회조차 하지 않는다
+    mock_async_consumer.set_propagator.assert_not_called()
 
 
 def test_kafka_post_processor_without_tracing_expect_no_propagator_injected() -> None:
@@ -696,3 +706,121 @@ def test_kafka_post_processor_with_tracing_but_no_set_propagator_expect_skipped(
 
     assert not hasattr(mock_consumer, "set_propagator")
     assert not hasattr(mock_async_consumer, "set_propagator")
+
+
+def test_kafka_post_processor_info_enabled_expect_route_logged(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """INFO가 켜져 있으면 등록된 route를 지연 포맷팅으로 기록함을 검증한다."""
+
+    @EventHandler()
+    class SampleEventHandler:
+        @on_event(SampleIntegrationEvent)
+        def handle_integration_event(self, event: SampleIntegrationEvent) -> None:
+            pass
+
+    mock_container = Mock()
+    mock_container.get.return_value = Mock(spec=IEventConsumer)
+    mock_container.get_or_none.return_value = None
+    mock_context = Mock(spec=ApplicationContext)
+    mock_context.get_or_none.return_value = None
+
+    post_processor = KafkaPostProcessor()
+    post_processor.set_container(mock_container)
+    post_processor.set_application_context(mock_context)
+    with caplog.at_level(INFO, logger="spakky.plugins.kafka.post_processor"):
+        post_processor.post_process(SampleEventHandler())
+
+    assert [record.getMessage() for record in caplog.records] == [
+        "[KafkaPostProcessor] SampleIntegrationEvent -> "
+        f"{SampleEventHandler.handle_integration_event.__qualname__}"
+    ]
+
+
+def test_kafka_post_processor_info_disabled_expect_no_route_log(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """INFO가 꺼져 있으면 route 로그를 남기지 않음을 검증한다."""
+
+    @EventHandler()
+    class SampleEventHandler:
+        @on_event(SampleIntegrationEvent)
+        def handle_integration_event(self, event: SampleIntegrationEvent) -> None:
+            pass
+
+    mock_container = Mock()
+    mock_container.get.return_value = Mock(spec=IEventConsumer)
+    mock_container.get_or_none.return_value = None
+    mock_context = Mock(spec=ApplicationContext)
+    mock_context.get_or_none.return_value = None
+
+    post_processor = KafkaPostProcessor()
+    post_processor.set_container(mock_container)
+    post_processor.set_application_context(mock_context)
+    with caplog.at_level(WARNING, logger="spakky.plugins.kafka.post_processor"):
+        post_processor.post_process(SampleEventHandler())
+
+    assert caplog.records == []
+
+
+def test_kafka_post_processor_sync_handlers_expect_async_consumer_never_resolved() -> (
+    None
+):
+    """동기 핸들러만 있으면 async consumer를 조회하지 않고 동기 consumer도 한 번만 조회함을 검증한다."""
+
+    @EventHandler()
+    class FirstEventHandler:
+        @on_event(SampleIntegrationEvent)
+        def handle_integration_event(self, event: SampleIntegrationEvent) -> None:
+            pass
+
+    @EventHandler()
+    class SecondEventHandler:
+        @on_event(SampleIntegrationEvent)
+        def handle_integration_event(self, event: SampleIntegrationEvent) -> None:
+            pass
+
+    mock_consumer = Mock(spec=IEventConsumer)
+    mock_container = Mock()
+    mock_container.get.return_value = mock_consumer
+    mock_context = Mock(spec=ApplicationContext)
+    mock_context.get_or_none.return_value = None
+
+    post_processor = KafkaPostProcessor()
+    post_processor.set_container(mock_container)
+    post_processor.set_application_context(mock_context)
+    post_processor.post_process(FirstEventHandler())
+    post_processor.post_process(SecondEventHandler())
+
+    mock_container.get.assert_called_once_with(IEventConsumer)
+    assert mock_consumer.register.call_count == 2
+
+
+def test_kafka_post_processor_async_handlers_expect_async_consumer_resolved_once() -> (
+    None
+):
+    """비동기 핸들러만 있으면 async consumer만 한 번 조회해 재사용함을 검증한다."""
+
+    @EventHandler()
+    class SampleEventHandler:
+        @on_event(SampleIntegrationEvent)
+        async def handle_first(self, event: SampleIntegrationEvent) -> None:
+            pass
+
+        @on_event(SampleIntegrationEvent)
+        async def handle_second(self, event: SampleIntegrationEvent) -> None:
+            pass
+
+    mock_async_consumer = Mock(spec=IAsyncEventConsumer)
+    mock_container = Mock()
+    mock_container.get.return_value = mock_async_consumer
+    mock_context = Mock(spec=ApplicationContext)
+    mock_context.get_or_none.return_value = None
+
+    post_processor = KafkaPostProcessor()
+    post_processor.set_container(mock_container)
+    post_processor.set_application_context(mock_context)
+    post_processor.post_process(SampleEventHandler())
+
+    mock_container.get.assert_called_once_with(IAsyncEventConsumer)
+    assert mock_async_consumer.register.call_count == 2
@@ -4,15 +4,25 @@ Tests send, topic creation, and delivery reporting
 for both synchronous and asynchronous Kafka event transports.
 """
 
+import asyncio
+import logging
+import threading
 from typing import Any
 from collections.abc import Generator
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from confluent_kafka import KafkaError, KafkaException
 
-from spakky.plugins.kafka.common.config import KafkaConnectionConfig
+from spakky.plugins.kafka.common.config import (
+    CompressionType,
+    KafkaConnectionConfig,
+    ProducerAcksType,
+)
 from spakky.plugins.kafka.event.transport import (
+    AIOKAFKA_CODEC_AVAILABILITY,
     AsyncKafkaEventTransport,
+    KafkaDeliveryStats,
     KafkaEventTransport,
 )
 
@@ -66,7 +76,7 @@ def test_sync_transport_create_topic_new_topic_expect_created(
 ) -> None:
     """동기 transport의 _create_topic이 새 토픽을 생성하는지 검증한다."""
     mock_admin = MagicMock()
-    mock_admin.list_topics.return_value.topics.keys.return_value = {"existing_topic"}
+    mock_admin.list_topics.return_value.topics = {"existing_topic": MagicMock()}
     mock_admin_cls.return_value = mock_admin
 
     transport = KafkaEventTransport(config)
@@ -84,7 +94,7 @@ def test_sync_transport_create_topic_existing_topic_expect_skipped(
 ) -> None:
     """동기 transport의 _create_topic이 기존 토픽 생성을 건너뛰는지 검증한다."""
     mock_admin = MagicMock()
-    mock_admin.list_topics.return_value.topics.keys.return_value = {"existing_topic"}
+    mock_admin.list_topics.return_value.topics = {"existing_topic": MagicMock()}
     mock_admin_cls.return_value = mock_admin
 
     transport = KafkaEventTransport(config)
@@ -93,14 +103,139 @@ def test_sync_transport_create_topic_existing_topic_expect_skipped(
     mock_admin.create_topics.assert_not_called()
 
 
+@patch("spakky.plugins.kafka.event.transport.Producer")
+@patch("spakky.plugins.kafka.event.transport.AdminClient")
+def test_sync_transport_create_topic_repeated_expect_metadata_fetched_once(
+    mock_admin_cls: MagicMock,
+    mock_producer_cls: MagicMock,
+    config: KafkaConnectionConfig,
+) -> None:
+    """같은 토픽으로 반복 호출해도 클러스터 토픽 목록은 한 번만 조회하는지 검증한다."""
+    mock_admin = MagicMock()
+    mock_admin.list_topics.return_value.topics = {}
+    mock_admin_cls.return_value = mock_admin
+
+    transport = KafkaEventTransport(config)
+    transport._create_topic("new_topic")
+    transport._create_topic("new_topic")
+
+    mock_admin.list_topics.assert_called_once_with(timeout=config.metadata_timeout)
+    mock_admin.create_topics.assert_called_once()
+
+
+@patch("spakky.plugins.kafka.event.transport.Producer")
+@patch("spakky.plugins.kafka.event.transport.AdminClient")
+def test_sync_transport_create_topic_expect_creation_awaited(
+    mock_admin_cls: MagicMock,
+    mock_producer_cls: MagicMock,
+    config: KafkaConnectionConfig,
+) -> None:
+    """토픽 생성 요청의 결과를 metadata_timeout 동안 기다린 뒤 알려진 토픽으로 기록하는지 검증한다."""
+    mock_admin = MagicMock()
+    mock_admin.list_topics.return_value.topics = {}
+    mock_admin_cls.return_value = mock_admin
+
+    transport = KafkaEventTransport(config)
+    transport._create_topic("new_topic")
+
+    future = mock_admin.create_topics.return_value["new_topic"]
+    future.result.assert_called_once_with(timeout=config.metadata_timeout)
+    assert "new_topic" in transport._known_topics
+
+
+@patch("spakky.plugins.kafka.event.transport.Producer")
+@patch("spakky.plugins.kafka.event.transport.AdminClient")
+def test_sync_transport_create_topic_already_exists_expect_known(
+    mock_admin_cls: MagicMock,
+    mock_producer_cls: MagicMock,
+    config: KafkaConnectionConfig,
+) -> None:
+    """다른 producer가 먼저 만든 토픽(TOPIC_ALREADY_EXISTS)은 생성 성공으로 취급하는지 검증한다."""
+    mock_admin = MagicMock()
+    mock_admin.list_topics.return_value.topics = {}
+    mock_admin.create_topics.return_value = {
+        "new_topic": MagicMock(
+            result=MagicMock(
+                side_effect=KafkaException(KafkaError(KafkaError.TOPIC_ALREADY_EXISTS))
+            )
+        )
+    }
+    mock_admin_cls.return_value = mock_admin
+
+    transport = KafkaEventTransport(config)
+    transport._create_topic("new_topic")
+    transport._create_topic("new_topic")
+
+    mock_admin.list_topics.assert_called_once()
+
+
+@patch("spakky.plugins.kafka.event.transport.Producer")
+@patch("spakky.plugins.kafka.event.transport.AdminClient")
+def test_sync_transport_create_topic_failed_expect_rechecked_on_next_send(
+    mock_admin_cls: MagicMock,
+    mock_producer_cls: MagicMock,
+    config: KafkaConnectionConfig,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """토픽 생성이 실패하면 경고를 남기고 다음 호출에서 다시 확인하는지 검증한다."""
+    mock_admin = MagicMock()
+    mock_admin.list_topics.return_value.topics = {}
+    mock_admin.create_topics.return_value = {
+        "new_topic": MagicMock(
+            result=MagicMock(
+                side_effect=KafkaException(KafkaError(KafkaError.POLICY_VIOLATION))
+            )
+        )
+    }
+    mock_admin_cls.return_value = mock_admin
+
+    transport = KafkaEventTransport(config)
+    with caplog.at_level(
+        logging.WARNING, logger="spakky.plugins.kafka.event.transport"
+    ):
+        transport._create_topic("new_topic")
+    transport._create_topic("new_topic")
+
+    assert "Failed to create Kafka topic new_topic" in caplog.text
+    assert "new_topic" not in transport._known_topics
+    assert mock_admin.list_topics.call_count == 2
+
+
+@patch("spakky.plugins.kafka.event.transport.Producer")
+@patch("spakky.plugins.kafka.event.transport.AdminClient")
+def test_sync_transport_create_topic_timed_out_expect_rechecked_on_next_send(
+    mock_admin_cls: MagicMock,
+    mock_producer_cls: MagicMock,
+    config: KafkaConnectionConfig,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """토픽 생성이 제한 시간 안에 끝나지 않으면 알려진 토픽으로 기록하지 않는지 검증한다."""
+    mock_admin = MagicMock()
+    mock_admin.list_topics.return_value.topics = {}
+    mock_admin.create_topics.return_value = {
+        "new_topic": MagicMock(result=MagicMock(side_effect=TimeoutError()))
+    }
+    mock_admin_cls.return_value = mock_admin
+
+    transport = KafkaEventTransport(config)
+    with caplog.at_level(
+        logging.WARNING, logger="spakky.plugins.kafka.event.transport"
+    ):
+        transport._create_topic("new_topic")
+
+    assert "Timed out creating Kafka topic new_topic" in caplog.text
+    assert "new_topic" not in transport._known_topics
+
+
 @patch("spakky.plugins.kafka.event.transport.Producer")
 @patch("spakky.plugins.kafka.event.transport.AdminClient")
 def test_sync_transport_message_delivery_report_success_expect_log(
     mock_admin_cls: MagicMock,
     mock_producer_cls: MagicMock,
     config: KafkaConnectionConfig,
+    caplog: pytest.LogCaptureFixture,
 ) -> None:
-    """동기 transport의 delivery report가 성공 시 로그를 출력하는지 검증한다."""
+    """동기 transport의 delivery report가 성공 시 debug 로그를 출력하는지 검증한다."""
     transport = KafkaEventTransport(config)
 
     mock_message = MagicMock()
@@ -108,20 +243,41 @@ def test_sync_transport_message_delivery_report_success_expect_log(
     mock_message.partition.return_value = 0
     mock_message.offset.return_value = 42
 
-    # Should not raise
-    transport._message_delivery_report(None, mock_message)
+    with caplog.at_level(logging.DEBUG, logger="spakky.plugins.kafka.event.transport"):
+        transport._message_delivery_report(None, mock_message)
+
+    assert "Message delivered to test_topic [0] at offset 42" in caplog.text
 
 
 @patch("spakky.plugins.kafka.event.transport.Producer")
 @patch("spakky.plugins.kafka.event.transport.AdminClient")
-def test_sync_transport_send_expect_produce_and_flush(
+def test_sync_transport_message_delivery_report_debug_disabled_expect_message_untouched(
     mock_admin_cls: MagicMock,
     mock_producer_cls: MagicMock,
     config: KafkaConnectionConfig,
+    caplog: pytest.LogCaptureFixture,
 ) -> None:
-    """동기 transport의 send가 produce, poll, flush를 호출하는지 검증한다."""
+    """DEBUG 로그가 꺼져 있으면 delivery report가 메시지 메타데이터를 조회하지 않는지 검증한다."""
+    transport = KafkaEventTransport(config)
+    mock_message = MagicMock()
+
+    with caplog.at_level(logging.INFO, logger="spakky.plugins.kafka.event.transport"):
+        transport._message_delivery_report(None, mock_message)
+
+    mock_message.topic.assert_not_called()
+    assert caplog.text == ""
+
+
+@patch("spakky.plugins.kafka.event.transport.Producer")
+@patch("spakky.plugins.kafka.event.transport.AdminClient")
+def test_sync_transport_send_expect_produce_without_flush(
+    mock_admin_cls: MagicMock,
+    mock_producer_cls: MagicMock,
+    config: KafkaConnectionConfig,
+) -> None:
+    """동기 transport의 send가 메시지마다 flush나 poll 없이 produce만 호출하는지 검증한다."""
     mock_admin = MagicMock()
-    mock_admin.list_topics.return_value.topics.keys.return_value = set()
+    mock_admin.list_topics.return_value.topics = {}
     mock_admin_cls.return_value = mock_admin
 
     mock_producer = MagicMock()
@@ -134,10 +290,157 @@ def test_sync_transport_send_expect_produce_and_flush(
         topic="TestEvent",
         value=b'{"key": "value"}',
         headers={},
-        callback=transport._message_delivery_report,
     )
+    mock_producer.poll.assert_not_called()
+    mock_producer.flush.assert_not_called()
+
+
+@patch("spakky.plugins.kafka.event.transport.Producer")
+@patch("spakky.plugins.kafka.event.transport.AdminClient")
+def test_sync_transport_send_poll_interval_reached_expect_single_poll(
+    mock_admin_cls: MagicMock,
+    mock_producer_cls: MagicMock,
+    config: KafkaConnectionConfig,
+) -> None:
+    """poll_interval_messages만큼 send한 시점에만 poll(0)을 호출하는지 검증한다."""
+    mock_admin = MagicMock()
+    mock_admin.list_topics.return_value.topics = {}
+    mock_admin_cls.return_value = mock_admin
+
+    mock_producer = MagicMock()
+    mock_producer_cls.return_value = mock_producer
+
+    config.poll_interval_messages = 3
+    transport = KafkaEventTransport(config)
+    for _ in range(4):
+        transport.send("TestEvent", b"{}", {})
+
     mock_producer.poll.assert_called_once_with(0)
-    mock_producer.flush.assert_called_once()
+    assert transport._unpolled_sends == 1
+
+
+@patch("spakky.plugins.kafka.event.transport.Producer")
+@patch("spakky.plugins.kafka.event.transport.AdminClient")
+def test_sync_transport_send_with_delivery_logging_expect_callback_registered(
+    mock_admin_cls: MagicMock,
+    mock_producer_cls: MagicMock,
+    config: KafkaConnectionConfig,
+) -> None:
+    """enable_delivery_logging이 켜져 있으면 produce에 delivery report callback을 넘기는지 검증한다."""
+    mock_admin = MagicMock()
+    mock_admin.list_topics.return_value.topics = {}
+    mock_admin_cls.return_value = mock_admin
+
+    mock_producer = MagicMock()
+    mock_producer_cls.return_value = mock_producer
+
+    config.enable_delivery_logging = True
+    transport = KafkaEventTransport(config)
+    transport.send("TestEvent", b'{"key": "value"}', {})
+
+    mock_producer.produce.assert_called_once_with(
+        topic="TestEvent",
+        value=b'{"key": "value"}',
+        headers={},
+        callback=transport._message_delivery_report,
+    )
+
+
+@patch("spakky.plugins.kafka.event.transport.Producer")
+@patch("spakky.plugins.kafka.event.transport.AdminClient")
+def test_sync_transport_stop_expect_flush_with_timeout(
+    mock_admin_cls: MagicMock,
+    mock_producer_cls: MagicMock,
+    config: KafkaConnectionConfig,
+) -> None:
+    """동기 transport가 종료 시 설정된 timeout으로 한 번만 flush하는지 검증한다."""
+    mock_producer = MagicMock()
+    mock_producer.flush.return_value = 0
+    mock_producer_cls.return_value = mock_producer
+
+    transport = KafkaEventTransport(config)
+    transport.set_stop_event(threading.Event())
+    transport.start()
+    transport.stop()
+
+    mock_producer.flush.assert_called_once_with(config.flush_timeout)
+
+
+@patch("spakky.plugins.kafka.event.transport.Producer")
+@patch("spakky.plugins.kafka.event.transport.AdminClient")
+def test_sync_transport_message_delivery_report_expect_stats_aggregated(
+    mock_admin_cls: MagicMock,
+    mock_producer_cls: MagicMock,
+    config: KafkaConnectionConfig,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """delivery report가 성공·실패 건수를 집계하고 실패만 개별 error 로그로 남기는지 검증한다."""
+    config.enable_delivery_logging = True
+    transport = KafkaEventTransport(config)
+
+    with caplog.at_level(logging.INFO, logger="spakky.plugins.kafka.event.transport"):
+        transport._message_delivery_report(None, MagicMock())
+        transport._message_delivery_report(None, MagicMock())
+        transport._message_delivery_report(MagicMock(), MagicMock())
+
+    assert transport.delivery_stats() == KafkaDeliveryStats(delivered=2, failed=1)
+    assert [record.levelname for record in caplog.records] == ["ERROR"]
+
+
+@patch("spakky.plugins.kafka.event.transport.Producer")
+@patch("spakky.plugins.kafka.event.transport.AdminClient")
+def test_sync_transport_delivery_stats_without_delivery_logging_expect_none(
+    mock_admin_cls: MagicMock,
+    mock_producer_cls: MagicMock,
+    config: KafkaConnectionConfig,
+) -> None:
+    """delivery report를 수집하지 않는 기본 설정에서는 집계 대신 None을 반환하는지 검증한다."""
+    transport = KafkaEventTransport(config)
+    transport.send("TestEvent", b"{}", {})
+
+    assert transport.delivery_stats() is None
+
+
+@patch("spakky.plugins.kafka.event.transport.Producer")
+@patch("spakky.plugins.kafka.event.transport.AdminClient")
+def test_sync_transport_stop_with_delivery_logging_expect_summary_logged(
+    mock_admin_cls: MagicMock,
+    mock_producer_cls: MagicMock,
+    config: KafkaConnectionConfig,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """delivery logging이 켜져 있으면 종료 시 집계된 delivery report 요약을 한 번 남기는지 검증한다."""
+    mock_producer = MagicMock()
+    mock_producer.flush.return_value = 0
+    mock_producer_cls.return_value = mock_producer
+    config.enable_delivery_logging = True
+
+    transport = KafkaEventTransport(config)
+    transport._message_delivery_report(None, MagicMock())
+    with caplog.at_level(logging.INFO, logger="spakky.plugins.kafka.event.transport"):
+        transport.stop()
+
+    assert "Kafka delivery reports: 1 delivered, 0 failed" in caplog.text
+
+
+@patch("spakky.plugins.kafka.event.transport.Producer")
+@patch("spakky.plugins.kafka.event.transport.AdminClient")
+def test_sync_transport_stop_with_undelivered_messages_expect_warning(
+    mock_admin_cls: MagicMock,
+    mock_producer_cls: MagicMock,
+    config: KafkaConnectionConfig,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """종료 시 flush 후에도 남은 메시지가 있으면 경고 로그를 남기는지 검증한다."""
+    mock_producer = MagicMock()
+    mock_producer.flush.return_value = 2
+    mock_producer_cls.return_value = mock_producer
+
+    transport = KafkaEventTransport(config)
+    with caplog.at_level(logging.WARNING):
+        transport.stop()
+
+    assert "2 Kafka messages were not delivered" in caplog.text
 
 
 @patch("spakky.plugins.kafka.event.transport.AdminClient")
@@ -155,31 +458,240 @@ def test_async_transport_init_expect_success(
 @pytest.mark.asyncio
 @patch("spakky.plugins.kafka.event.transport.AIOKafkaProducer")
 @patch("spakky.plugins.kafka.event.transport.AdminClient")
-async def test_async_transport_send_expect_produce_and_flush(
+async def test_async_transport_send_expect_producer_reused(
     mock_admin_cls: MagicMock,
     mock_aio_producer_cls: MagicMock,
     config: KafkaConnectionConfig,
 ) -> None:
-    """비동기 transport의 send가 AIOKafkaProducer를 통해 메시지를 전송하는지 검증한다."""
+    """비동기 transport가 AIOKafkaProducer를 한 번만 시작해 재사용하고 stop 시 종료하는지 검증한다."""
     mock_admin = MagicMock()
-    mock_admin.list_topics.return_value.topics.keys.return_value = set()
+    mock_admin.list_topics.return_value.topics = {}
     mock_admin_cls.return_value = mock_admin
 
     mock_producer = AsyncMock()
     mock_aio_producer_cls.return_value = mock_producer
 
     transport = AsyncKafkaEventTransport(config)
-    await transport.send(
-        "TestEvent", b'{"key": "value"}', {"traceparent": "00-abc-def-01"}
-    )
-
-    mock_aio_producer_cls.assert_called_once_with(
-        bootstrap_servers=config.bootstrap_servers,
-    )
+    transport.set_stop_event(asyncio.Event())
+    await transport.start_async()
+    for _ in range(2):
+        await transport.send(
+            "TestEvent", b'{"key": "value"}', {"traceparent": "00-abc-def-01"}
+        )
+
+    mock_aio_producer_cls.assert_called_once()
     mock_producer.start.assert_awaited_once()
-    mock_producer.send_and_wait.assert_awaited_once_with(
+    assert mock_producer.send_and_wait.await_count == 2
+    mock_producer.send_and_wait.assert_awaited_with(
         topic="TestEvent",
         value=b'{"key": "value"}',
         headers=[("traceparent", b"00-abc-def-01")],
     )
+    mock_producer.stop.assert_not_awaited()
+
+    await transport.stop_async()
+
     mock_producer.stop.assert_awaited_once()
+
+
+@patch("spakky.plugins.kafka.event.transport.AIOKafkaProducer")
+@patch("spakky.plugins.kafka.event.transport.AdminClient")
+def test_async_transport_send_from_other_loop_expect_short_lived_producer(
+    mock_admin_cls: MagicMock,
+    mock_aio_producer_cls: MagicMock,
+    config: KafkaConnectionConfig,
+) -> None:
+    """처음 발행한 event loop가 아닌 곳에서는 일회성 producer를 사용하는지 검증한다."""
+    mock_admin = MagicMock()
+    mock_admin.list_topics.return_value.topics = {}
+    mock_admin_cls.return_value = mock_admin
+
+    reused_producer = AsyncMock()
+    short_lived_producer = AsyncMock()
+    mock_aio_producer_cls.side_effect = [reused_producer, short_lived_producer]
+
+    transport = AsyncKafkaEventTransport(config)
+    asyncio.run(transport.send("TestEvent", b"{}", {}))
+    asyncio.run(transport.send("TestEvent", b"{}", {}))
+    asyncio.run(transport.stop_async())
+
+    reused_producer.stop.assert_not_awaited()
+    short_lived_producer.send_and_wait.assert_awaited_once()
+    short_lived_producer.stop.assert_awaited_once()
+
+
+@pytest.mark.parametrize(
+    ("compression_type", "codec_available", "expected"),
+    [
+        (CompressionType.NONE, True, None),
+        (CompressionType.GZIP, True, "gzip"),
+        (CompressionType.LZ4, False, None),
+    ],
+)
+@patch("spakky.plugins.kafka.event.transport.AIOKafkaProducer")
+@patch("spakky.plugins.kafka.event.transport.AdminClient")
+def test_async_transport_create_producer_expect_batching_options(
+    mock_admin_cls: MagicMock,
+    mock_aio_producer_cls: MagicMock,
+    config: KafkaConnectionConfig,
+    monkeypatch: pytest.MonkeyPatch,
+    compression_type: CompressionType,
+    codec_available: bool,
+    expected: str | None,
+) -> None:
+    """비동기 producer가 batching 설정을 받고, 사용할 수 없는 codec은 압축 없이 동작하는지 검증한다."""
+    config.async_compression_type = compression_type
+    config.acks = ProducerAcksType.LEADER
+    monkeypatch.setitem(
+        AIOKAFKA_CODEC_AVAILABILITY, compression_type, lambda: codec_available
+    )
+
+    AsyncKafkaEventTransport(config)._create_producer()
+
+    mock_aio_producer_cls.assert_called_once_with(
+        bootstrap_servers=config.bootstrap_servers,
+        linger_ms=config.async_linger_ms,
+        max_batch_size=config.batch_size,
+        compression_type=expected,
+        acks=1,
+        enable_idempotence=False,
+    )
+
+
+@patch("spakky.plugins.kafka.event.transport.AIOKafkaProducer")
+@patch("spakky.plugins.kafka.event.transport.AdminClient")
+def test_async_transport_unavailable_codec_expect_warned_once(
+    mock_admin_cls: MagicMock,
+    mock_aio_producer_cls: MagicMock,
+    config: KafkaConnectionConfig,
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """사용할 수 없는 codec은 transport 생성 시 한 번만 확인하고 producer마다 경고를 반복하지 않는지 검증한다."""
+    config.async_compression_type = CompressionType.LZ4
+    codec_probe = MagicMock(return_value=False)
+    monkeypatch.setitem(AIOKAFKA_CODEC_AVAILABILITY, CompressionType.LZ4, codec_probe)
+
+    with caplog.at_level(
+        logging.WARNING, logger="spakky.plugins.kafka.event.transport"
+    ):
+        transport = AsyncKafkaEventTransport(config)
+        transport._create_producer()
+        transport._create_producer()
+
+    codec_probe.assert_called_once_with()
+    assert len(caplog.records) == 1
+
+
+@patch("spakky.plugins.kafka.event.transport.Producer")
+@patch("spakky.plugins.kafka.event.transport.AdminClient")
+def test_sync_transport_send_many_expect_single_poll(
+    mock_admin_cls: MagicMock,
+    mock_producer_cls: MagicMock,
+    config: KafkaConnectionConfig,
+) -> None:
+    """동기 transport의 send_many가 메시지를 모두 produce한 뒤 poll을 한 번만 호출하는지 검증한다."""
+    mock_admin = MagicMock()
+    mock_admin.list_topics.return_value.topics = {}
+    mock_admin_cls.return_value = mock_admin
+
+    mock_producer = MagicMock()
+    mock_producer_cls.return_value = mock_producer
+
+    transport = KafkaEventTransport(config)
+    transport.send_many([("TestEvent", b"1", {}), ("OtherEvent", b"2", {})])
+
+    assert [call.kwargs["topic"] for call in mock_producer.produce.call_args_list] == [
+        "TestEvent",
+        "OtherEvent",
+    ]
+    mock_producer.poll.assert_called_once_with(0)
+
+
+@pytest.mark.asyncio
+@patch("spakky.plugins.kafka.event.transport.AIOKafkaProducer")
+@patch("spakky.plugins.kafka.event.transport.AdminClient")
+async def test_async_transport_send_new_topic_expect_event_loop_not_blocked(
+    mock_admin_cls: MagicMock,
+    mock_aio_producer_cls: MagicMock,
+    config: KafkaConnectionConfig,
+) -> None:
+    """새 토픽 생성을 위한 admin 호출이 event loop 밖에서 실행되어 다른 작업이 계속 진행되는지 검증한다."""
+    topic_lookup_started = threading.Event()
+    release_topic_lookup = threading.Event()
+
+    def list_topics(timeout: float) -> MagicMock:
+        topic_lookup_started.set()
+        release_topic_lookup.wait(timeout=5)
+        return MagicMock(topics={})
+
+    mock_admin = MagicMock()
+    mock_admin.list_topics.side_effect = list_topics
+    mock_admin_cls.return_value = mock_admin
+    mock_aio_producer_cls.return_value = AsyncMock()
+
+    transport = AsyncKafkaEventTransport(config)
+    send = asyncio.create_task(transport.send("TestEvent", b"{}", {}))
+    while not topic_lookup_started.is_set():
+        await asyncio.sleep(0.01)
+
+    # The loop still runs other coroutines while the admin call is pending.
+    await asyncio.sleep(0)
+    assert not send.done()
+
+    release_topic_lookup.set()
+    await send
+
+    assert "TestEvent" in transport._known_topics
+    mock_aio_producer_cls.return_value.send_and_wait.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@patch("spakky.plugins.kafka.event.transport.AIOKafkaProducer")
+@patch("spakky.plugins.kafka.event.transport.AdminClient")
+async def test_async_transport_send_many_expect_deliveries_awaited_together(
+    mock_admin_cls: MagicMock,
+    mock_aio_producer_cls: MagicMock,
+    config: KafkaConnectionConfig,
+) -> None:
+    """비동기 transport의 send_many가 모든 메시지를 enqueue한 뒤 전달 결과를 함께 기다리는지 검증한다."""
+    mock_admin = MagicMock()
+    mock_admin.list_topics.return_value.topics = {}
+    mock_admin_cls.return_value = mock_admin
+
+    loop = asyncio.get_running_loop()
+    deliveries = [loop.create_future(), loop.create_future()]
+    mock_producer = AsyncMock()
+    mock_producer.send.side_effect = deliveries
+    mock_aio_producer_cls.return_value = mock_producer
+
+    transport = AsyncKafkaEventTransport(config)
+    for delivery in deliveries:
+        delivery.set_result(None)
+    await transport.send_many(
+        [("TestEvent", b"1", {"traceparent": "00-abc-def-01"}), ("TestEvent", b"2", {})]
+    )
+
+    assert mock_producer.send.await_count == 2
+    mock_producer.send.assert_awaited_with(topic="TestEvent", value=b"2", headers=[])
+    mock_producer.send_and_wait.assert_not_awaited()
+
+
+@patch("spakky.plugins.kafka.event.transport.AIOKafkaProducer")
+@patch("spakky.plugins.kafka.event.transport.AdminClient")
+def test_async_transport_send_many_from_other_loop_expect_sent_one_by_one(
+    mock_admin_cls: MagicMock,
+    mock_aio_producer_cls: MagicMock,
+    config: KafkaConnectionConfig,
+) -> None:
+    """처음 발행한 event loop가 아닌 곳의 send_many는 메시지를 하나씩 전송하는지 검증한다."""
+    mock_admin = MagicMock()
+    mock_admin.list_topics.return_value.topics = {}
+    mock_admin_cls.return_value = mock_admin
+    mock_aio_producer_cls.return_value = AsyncMock()
+
+    transport = AsyncKafkaEventTransport(config)
+    asyncio.run(transport.send("TestEvent", b"{}", {}))
+    asyncio.run(transport.send_many([("TestEvent", b"1", {}), ("TestEvent", b"2", {})]))
+
+    assert mock_aio_producer_cls.return_value.send_and_wait.await_count == 3
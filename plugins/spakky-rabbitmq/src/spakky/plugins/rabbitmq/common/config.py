@@ -79,6 +79,12 @@ class RabbitMQConnectionConfig(BaseSettings):
     malformed_payload_action: RabbitMQAuthFailureAction = RabbitMQAuthFailureAction.ACK
     """Message action for malformed payloads that cannot be deserialized."""
 
+    prefetch_count: int = 100
+    """Unacknowledged messages the broker may push to each consumer (0 = unlimited)."""
+
+    confirm_batch_size: int = 64
+    """Publisher confirms the async transport awaits together when batch publishing."""
+
     @property
     def protocol(self) -> str:
         """Determine protocol based on SSL usage.
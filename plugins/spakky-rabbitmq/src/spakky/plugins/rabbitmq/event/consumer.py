@@ -5,7 +5,7 @@ services, consuming integration events from RabbitMQ queues and dispatching them
 to registered handlers.
 """
 
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 from typing import Any, cast
 
 from typing import override
@@ -33,6 +33,7 @@ from spakky.event.event_consumer import (
     IAsyncEventConsumer,
     IEventConsumer,
 )
+from spakky.event.serialization import event_type_adapter
 from spakky.auth import (
     AuthRequirementDeniedError,
     AuthorizationDecisionState,
@@ -80,11 +81,15 @@ class RabbitMQEventConsumer(IEventConsumer, AbstractBackgroundService):
     handlers: dict[type[AbstractEvent], list[EventHandlerCallback[Any]]]
     connection: BlockingConnection
     channel: BlockingChannel
+    _routes: dict[
+        str, tuple[TypeAdapter[AbstractEvent], list[EventHandlerCallback[Any]]]
+    ]
     _propagator: ITracePropagator | None
     _auth_challenge_action: RabbitMQAuthFailureAction
     _auth_deny_action: RabbitMQAuthFailureAction
     _auth_error_action: RabbitMQAuthFailureAction
     _malformed_payload_action: RabbitMQAuthFailureAction
+    _prefetch_count: int
 
     def __init__(self, config: RabbitMQConnectionConfig) -> None:
         """Initialize the synchronous RabbitMQ event consumer.
@@ -97,11 +102,13 @@ class RabbitMQEventConsumer(IEventConsumer, AbstractBackgroundService):
         self.type_lookup = {}
         self.type_adapters = {}
         self.handlers = {}
+        self._routes = {}
         self._propagator = None
         self._auth_challenge_action = config.auth_challenge_action
         self._auth_deny_action = config.auth_deny_action
         self._auth_error_action = config.auth_error_action
         self._malformed_payload_action = config.malformed_payload_action
+        self._prefetch_count = config.prefetch_count
 
     def set_propagator(self, propagator: ITracePropagator) -> None:
         """Set the trace propagator for extracting trace context from messages.
@@ -135,6 +142,19 @@ class RabbitMQEventConsumer(IEventConsumer, AbstractBackgroundService):
                 result[key] = value.decode()
         return result
 
+    def _route(
+        self, consumer_tag: str
+    ) -> tuple[TypeAdapter[AbstractEvent], list[EventHandlerCallback[Any]]]:
+        # Consumer tags are resolved to their adapter and handler list once,
+        # replacing three dict lookups per message with one. The handler list
+        # is shared, so handlers registered later are still dispatched.
+        route = self._routes.get(consumer_tag)
+        if route is None:
+            event_type = self.type_lookup[consumer_tag]
+            route = (self.type_adapters[event_type], self.handlers[event_type])
+            self._routes[consumer_tag] = route
+        return route
+
     def _route_event_handler(
         self,
         channel: BlockingChannel,
@@ -156,9 +176,7 @@ class RabbitMQEventConsumer(IEventConsumer, AbstractBackgroundService):
             TraceContext.set(ctx)
         token = set_current_rabbitmq_message_headers(carrier)
         try:
-            event_type = self.type_lookup[method_frame.consumer_tag]
-            handlers = self.handlers[event_type]
-            type_adapter = self.type_adapters[event_type]
+            type_adapter, handlers = self._route(method_frame.consumer_tag)
             event = type_adapter.validate_json(body)
             for handler in handlers:
                 handler(event)
@@ -237,22 +255,47 @@ class RabbitMQEventConsumer(IEventConsumer, AbstractBackgroundService):
         """
         if event not in self.handlers:
             self.handlers[event] = []
-            self.type_adapters[event] = cast(
-                TypeAdapter[AbstractEvent], TypeAdapter(event)
-            )
+            self.type_adapters[event] = event_type_adapter(event)
         self.handlers[event].append(handler)
 
+    @override
+    def register_many(
+        self,
+        routes: Iterable[tuple[type[AbstractEvent], EventHandlerCallback[Any]]],
+    ) -> None:
+        """Register all routes of one handler class in a single pass.
+
+        Handlers are grouped by event type first, so each handler list is
+        extended and each type adapter looked up once per batch.
+
+        Args:
+            routes: ``(event type, handler)`` pairs in registration order.
+        """
+        grouped: dict[type[AbstractEvent], list[EventHandlerCallback[Any]]] = {}
+        for event, handler in routes:
+            grouped.setdefault(event, []).append(handler)
+        for event, handlers in grouped.items():
+            if event not in self.handlers:
+                self.handlers[event] = []
+                self.type_adapters[event] = event_type_adapter(event)
+            self.handlers[event].extend(handlers)
+
     @override
     def initialize(self) -> None:
         """Initialize RabbitMQ connection and declare queues.
 
-        Establishes connection to RabbitMQ, creates a channel, and sets up
+        Establishes connection to RabbitMQ, creates a channel limited to
+        ``prefetch_count`` unacknowledged deliveries per consumer, and sets up
         queue consumers for all registered event handlers.
         """
         self.connection = BlockingConnection(
             parameters=URLParameters(self.connection_string)
         )
         self.channel = self.connection.channel()
+        # Bound per-consumer in-flight deliveries so the broker cannot push a
+        # whole backlog into this process at once.
+        self.channel.basic_qos(prefetch_count=self._prefetch_count)
+        self._routes.clear()
 
         for event_type in self.handlers:
             routing_name = _event_routing_name(event_type)
@@ -304,11 +347,15 @@ class AsyncRabbitMQEventConsumer(IAsyncEventConsumer, AbstractAsyncBackgroundSer
     type_adapters: dict[type, TypeAdapter[AbstractEvent]]
     handlers: dict[type[AbstractEvent], list[AsyncEventHandlerCallback[Any]]]
     connection: AbstractRobustConnection
+    _routes: dict[
+        str, tuple[TypeAdapter[AbstractEvent], list[AsyncEventHandlerCallback[Any]]]
+    ]
     _propagator: ITracePropagator | None
     _auth_challenge_action: RabbitMQAuthFailureAction
     _auth_deny_action: RabbitMQAuthFailureAction
     _auth_error_action: RabbitMQAuthFailureAction
     _malformed_payload_action: RabbitMQAuthFailureAction
+    _prefetch_count: int
 
     def __init__(self, config: RabbitMQConnectionConfig) -> None:
         """Initialize the asynchronous RabbitMQ event consumer.
@@ -320,11 +367,13 @@ class AsyncRabbitMQEventConsumer(IAsyncEventConsumer, AbstractAsyncBackgroundSer
         self.type_lookup = {}
         self.type_adapters = {}
         self.handlers = {}
+        self._routes = {}
         self._propagator = None
         self._auth_challenge_action = config.auth_challenge_action
         self._auth_deny_action = config.auth_deny_action
         self._auth_error_action = config.auth_error_action
         self._malformed_payload_action = config.malformed_payload_action
+        self._prefetch_count = config.prefetch_count
 
     def set_propagator(self, propagator: ITracePropagator) -> None:
         """Set the trace propagator for extracting trace context from messages.
@@ -358,6 +407,19 @@ class AsyncRabbitMQEventConsumer(IAsyncEventConsumer, AbstractAsyncBackgroundSer
                 result[key] = value.decode()
         return result
 
+    def _route(
+        self, consumer_tag: str
+    ) -> tuple[TypeAdapter[AbstractEvent], list[AsyncEventHandlerCallback[Any]]]:
+        # Consumer tags are resolved to their adapter and handler list once,
+        # replacing three dict lookups per message with one. The handler list
+        # is shared, so handlers registered later are still dispatched.
+        route = self._routes.get(consumer_tag)
+        if route is None:
+            event_type = self.type_lookup[consumer_tag]
+            route = (self.type_adapters[event_type], self.handlers[event_type])
+            self._routes[consumer_tag] = route
+        return route
+
     async def _route_event_handler(self, message: AbstractIncomingMessage) -> None:
         """Route an incoming AMQP message to registered async event handlers.
 
@@ -373,9 +435,7 @@ class AsyncRabbitMQEventConsumer(IAsyncEventConsumer, AbstractAsyncBackgroundSer
             TraceContext.set(ctx)
         token = set_current_rabbitmq_message_headers(carrier)
         try:
-            event_type = self.type_lookup[message.consumer_tag]
-            handlers = self.handlers[event_type]
-            type_adapter = self.type_adapters[event_type]
+            type_adapter, handlers = self._route(message.consumer_tag)
             event = type_adapter.validate_json(message.body)
             for handler in handlers:
                 await handler(event)
@@ -446,20 +506,43 @@ class AsyncRabbitMQEventConsumer(IAsyncEventConsumer, AbstractAsyncBackgroundSer
         """
         if event not in self.handlers:
             self.handlers[event] = []
-            self.type_adapters[event] = cast(
-                TypeAdapter[AbstractEvent], TypeAdapter(event)
-            )
+            self.type_adapters[event] = event_type_adapter(event)
         self.handlers[event].append(handler)
 
+    @override
+    def register_many(
+        self,
+        routes: Iterable[tuple[type[AbstractEvent], AsyncEventHandlerCallback[Any]]],
+    ) -> None:
+        """Register all routes of one handler class in a single pass.
+
+        Handlers are grouped by event type first, so each handler list is
+        extended and each type adapter looked up once per batch.
+
+        Args:
+            routes: ``(event type, handler)`` pairs in registration order.
+        """
+        grouped: dict[type[AbstractEvent], list[AsyncEventHandlerCallback[Any]]] = {}
+        for event, handler in routes:
+            grouped.setdefault(event, []).append(handler)
+        for event, handlers in grouped.items():
+            if event not in self.handlers:
+                self.handlers[event] = []
+                self.type_adapters[event] = event_type_adapter(event)
+            self.handlers[event].extend(handlers)
+
     @override
     async def initialize_async(self) -> None:
         """Initialize async RabbitMQ connection and declare queues.
 
-        Establishes robust connection to RabbitMQ, creates a channel, and sets
-        up queue consumers for all registered async event handlers.
+        Establishes robust connection to RabbitMQ, creates a channel limited to
+        ``prefetch_count`` unacknowledged deliveries per consumer, and sets up
+        queue consumers for all registered async event handlers.
         """
         self.connection = await connect_robust(self.connection_string)
         self.channel = await self.connection.channel()
+        await self.channel.set_qos(prefetch_count=self._prefetch_count)
+        self._routes.clear()
 
         for event_type in self.handlers:
             routing_name = _event_routing_name(event_type)
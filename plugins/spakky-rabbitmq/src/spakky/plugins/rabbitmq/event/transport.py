@@ -4,14 +4,34 @@ Provides synchronous and asynchronous event transports that send integration
 events to RabbitMQ queues with optional exchange routing.
 """
 
+import threading
+from asyncio import (
+    AbstractEventLoop,
+    Future,
+    Lock,
+    ensure_future,
+    gather,
+    get_running_loop,
+    locks,
+)
+from collections.abc import Iterable
+
 from aio_pika import (  # type: ignore[import-untyped]  # aio_pika lacks type stubs
     Message,
     connect_robust,
 )
+from aio_pika.abc import (
+    AbstractChannel,
+    AbstractExchange,
+    AbstractRobustConnection,
+)
 from pika import BasicProperties, BlockingConnection, URLParameters
+from pika.adapters.blocking_connection import BlockingChannel
+from pika.exceptions import AMQPError
 from typing import override
 
 from spakky.core.pod.annotations.pod import Pod
+from spakky.core.service.interfaces.service import IAsyncService, IService
 from spakky.event.event_publisher import (
     IAsyncEventTransport,
     IEventTransport,
@@ -21,10 +41,11 @@ from spakky.plugins.rabbitmq.common.config import RabbitMQConnectionConfig
 
 
 @Pod()
-class RabbitMQEventTransport(IEventTransport):
+class RabbitMQEventTransport(IEventTransport, IService):
     """Synchronous RabbitMQ event transport.
 
-    Sends pre-serialized event payloads to RabbitMQ queues using blocking connections.
+    Sends pre-serialized event payloads to RabbitMQ queues using a blocking
+    connection that is opened on the first send and reused afterwards.
     Optionally routes through an exchange for pub/sub patterns.
 
     Attributes:
@@ -34,6 +55,10 @@ class RabbitMQEventTransport(IEventTransport):
 
     connection_string: str
     exchange_name: str | None
+    _lock: threading.Lock
+    _connection: BlockingConnection | None
+    _channel: BlockingChannel | None
+    _declared_queues: set[str]
 
     def __init__(self, config: RabbitMQConnectionConfig) -> None:
         """Initialize the synchronous RabbitMQ event transport.
@@ -43,6 +68,69 @@ class RabbitMQEventTransport(IEventTransport):
         """
         self.connection_string = config.connection_string
         self.exchange_name = config.exchange_name
+        self._lock = threading.Lock()
+        self._connection = None
+        self._channel = None
+        self._declared_queues = set()
+
+    def _get_channel(self) -> BlockingChannel:
+        if (
+            self._connection is None
+            or self._channel is None
+            or self._connection.is_closed
+            or self._channel.is_closed
+        ):
+            self._close()
+            self._connection = BlockingConnection(URLParameters(self.connection_string))
+            self._channel = self._connection.channel()
+            if self.exchange_name is not None:
+                self._channel.exchange_declare(self.exchange_name)
+        return self._channel
+
+    def _close(self) -> None:
+        # Declarations are tied to the broker session, so they are forgotten
+        # together with the connection and replayed after reconnecting.
+        self._declared_queues.clear()
+        channel, connection = self._channel, self._connection
+        self._channel = None
+        self._connection = None
+        if channel is not None and channel.is_open:
+            channel.close()
+        if connection is not None and connection.is_open:
+            connection.close()
+
+    def _publish(
+        self,
+        event_name: str,
+        payload: bytes,
+        headers: dict[str, str],
+    ) -> None:
+        channel = self._get_channel()
+        exchange_name = self.exchange_name
+        declared_queues = self._declared_queues
+        if event_name not in declared_queues:
+            channel.queue_declare(event_name, durable=True)
+            if exchange_name is not None:
+                channel.queue_bind(event_name, exchange_name, event_name)
+            declared_queues.add(event_name)
+        channel.basic_publish(
+            exchange_name if exchange_name is not None else "",
+            event_name,
+            payload,
+            properties=BasicProperties(headers=headers),
+        )
+
+    def _publish_with_retry(
+        self,
+        event_name: str,
+        payload: bytes,
+        headers: dict[str, str],
+    ) -> None:
+        try:
+            self._publish(event_name, payload, headers)
+        except AMQPError:
+            self._close()
+            self._publish(event_name, payload, headers)
 
     @override
     def send(
@@ -53,44 +141,77 @@ class RabbitMQEventTransport(IEventTransport):
     ) -> None:
         """Send a pre-serialized event payload to RabbitMQ.
 
-        Creates a new connection, sends the payload to the appropriate queue,
-        and closes the connection.
+        Reuses the transport's connection and channel, declaring each queue
+        only once per connection. If the connection was dropped, the send is
+        retried once on a fresh connection.
 
         Args:
             event_name: Routing key / queue name for the event.
             payload: Pre-serialized JSON bytes.
             headers: Metadata headers for trace propagation.
         """
-        connection = BlockingConnection(URLParameters(self.connection_string))
-        channel = connection.channel()
-        channel.queue_declare(event_name, durable=True)
-        if self.exchange_name is not None:
-            channel.exchange_declare(self.exchange_name)
-            channel.queue_bind(event_name, self.exchange_name, event_name)
-        channel.basic_publish(
-            self.exchange_name if self.exchange_name is not None else "",
-            event_name,
-            payload,
-            properties=BasicProperties(headers=headers),
-        )
-        channel.close()
-        connection.close()
+        with self._lock:
+            self._publish_with_retry(event_name, payload, headers)
+
+    @override
+    def send_many(self, messages: Iterable[tuple[str, bytes, dict[str, str]]]) -> None:
+        """Send several pre-serialized payloads while holding the channel once.
+
+        Messages are written to the shared channel back to back in iteration
+        order, which RabbitMQ delivers per queue in FIFO order. Each message
+        keeps the single reconnect retry of ``send``.
+
+        Args:
+            messages: ``(event_name, payload, headers)`` tuples to send in order.
+        """
+        with self._lock:
+            for event_name, payload, headers in messages:
+                self._publish_with_retry(event_name, payload, headers)
+
+    @override
+    def set_stop_event(self, stop_event: threading.Event) -> None:
+        """Accept the lifecycle stop event; the transport runs no loop of its own."""
+        return
+
+    @override
+    def start(self) -> None:
+        """No-op start; the connection is opened lazily on the first send."""
+        return
+
+    @override
+    def stop(self) -> None:
+        """Close the reused channel and connection."""
+        with self._lock:
+            self._close()
 
 
 @Pod()
-class AsyncRabbitMQEventTransport(IAsyncEventTransport):
+class AsyncRabbitMQEventTransport(IAsyncEventTransport, IAsyncService):
     """Asynchronous RabbitMQ event transport.
 
-    Sends pre-serialized event payloads to RabbitMQ queues using async connections.
+    Sends pre-serialized event payloads to RabbitMQ queues using a robust
+    connection that is opened on the first send and reused afterwards.
     Optionally routes through an exchange for pub/sub patterns.
 
+    aio_pika connections are bound to the event loop that created them, so the
+    reused connection belongs to the loop of the first send; sends from any
+    other loop fall back to a short-lived connection.
+
     Attributes:
         connection_string: AMQP connection string.
         exchange_name: Optional exchange name for routing.
+        confirm_batch_size: Publisher confirms awaited together in send_many.
     """
 
     connection_string: str
     exchange_name: str | None
+    confirm_batch_size: int
+    _loop: AbstractEventLoop | None
+    _lock: Lock | None
+    _connection: AbstractRobustConnection | None
+    _channel: AbstractChannel | None
+    _exchange: AbstractExchange | None
+    _declared_queues: set[str]
 
     def __init__(self, config: RabbitMQConnectionConfig) -> None:
         """Initialize the asynchronous RabbitMQ event transport.
@@ -100,6 +221,62 @@ class AsyncRabbitMQEventTransport(IAsyncEventTransport):
         """
         self.connection_string = config.connection_string
         self.exchange_name = config.exchange_name
+        self.confirm_batch_size = config.confirm_batch_size
+        self._loop = None
+        self._lock = None
+        self._connection = None
+        self._channel = None
+        self._exchange = None
+        self._declared_queues = set()
+
+    async def _declare_exchange(self, channel: AbstractChannel) -> AbstractExchange:
+        if self.exchange_name is None:
+            return channel.default_exchange
+        return await channel.declare_exchange(self.exchange_name)
+
+    async def _declare_queue(
+        self,
+        channel: AbstractChannel,
+        exchange: AbstractExchange,
+        declared_queues: set[str],
+        event_name: str,
+    ) -> None:
+        if event_name in declared_queues:
+            return
+        queue = await channel.declare_queue(event_name, durable=True)
+        if self.exchange_name is not None:
+            await queue.bind(exchange, event_name)
+        declared_queues.add(event_name)
+
+    async def _publish(
+        self,
+        channel: AbstractChannel,
+        exchange: AbstractExchange,
+        declared_queues: set[str],
+        event_name: str,
+        payload: bytes,
+        headers: dict[str, str],
+    ) -> None:
+        await self._declare_queue(channel, exchange, declared_queues, event_name)
+        await exchange.publish(
+            Message(body=payload, headers=dict(headers)),
+            routing_key=event_name,
+        )
+
+    def _owns_running_loop(self) -> bool:
+        loop = get_running_loop()
+        if self._loop is None:
+            self._loop = loop
+            self._lock = Lock()
+        return loop is self._loop
+
+    async def _get_channel(self) -> tuple[AbstractChannel, AbstractExchange]:
+        if self._channel is None or self._exchange is None:
+            self._connection = await connect_robust(self.connection_string)
+            self._channel = await self._connection.channel()
+            self._exchange = await self._declare_exchange(self._channel)
+            self._declared_queues.clear()
+        return self._channel, self._exchange
 
     @override
     async def send(
@@ -110,26 +287,98 @@ class AsyncRabbitMQEventTransport(IAsyncEventTransport):
     ) -> None:
         """Send a pre-serialized event payload to RabbitMQ asynchronously.
 
-        Creates a new robust connection, sends the payload to the appropriate
-        queue, and closes the connection.
+        Reuses the transport's robust connection and channel, declaring each
+        queue only once per connection.
 
         Args:
             event_name: Routing key / queue name for the event.
             payload: Pre-serialized JSON bytes.
             headers: Metadata headers for trace propagation.
         """
-        async with await connect_robust(self.connection_string) as connection:
-            channel = await connection.channel()
-            exchange = (
-                await channel.declare_exchange(self.exchange_name)
-                if self.exchange_name is not None
-                else channel.default_exchange
-            )
-            queue = await channel.declare_queue(event_name, durable=True)
-            if self.exchange_name is not None:
-                await queue.bind(exchange, event_name)
-            await exchange.publish(
-                Message(body=payload, headers=dict(headers)),
-                routing_key=event_name,
+        if not self._owns_running_loop() or self._lock is None:
+            async with await connect_robust(self.connection_string) as connection:
+                channel = await connection.channel()
+                await self._publish(
+                    channel,
+                    await self._declare_exchange(channel),
+                    set(),
+                    event_name,
+                    payload,
+                    headers,
+                )
+                await channel.close()
+            return
+        async with self._lock:
+            channel, exchange = await self._get_channel()
+            await self._publish(
+                channel,
+                exchange,
+                self._declared_queues,
+                event_name,
+                payload,
+                headers,
             )
-            await channel.close()
+
+    @override
+    async def send_many(
+        self, messages: Iterable[tuple[str, bytes, dict[str, str]]]
+    ) -> None:
+        """Publish several payloads and await their broker confirms in windows.
+
+        Publishes are written back to back on the reused channel and up to
+        ``confirm_batch_size`` confirms are awaited together, instead of one
+        round-trip per message.
+
+        Args:
+            messages: ``(event_name, payload, headers)`` tuples to send in order.
+        """
+        if not self._owns_running_loop() or self._lock is None:
+            await super().send_many(messages)
+            return
+        async with self._lock:
+            channel, exchange = await self._get_channel()
+            confirms: list[Future[object]] = []
+            for event_name, payload, headers in messages:
+                await self._declare_queue(
+                    channel, exchange, self._declared_queues, event_name
+                )
+                # Tasks start in creation order and aiormq serializes frames
+                # behind a FIFO lock, so publish order is preserved.
+                confirms.append(
+                    ensure_future(
+                        exchange.publish(
+                            Message(body=payload, headers=dict(headers)),
+                            routing_key=event_name,
+                        )
+                    )
+                )
+                if len(confirms) >= self.confirm_batch_size:
+                    await gather(*confirms)
+                    confirms.clear()
+            await gather(*confirms)
+
+    @override
+    def set_stop_event(self, stop_event: locks.Event) -> None:
+        """Accept the lifecycle stop event; the transport runs no loop of its own."""
+        return
+
+    @override
+    async def start_async(self) -> None:
+        """No-op start; the connection is opened lazily on the first send."""
+        return
+
+    @override
+    async def stop_async(self) -> None:
+        """Close the reused channel and connection."""
+        channel, connection = self._channel, self._connection
+        owned = self._loop is get_running_loop()
+        self._loop = None
+        self._lock = None
+        self._connection = None
+        self._channel = None
+        self._exchange = None
+        self._declared_queues.clear()
+        if not owned or channel is None or connection is None:
+            return
+        await channel.close()
+        await connection.close()
@@ -4,9 +4,9 @@ Automatically discovers and registers event handlers from @EventHandler
 decorated classes, connecting them to RabbitMQ consumers with dependency injection.
 """
 
-from functools import wraps
-from inspect import getmembers, iscoroutinefunction, ismethod
-from logging import getLogger
+from collections.abc import Callable
+from inspect import isfunction
+from logging import INFO, getLogger
 from typing import Any
 
 from spakky.auth import IAuthContextSnapshotVerifier, get_effective_auth_metadata
@@ -31,6 +31,126 @@ from typing import override
 
 logger = getLogger(__name__)
 
+type EventRouteEntry = tuple[str, Callable[..., Any], EventRoute[AbstractEvent]]
+"""Handler method name, function and integration event route."""
+
+_EVENT_ROUTE_CACHE: dict[type[object], tuple[EventRouteEntry, ...]] = {}
+
+
+def _integration_event_routes(
+    handler_type: type[object],
+) -> tuple[EventRouteEntry, ...]:
+    # Routes depend only on the handler class, so its MRO is scanned once and
+    # later pods of the same class skip per-attribute descriptor resolution.
+    cached = _EVENT_ROUTE_CACHE.get(handler_type)
+    if cached is not None:
+        return cached
+    seen_names: set[str] = set()
+    entries: list[EventRouteEntry] = []
+    for klass in handler_type.__mro__:
+        for name, member in vars(klass).items():
+            if name in seen_names:
+                continue
+            seen_names.add(name)
+            if not isfunction(member):
+                continue
+            route: EventRoute[AbstractEvent] | None = EventRoute[
+                AbstractEvent
+            ].get_or_none(member)
+            if route is None:
+                continue
+            if not issubclass(route.event_type, AbstractIntegrationEvent):
+                continue
+            entries.append((name, member, route))
+    routes = tuple(sorted(entries, key=lambda entry: entry[0]))
+    _EVENT_ROUTE_CACHE[handler_type] = routes
+    return routes
+
+
+class _HandlerEndpoint:
+    """Consumer callback that resolves the handler pod and invokes one method.
+
+    Everything that does not depend on the message (the operation name, auth
+    flag and collaborators) is bound once at registration; slots keep each
+    call to attribute reads on a fixed layout. For singleton handler pods the
+    bound method is cached after the first message.
+    """
+
+    __slots__ = (
+        "_application_context",
+        "_container",
+        "_auth_boundary",
+        "_controller_type",
+        "_method_name",
+        "_event_type",
+        "_protected",
+        "_operation",
+        "_singleton",
+        "_target",
+    )
+
+    def __init__(
+        self,
+        application_context: IApplicationContext,
+        container: IContainer,
+        auth_boundary: RabbitMQAuthBoundary,
+        controller_type: type[object],
+        method_name: str,
+        event_type: type[AbstractEvent],
+        protected: bool,
+        singleton: bool,
+    ) -> None:
+        self._application_context = application_context
+        self._container = container
+        self._auth_boundary = auth_boundary
+        self._controller_type = controller_type
+        self._method_name = method_name
+        self._event_type = event_type
+        self._protected = protected
+        self._operation = (
+            f"{controller_type.__module__}.{controller_type.__qualname__}.{method_name}"
+        )
+        self._singleton = singleton
+        self._target: Callable[..., Any] | None = None
+
+    def _resolve(self) -> Any:
+        # Each message is handled in isolation, so clear the application
+        # context to avoid reusing dependency state between handlers.
+        self._application_context.clear_context()
+        self._auth_boundary.seed_auth_context(
+            event_type=self._event_type,
+            operation=self._operation,
+            protected=self._protected,
+        )
+        target = self._target
+        if target is not None:
+            return target
+        controller_instance = self._container.get(self._controller_type)
+        # The method is looked up on the resolved pod rather than taken from
+        # the class so that aspect proxies still intercept the call.
+        target = getattr(  # event handler method lookup
+            controller_instance, self._method_name
+        )  # 프레임워크 내부: 컨트롤러 메서드 동적 디스패치
+        if self._singleton:
+            # A singleton pod never changes, so later messages reuse the
+            # bound method; it is resolved lazily so the container hands out
+            # the final (possibly aspect-proxied) instance.
+            self._target = target
+        return target
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self._resolve()(*args, **kwargs)
+
+
+class _AsyncHandlerEndpoint(_HandlerEndpoint):
+    """Async variant of the consumer callback for coroutine handler methods."""
+
+    __slots__ = ()
+
+    @override
+    async def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return await self._resolve()(*args, **kwargs)
+
 
 @Order(1)
 @Pod()
@@ -39,11 +159,15 @@ class RabbitMQPostProcessor(IPostProcessor, IContainerAware, IApplicationContext
 
     Scans @EventHandler decorated classes for @event decorated methods and
     automatically registers them with the appropriate RabbitMQ consumer
-    (sync or async) with proper dependency injection.
+    (sync or async) with proper dependency injection. How many messages each
+    registered route may have in flight is bounded by the consumers'
+    ``prefetch_count`` setting.
     """
 
     __container: IContainer
     __application_context: IApplicationContext
+    __consumer: IEventConsumer | None
+    __async_consumer: IAsyncEventConsumer | None
 
     @override
     def set_container(self, container: IContainer) -> None:
@@ -53,6 +177,32 @@ class RabbitMQPostProcessor(IPostProcessor, IContainerAware, IApplicationContext
             container: The IoC container.
         """
         self.__container = container
+        self.__consumer = None
+        self.__async_consumer = None
+
+    def __inject_propagator(self, consumer: object) -> None:
+        propagator = self.__application_context.get_or_none(ITracePropagator)
+        if propagator is None:
+            return
+        # 프레임워크 내부: consumer 인터페이스가 선택적 propagator를 지원하는지 확인
+        if hasattr(consumer, "set_propagator"):  # optional tracing bridge injection
+            consumer.set_propagator(propagator)
+
+    def __get_consumer(self) -> IEventConsumer:
+        # Resolved on the first sync route and reused for later handler pods.
+        if self.__consumer is None:
+            consumer = self.__container.get(IEventConsumer)
+            self.__inject_propagator(consumer)
+            self.__consumer = consumer
+        return self.__consumer
+
+    def __get_async_consumer(self) -> IAsyncEventConsumer:
+        # Resolved on the first async route and reused for later handler pods.
+        if self.__async_consumer is None:
+            async_consumer = self.__container.get(IAsyncEventConsumer)
+            self.__inject_propagator(async_consumer)
+            self.__async_consumer = async_consumer
+        return self.__async_consumer
 
     @override
     def set_application_context(self, application_context: IApplicationContext) -> None:
@@ -80,94 +230,51 @@ class RabbitMQPostProcessor(IPostProcessor, IContainerAware, IApplicationContext
         if not EventHandler.exists(pod):
             return pod
         handler: EventHandler = EventHandler.get(pod)
-        consumer = self.__container.get(IEventConsumer)
-        async_consumer = self.__container.get(IAsyncEventConsumer)
+        routes = _integration_event_routes(handler.type_)
+        if not routes:
+            return pod
         auth_boundary = RabbitMQAuthBoundary(
             self.__application_context,
             self.__container.get_or_none(IAuthContextSnapshotVerifier),
         )
-        propagator = self.__application_context.get_or_none(ITracePropagator)
-        if propagator is not None:
-            # 프레임워크 내부: consumer 인터페이스가 선택적 propagator를 지원하는지 확인
-            if hasattr(consumer, "set_propagator"):  # optional tracing bridge injection
-                consumer.set_propagator(propagator)
-            # 프레임워크 내부: consumer 인터페이스가 선택적 propagator를 지원하는지 확인
-            if hasattr(  # optional tracing bridge injection
-                async_consumer, "set_propagator"
-            ):
-                async_consumer.set_propagator(propagator)
-        for name, method in getmembers(pod, ismethod):
-            route: EventRoute[AbstractEvent] | None = EventRoute[
-                AbstractEvent
-            ].get_or_none(method)
-            if route is None:
-                continue
-            if not issubclass(route.event_type, AbstractIntegrationEvent):
-                continue
+        # Routes are collected per consumer and registered in one call each.
+        sync_routes: list[tuple[type[AbstractEvent], _HandlerEndpoint]] = []
+        async_routes: list[tuple[type[AbstractEvent], _AsyncHandlerEndpoint]] = []
+        # Route lines are only built when INFO is enabled for this logger.
+        log_routes = logger.isEnabledFor(INFO)
+        processor_name = type(self).__name__
+        for name, method, route in routes:
             auth_metadata = get_effective_auth_metadata(
                 method,
                 owner_type=handler.type_,
             )
 
-            # pylint: disable=line-too-long
-            logger.info(
-                f"[{type(self).__name__}] {route.event_type.__name__} -> {method.__qualname__}"
-            )
-
-            if iscoroutinefunction(method):
-
-                @wraps(method)
-                async def async_endpoint(
-                    *args: Any,
-                    method_name: str = name,
-                    controller_type: type[object] = handler.type_,
-                    event_type: type[AbstractEvent] = route.event_type,
-                    protected: bool = auth_metadata.protected,
-                    context: IContainer = self.__container,
-                    **kwargs: Any,
-                ) -> Any:
-                    # Each message is handled in isolation, so clear the
-                    # application context to avoid reusing dependency state.
-                    self.__application_context.clear_context()
-                    auth_boundary.seed_auth_context(
-                        event_type=event_type,
-                        operation=f"{controller_type.__module__}.{controller_type.__qualname__}.{method_name}",
-                        protected=protected,
-                    )
-                    controller_instance = context.get(controller_type)
-                    # 프레임워크 내부: 컨트롤러 메서드 동적 디스패치
-                    method_to_call = getattr(  # event handler method lookup
-                        controller_instance, method_name
-                    )
-                    return await method_to_call(*args, **kwargs)
-
-                async_consumer.register(route.event_type, async_endpoint)
-                continue
-
-            @wraps(method)
-            def endpoint(
-                *args: Any,
-                method_name: str = name,
-                controller_type: type[object] = handler.type_,
-                event_type: type[AbstractEvent] = route.event_type,
-                protected: bool = auth_metadata.protected,
-                context: IContainer = self.__container,
-                **kwargs: Any,
-            ) -> Any:
-                # Synchronous consumers share threads, so drop any lingering
-                # scoped data before invoking the handler.
-                self.__application_context.clear_context()
-                auth_boundary.seed_auth_context(
-                    event_type=event_type,
-                    operation=f"{controller_type.__module__}.{controller_type.__qualname__}.{method_name}",
-                    protected=protected,
-                )
-                controller_instance = context.get(controller_type)
-                # 프레임워크 내부: 컨트롤러 메서드 동적 디스패치
-                method_to_call = getattr(  # async event handler method lookup
-                    controller_instance, method_name
+            if log_routes:
+                logger.info(
+                    "[%s] %s -> %s",
+                    processor_name,
+                    route.event_type.__name__,
+                    method.__qualname__,
                 )
-                return method_to_call(*args, **kwargs)
 
-            consumer.register(route.event_type, endpoint)
+            endpoint_args = (
+                self.__application_context,
+                self.__container,
+                auth_boundary,
+                handler.type_,
+                name,
+                route.event_type,
+                auth_metadata.protected,
+                handler.scope is Pod.Scope.SINGLETON,
+            )
+            if route.is_async:
+                async_routes.append(
+                    (route.event_type, _AsyncHandlerEndpoint(*endpoint_args))
+                )
+                continue
+            sync_routes.append((route.event_type, _HandlerEndpoint(*endpoint_args)))
+        if sync_routes:
+            self.__get_consumer().register_many(sync_routes)
+        if async_routes:
+            self.__get_async_consumer().register_many(async_routes)
         return pod
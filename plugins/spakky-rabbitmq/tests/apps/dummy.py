@@ -1,3 +1,5 @@
+from threading import Semaphore
+from time import monotonic
 from uuid import UUID
 
 from spakky.core.common.mutability import immutable
@@ -33,6 +35,7 @@ class DummyEventHandler(IApplicationContextAware):
     __application_context: IApplicationContext
     __count: int
     __context_ids: set[UUID]
+    __processed: Semaphore
 
     @property
     def count(self) -> int:
@@ -45,6 +48,15 @@ class DummyEventHandler(IApplicationContextAware):
     def __init__(self) -> None:
         self.__count = 0
         self.__context_ids = set()
+        self.__processed = Semaphore(0)
+
+    def wait_processed(self, events: int, timeout: float) -> bool:
+        """Block until ``events`` more events are handled or ``timeout`` elapses."""
+        deadline = monotonic() + timeout
+        return all(
+            self.__processed.acquire(timeout=max(deadline - monotonic(), 0))
+            for _ in range(events)
+        )
 
     def set_application_context(self, application_context: IApplicationContext) -> None:
         self.__application_context = application_context
@@ -54,6 +66,7 @@ class DummyEventHandler(IApplicationContextAware):
         print(f"Received event: {event}")
         self.__count += 1
         self.__context_ids.add(self.__application_context.get_context_id())
+        self.__processed.release()
 
 
 @EventHandler()
@@ -63,6 +76,7 @@ class AsyncEventHandler:
     __application_context: IApplicationContext
     __count: int
     __context_ids: set[UUID]
+    __processed: Semaphore
 
     @property
     def count(self) -> int:
@@ -75,6 +89,15 @@ class AsyncEventHandler:
     def __init__(self) -> None:
         self.__count = 0
         self.__context_ids = set()
+        self.__processed = Semaphore(0)
+
+    def wait_processed(self, events: int, timeout: float) -> bool:
+        """Block until ``events`` more events are handled or ``timeout`` elapses."""
+        deadline = monotonic() + timeout
+        return all(
+            self.__processed.acquire(timeout=max(deadline - monotonic(), 0))
+            for _ in range(events)
+        )
 
     def set_application_context(self, application_context: IApplicationContext) -> None:
         self.__application_context = application_context
@@ -84,3 +107,4 @@ class AsyncEventHandler:
         print(f"Async handler received event: {event}")
         self.__count += 1
         self.__context_ids.add(self.__application_context.get_context_id())
+        self.__processed.release()
@@ -7,14 +7,15 @@ from collections.abc import Generator
 import pytest
 from spakky.core.application.application import SpakkyApplication
 from spakky.core.application.application_context import ApplicationContext
-from testcontainers.rabbitmq import (
-    RabbitMqContainer,  # type: ignore[import-untyped]  # testcontainers lacks type stubs
-)
 
 import spakky.plugins.rabbitmq
 from spakky.plugins.rabbitmq.common.constants import RABBITMQ_CONFIG_ENV_PREFIX
 from tests import apps
 
+RABBITMQ_PORT = 25672
+RABBITMQ_USER = "test"
+RABBITMQ_PASSWORD = "test"
+
 
 @pytest.fixture(name="environment_variables", scope="package", autouse=True)
 def setup_environment_variables_fixture() -> Generator[None, Any, None]:
@@ -22,9 +23,9 @@ def setup_environment_variables_fixture() -> Generator[None, Any, None]:
     env_updates = {
         f"{RABBITMQ_CONFIG_ENV_PREFIX}USE_SSL": "false",
         f"{RABBITMQ_CONFIG_ENV_PREFIX}HOST": "localhost",
-        f"{RABBITMQ_CONFIG_ENV_PREFIX}PORT": str(25672),
-        f"{RABBITMQ_CONFIG_ENV_PREFIX}USER": "test",
-        f"{RABBITMQ_CONFIG_ENV_PREFIX}PASSWORD": "test",
+        f"{RABBITMQ_CONFIG_ENV_PREFIX}PORT": str(RABBITMQ_PORT),
+        f"{RABBITMQ_CONFIG_ENV_PREFIX}USER": RABBITMQ_USER,
+        f"{RABBITMQ_CONFIG_ENV_PREFIX}PASSWORD": RABBITMQ_PASSWORD,
         f"{RABBITMQ_CONFIG_ENV_PREFIX}EXCHANGE_NAME": "test_exchange",
     }
     previous_values = {key: environ.get(key) for key in env_updates}
@@ -43,17 +44,20 @@ def setup_environment_variables_fixture() -> Generator[None, Any, None]:
 
 
 @pytest.fixture(scope="package", autouse=True)
-def rabbitmq_container(environment_variables: None) -> Generator[None, None, None]:
+def rabbitmq_container() -> Generator[None, None, None]:
     """RabbitMQ 테스트 컨테이너 실행 및 정리."""
-    port = int(environ[f"{RABBITMQ_CONFIG_ENV_PREFIX}PORT"])
-    username = environ[f"{RABBITMQ_CONFIG_ENV_PREFIX}USER"]
-    password = environ[f"{RABBITMQ_CONFIG_ENV_PREFIX}PASSWORD"]
+    # Imported here so collection and unit runs skip loading the docker client.
+    from testcontainers.rabbitmq import (
+        RabbitMqContainer,  # type: ignore[import-untyped]  # testcontainers lacks type stubs
+    )
 
+    # The broker listens on a fixed port, so its lifetime does not depend on
+    # the environment variables that point the application at it.
     container = RabbitMqContainer(
-        port=port,
-        username=username,
-        password=password,
-    ).with_bind_ports(port, port)
+        port=RABBITMQ_PORT,
+        username=RABBITMQ_USER,
+        password=RABBITMQ_PASSWORD,
+    ).with_bind_ports(RABBITMQ_PORT, RABBITMQ_PORT)
 
     with container:
         yield
@@ -1,5 +1,4 @@
-from asyncio import sleep as asleep  # type: ignore[attr-defined] - compatibility alias used by integration test
-from time import sleep, time
+from asyncio import to_thread
 
 import pytest
 from pydantic import TypeAdapter
@@ -25,39 +24,27 @@ from tests.apps.dummy import (
     SampleEvent,
 )
 
-POLL_INTERVAL = 0.05  # seconds between checks
 MAX_WAIT_TIME = 10  # maximum seconds to wait
 
 _sample_event_type_adapter: TypeAdapter[SampleEvent] = TypeAdapter(SampleEvent)
 _async_event_type_adapter: TypeAdapter[AsyncTestEvent] = TypeAdapter(AsyncTestEvent)
 
 
-def wait_for_count(
-    handler: DummyEventHandler | AsyncEventHandler, expected: int
+def wait_for_processed(
+    handler: DummyEventHandler | AsyncEventHandler, events: int
 ) -> None:
-    """Poll until handler.count reaches expected value or timeout."""
-    start = time()
-    while handler.count < expected:
-        if time() - start > MAX_WAIT_TIME:
-            raise TimeoutError(
-                f"Timed out waiting for handler.count to reach {expected}. "
-                f"Current count: {handler.count}"
-            )
-        sleep(POLL_INTERVAL)
-
-
-async def async_wait_for_count(
-    handler: DummyEventHandler | AsyncEventHandler, expected: int
+    """Wait until the handler signals ``events`` more handled events or timeout."""
+    if not handler.wait_processed(events, MAX_WAIT_TIME):
+        raise TimeoutError(
+            f"Timed out waiting for {events} events. Current count: {handler.count}"
+        )
+
+
+async def async_wait_for_processed(
+    handler: DummyEventHandler | AsyncEventHandler, events: int
 ) -> None:
-    """Async poll until handler.count reaches expected value or timeout."""
-    start = time()
-    while handler.count < expected:
-        if time() - start > MAX_WAIT_TIME:
-            raise TimeoutError(
-                f"Timed out waiting for handler.count to reach {expected}. "
-                f"Current count: {handler.count}"
-            )
-        await asleep(POLL_INTERVAL)
+    """Wait off the event loop until the handler signals ``events`` more events."""
+    await to_thread(wait_for_processed, handler, events)
 
 
 def test_synchronous_event(app: SpakkyApplication) -> None:
@@ -69,7 +56,7 @@ def test_synchronous_event(app: SpakkyApplication) -> None:
     event2 = SampleEvent(message="Goodbye, World!")
     transport.send("SampleEvent", _sample_event_type_adapter.dump_json(event1), {})
     transport.send("SampleEvent", _sample_event_type_adapter.dump_json(event2), {})
-    wait_for_count(handler, initial_count + 2)
+    wait_for_processed(handler, 2)
     assert handler.count == initial_count + 2
 
 
@@ -87,7 +74,7 @@ async def test_asynchronous_event(app: SpakkyApplication) -> None:
     await transport.send(
         "SampleEvent", _sample_event_type_adapter.dump_json(event2), {}
     )
-    await async_wait_for_count(handler, initial_count + 2)
+    await async_wait_for_processed(handler, 2)
     assert handler.count == initial_count + 2
 
 
@@ -110,7 +97,7 @@ async def test_async_handler_execution(app: SpakkyApplication) -> None:
     await transport.send(
         "AsyncTestEvent", _async_event_type_adapter.dump_json(event3), {}
     )
-    await async_wait_for_count(handler, initial_count + 3)
+    await async_wait_for_processed(handler, 3)
 
     # All async events should be handled
     assert handler.count == initial_count + 3
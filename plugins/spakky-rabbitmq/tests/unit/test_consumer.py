@@ -190,6 +190,60 @@ def test_sync_consumer_route_event_handler_success_expect_ack(
     channel.basic_ack.assert_called_once_with(123)
 
 
+def test_sync_consumer_route_same_tag_twice_expect_route_reused_with_late_handler(
+    config: RabbitMQConnectionConfig,
+) -> None:
+    """consumer tag별 route를 재사용하면서도 이후 등록된 핸들러를 호출함을 검증한다."""
+    consumer = RabbitMQEventConsumer(config)
+    handler1 = MagicMock()
+    handler2 = MagicMock()
+    consumer.register(SampleIntegrationEvent, handler1)
+    consumer.type_lookup["test_tag"] = SampleIntegrationEvent
+
+    channel = MagicMock()
+    method_frame = MagicMock()
+    method_frame.consumer_tag = "test_tag"
+    method_frame.delivery_tag = 123
+    properties = MagicMock()
+    properties.headers = {}
+    body = b'{"data": "test"}'
+
+    consumer._route_event_handler(channel, method_frame, properties, body)
+    route = consumer._route("test_tag")
+    consumer.register(SampleIntegrationEvent, handler2)
+    consumer._route_event_handler(channel, method_frame, properties, body)
+
+    assert consumer._route("test_tag") is route
+    assert handler1.call_count == 2
+    handler2.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_async_consumer_route_same_tag_twice_expect_route_reused_with_late_handler(
+    config: RabbitMQConnectionConfig,
+) -> None:
+    """비동기 consumer도 tag별 route를 재사용하면서 이후 등록된 핸들러를 호출함을 검증한다."""
+    consumer = AsyncRabbitMQEventConsumer(config)
+    handler1 = AsyncMock()
+    handler2 = AsyncMock()
+    consumer.register(SampleIntegrationEvent, handler1)
+    consumer.type_lookup["test_tag"] = SampleIntegrationEvent
+
+    message = AsyncMock()
+    message.consumer_tag = "test_tag"
+    message.delivery_tag = 123
+    message.body = b'{"data": "test"}'
+
+    await consumer._route_event_handler(message)
+    route = consumer._route("test_tag")
+    consumer.register(SampleIntegrationEvent, handler2)
+    await consumer._route_event_handler(message)
+
+    assert consumer._route("test_tag") is route
+    assert handler1.await_count == 2
+    handler2.assert_awaited_once()
+
+
 def test_sync_consumer_malformed_payload_default_ack_expect_handler_not_called(
     config: RabbitMQConnectionConfig,
 ) -> None:
@@ -213,6 +267,24 @@ def test_sync_consumer_malformed_payload_default_ack_expect_handler_not_called(
     channel.basic_nack.assert_not_called()
 
 
+def test_sync_consumer_register_many_expect_handlers_grouped_per_event(
+    config: RabbitMQConnectionConfig,
+) -> None:
+    """register_many가 이벤트별로 핸들러를 순서대로 묶어 한 번에 등록함을 검증한다."""
+    consumer = RabbitMQEventConsumer(config)
+    handler1 = MagicMock()
+    handler2 = MagicMock()
+    handler3 = MagicMock()
+
+    consumer.register_many(
+        [(SampleIntegrationEvent, handler1), (SampleIntegrationEvent, handler2)]
+    )
+    consumer.register_many([(SampleIntegrationEvent, handler3)])
+
+    assert consumer.handlers[SampleIntegrationEvent] == [handler1, handler2, handler3]
+    assert SampleIntegrationEvent in consumer.type_adapters
+
+
 def test_sync_consumer_register_multiple_handlers_expect_all_called(
     config: RabbitMQConnectionConfig,
 ) -> None:
@@ -345,6 +417,24 @@ def test_sync_consumer_auth_allow_decision_uses_error_policy(
     assert action is RabbitMQAuthFailureAction.NACK_REQUEUE
 
 
+def test_async_consumer_register_many_expect_handlers_grouped_per_event(
+    config: RabbitMQConnectionConfig,
+) -> None:
+    """비동기 register_many가 이벤트별로 핸들러를 순서대로 묶어 등록함을 검증한다."""
+    consumer = AsyncRabbitMQEventConsumer(config)
+    handler1 = AsyncMock()
+    handler2 = AsyncMock()
+    handler3 = AsyncMock()
+
+    consumer.register_many(
+        [(SampleIntegrationEvent, handler1), (SampleIntegrationEvent, handler2)]
+    )
+    consumer.register_many([(SampleIntegrationEvent, handler3)])
+
+    assert consumer.handlers[SampleIntegrationEvent] == [handler1, handler2, handler3]
+    assert SampleIntegrationEvent in consumer.type_adapters
+
+
 @pytest.mark.asyncio
 async def test_async_consumer_register_multiple_handlers_expect_all_called(
     config: RabbitMQConnectionConfig,
@@ -551,6 +641,7 @@ def test_sync_consumer_initialize_expect_connection_and_channel_created(
     ):
         consumer.initialize()
 
+    mock_channel.basic_qos.assert_called_once_with(prefetch_count=config.prefetch_count)
     mock_channel.queue_declare.assert_called_once_with(
         "SampleIntegrationEvent", durable=True
     )
@@ -640,6 +731,7 @@ async def test_async_consumer_initialize_async_expect_connection_and_channel_cre
     ):
         await consumer.initialize_async()
 
+    mock_channel.set_qos.assert_awaited_once_with(prefetch_count=config.prefetch_count)
     mock_channel.declare_queue.assert_called_once_with(
         "SampleIntegrationEvent", durable=True
     )
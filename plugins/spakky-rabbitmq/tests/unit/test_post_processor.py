@@ -5,6 +5,7 @@ and correctly ignores DomainEvent handlers.
 """
 
 from collections.abc import Callable
+from logging import INFO, WARNING
 from unittest.mock import Mock
 
 import pytest
@@ -19,6 +20,7 @@ from spakky.auth import (
 )
 from spakky.core.application.application_context import ApplicationContext
 from spakky.core.common.mutability import immutable
+from spakky.core.pod.annotations.pod import Pod
 from spakky.domain.models.event import AbstractDomainEvent, AbstractIntegrationEvent
 from spakky.event.event_consumer import (
     IAsyncEventConsumer,
@@ -32,7 +34,10 @@ from spakky.plugins.rabbitmq.auth import (
 from spakky.tracing.propagator import ITracePropagator
 from typing import override
 
-from spakky.plugins.rabbitmq.post_processor import RabbitMQPostProcessor
+from spakky.plugins.rabbitmq.post_processor import (
+    RabbitMQPostProcessor,
+    _integration_event_routes,
+)
 
 
 @immutable
@@ -107,10 +112,50 @@ def test_rabbitmq_post_processor_registers_integration_event_expect_success() ->
     handler_instance = SampleEventHandler()
     post_processor.post_process(handler_instance)
 
-    # Verify that register was called for IntegrationEvent
-    mock_consumer.register.assert_called_once()
-    call_args = mock_consumer.register.call_args
-    assert call_args[0][0] == SampleIntegrationEvent
+    # Verify that register_many was called for IntegrationEvent
+    mock_consumer.register_many.assert_called_once()
+    routes = mock_consumer.register_many.call_args[0][0]
+    assert [event for event, _ in routes] == [SampleIntegrationEvent]
+
+
+def test_rabbitmq_post_processor_same_handler_class_twice_expect_routes_scanned_once() -> (
+    None
+):
+    """같은 핸들러 클래스의 Pod를 다시 처리하면 캐시된 route로 등록하는지 검증한다."""
+
+    class BaseEventHandler:
+        @on_event(SampleIntegrationEvent)
+        def handle_inherited(self, event: SampleIntegrationEvent) -> None:
+            pass
+
+        @on_event(SampleIntegrationEvent)
+        def handle_overridden(self, event: SampleIntegrationEvent) -> None:
+            pass
+
+    @EventHandler()
+    class SampleEventHandler(BaseEventHandler):
+        @override
+        def handle_overridden(self, event: SampleIntegrationEvent) -> None:
+            pass
+
+    mock_consumer = Mock(spec=IEventConsumer)
+    mock_async_consumer = Mock(spec=IAsyncEventConsumer)
+    mock_container = Mock()
+    mock_container.get.side_effect = lambda t: (
+        mock_consumer if t == IEventConsumer else mock_async_consumer
+    )
+    mock_context = Mock(spec=ApplicationContext)
+
+    post_processor = RabbitMQPostProcessor()
+    post_processor.set_container(mock_container)
+    post_processor.set_application_context(mock_context)
+    post_processor.post_process(SampleEventHandler())
+    routes = _integration_event_routes(SampleEventHandler)
+    post_processor.post_process(SampleEventHandler())
+
+    assert _integration_event_routes(SampleEventHandler) is routes
+    assert [name for name, _, _ in routes] == ["handle_inherited"]
+    assert mock_consumer.register_many.call_count == 2
 
 
 def test_rabbitmq_post_processor_registers_async_integration_event_expect_success() -> (
@@ -148,10 +193,10 @@ def test_rabbitmq_post_processor_registers_async_integration_event_expect_succes
     handler_instance = SampleEventHandler()
     post_processor.post_process(handler_instance)
 
-    # Verify that register was called for IntegrationEvent on async consumer
-    mock_async_consumer.register.assert_called_once()
-    call_args = mock_async_consumer.register.call_args
-    assert call_args[0][0] == SampleIntegrationEvent
+    # Verify that register_many was called for IntegrationEvent on async consumer
+    mock_async_consumer.register_many.assert_called_once()
+    routes = mock_async_consumer.register_many.call_args[0][0]
+    assert [event for event, _ in routes] == [SampleIntegrationEvent]
 
 
 def test_rabbitmq_post_processor_ignores_domain_event_expect_no_registration() -> None:
@@ -192,9 +237,9 @@ def test_rabbitmq_post_processor_ignores_domain_event_expect_no_registration() -
     handler_instance = SampleEventHandler()
     post_processor.post_process(handler_instance)
 
-    # Verify that register was NOT called because DomainEvent is not IntegrationEvent
-    mock_consumer.register.assert_not_called()
-    mock_async_consumer.register.assert_not_called()
+    # Verify that register_many was NOT called because DomainEvent is not IntegrationEvent
+    mock_consumer.register_many.assert_not_called()
+    mock_async_consumer.register_many.assert_not_called()
 
 
 def test_rabbitmq_post_processor_mixed_events_expect_only_integration_registered() -> (
@@ -237,12 +282,12 @@ def test_rabbitmq_post_processor_mixed_events_expect_only_integration_registered
     post_processor.post_process(handler_instance)
 
     # Verify that only IntegrationEvent was registered
-    mock_consumer.register.assert_called_once()
-    call_args = mock_consumer.register.call_args
-    assert call_args[0][0] == SampleIntegrationEvent
+    mock_consumer.register_many.assert_called_once()
+    routes = mock_consumer.register_many.call_args[0][0]
+    assert [event for event, _ in routes] == [SampleIntegrationEvent]
 
     # DomainEvent should not be registered
-    mock_async_consumer.register.assert_not_called()
+    mock_async_consumer.register_many.assert_not_called()
 
 
 def test_rabbitmq_post_processor_non_event_handler_expect_pod_returned() -> None:
@@ -295,7 +340,7 @@ def test_rabbitmq_post_processor_method_without_event_route_expect_skipped() ->
     post_processor.post_process(handler_instance)
 
     # Only IntegrationEvent handler should be registered
-    mock_consumer.register.assert_called_once()
+    mock_consumer.register_many.assert_called_once()
 
 
 def test_rabbitmq_post_processor_sync_endpoint_invocation_expect_handler_called() -> (
@@ -313,11 +358,11 @@ def test_rabbitmq_post_processor_sync_endpoint_invocation_expect_handler_called(
 
     captured_endpoint = {"fn": None}
 
-    def capture_register(event_type: type, endpoint: Mock) -> None:
-        captured_endpoint["fn"] = endpoint
+    def capture_register(routes: list[tuple[type, Mock]]) -> None:
+        captured_endpoint["fn"] = routes[0][1]
 
     mock_consumer = Mock(spec=IEventConsumer)
-    mock_consumer.register.side_effect = capture_register
+    mock_consumer.register_many.side_effect = capture_register
     mock_async_consumer = Mock(spec=IAsyncEventConsumer)
 
     handler_instance = SampleEventHandler()
@@ -375,13 +420,17 @@ def test_rabbitmq_post_processor_protected_sync_endpoint_seeds_auth_after_clear(
     ] = {"fn": None}
 
     def capture_register(
-        event_type: type[SampleIntegrationEvent],
-        endpoint: Callable[[SampleIntegrationEvent], None],
+        routes: list[
+            tuple[
+                type[SampleIntegrationEvent],
+                Callable[[SampleIntegrationEvent], None],
+            ]
+        ],
     ) -> None:
-        captured_endpoint["fn"] = endpoint
+        captured_endpoint["fn"] = routes[0][1]
 
     mock_consumer = Mock(spec=IEventConsumer)
-    mock_consumer.register.side_effect = capture_register
+    mock_consumer.register_many.side_effect = capture_register
     mock_async_consumer = Mock(spec=IAsyncEventConsumer)
     handler_instance = SampleEventHandler()
     mock_container = Mock()
@@ -436,12 +485,12 @@ async def test_rabbitmq_post_processor_async_endpoint_invocation_expect_handler_
 
     captured_endpoint = {"fn": None}
 
-    def capture_register(event_type: type, endpoint: Mock) -> None:
-        captured_endpoint["fn"] = endpoint
+    def capture_register(routes: list[tuple[type, Mock]]) -> None:
+        captured_endpoint["fn"] = routes[0][1]
 
     mock_consumer = Mock(spec=IEventConsumer)
     mock_async_consumer = Mock(spec=IAsyncEventConsumer)
-    mock_async_consumer.register.side_effect = capture_register
+    mock_async_consumer.register_many.side_effect = capture_register
 
     handler_instance = SampleEventHandler()
     mock_container = Mock()
@@ -474,6 +523,134 @@ async def test_rabbitmq_post_processor_async_endpoint_invocation_expect_handler_
     mock_context.clear_context.assert_called_once()
 
 
+@pytest.mark.parametrize(
+    ("scope", "expected_lookups"),
+    [(Pod.Scope.SINGLETON, 1), (Pod.Scope.PROTOTYPE, 2)],
+)
+def test_rabbitmq_post_processor_endpoint_called_twice_expect_lookups_by_scope(
+    scope: Pod.Scope,
+    expected_lookups: int,
+) -> None:
+    """singleton 핸들러는 첫 메시지 이후 조회를 재사용하고 prototype은 매번 조회함을 검증한다."""
+
+    @EventHandler(scope=scope)
+    class SampleEventHandler:
+        @on_event(SampleIntegrationEvent)
+        def handle_integration_event(self, event: SampleIntegrationEvent) -> None:
+            pass
+
+    captured_endpoint = {"fn": None}
+
+    def capture_register(routes: list[tuple[type, Mock]]) -> None:
+        captured_endpoint["fn"] = routes[0][1]
+
+    mock_consumer = Mock(spec=IEventConsumer)
+    mock_consumer.register_many.side_effect = capture_register
+    handler_instance = SampleEventHandler()
+    mock_container = Mock()
+    mock_container.get.side_effect = lambda t: (
+        mock_consumer if t == IEventConsumer else handler_instance
+    )
+    mock_container.get_or_none.return_value = None
+    mock_context = Mock(spec=ApplicationContext)
+    mock_context.get_or_none.return_value = None
+
+    post_processor = RabbitMQPostProcessor()
+    post_processor.set_container(mock_container)
+    post_processor.set_application_context(mock_context)
+    post_processor.post_process(handler_instance)
+
+    event = SampleIntegrationEvent(message="test")
+    assert captured_endpoint["fn"] is not None
+    captured_endpoint["fn"](event)
+    captured_endpoint["fn"](event)
+
+    handler_lookups = [
+        call
+        for call in mock_container.get.call_args_list
+        if call.args[0] is SampleEventHandler
+    ]
+    assert len(handler_lookups) == expected_lookups
+    assert mock_context.clear_context.call_count == 2
+
+
+def test_rabbitmq_post_processor_sync_handlers_expect_consumer_resolved_once() -> None:
+    """동기 핸들러만 있으면 async consumer를 조회하지 않고 동기 consumer도 한 번만 조회하는지 검증한다."""
+
+    @EventHandler()
+    class FirstEventHandler:
+        @on_event(SampleIntegrationEvent)
+        def handle_integration_event(self, event: SampleIntegrationEvent) -> None:
+            pass
+
+    @EventHandler()
+    class SecondEventHandler:
+        @on_event(SampleIntegrationEvent)
+        def handle_integration_event(self, event: SampleIntegrationEvent) -> None:
+            pass
+
+    @EventHandler()
+    class DomainOnlyEventHandler:
+        @on_event(SampleDomainEvent)
+        def handle_domain_event(self, event: SampleDomainEvent) -> None:
+            pass
+
+    mock_consumer = Mock(spec=IEventConsumer)
+    mock_container = Mock()
+    mock_container.get.return_value = mock_consumer
+    mock_container.get_or_none.return_value = None
+    mock_context = Mock(spec=ApplicationContext)
+    mock_context.get_or_none.return_value = None
+
+    post_processor = RabbitMQPostProcessor()
+    post_processor.set_container(mock_container)
+    post_processor.set_application_context(mock_context)
+    post_processor.post_process(FirstEventHandler())
+    post_processor.post_process(SecondEventHandler())
+    post_processor.post_process(DomainOnlyEventHandler())
+
+    mock_container.get.assert_called_once_with(IEventConsumer)
+    assert mock_consumer.register_many.call_count == 2
+
+
+def test_rabbitmq_post_processor_async_handlers_expect_routes_batched_per_pod() -> None:
+    """비동기 핸들러 Pod마다 route를 한 번의 register_many로 넘기고 consumer는 재사용하는지 검증한다."""
+
+    @EventHandler()
+    class FirstEventHandler:
+        @on_event(SampleIntegrationEvent)
+        async def handle_first(self, event: SampleIntegrationEvent) -> None:
+            pass
+
+        @on_event(SampleIntegrationEvent)
+        async def handle_second(self, event: SampleIntegrationEvent) -> None:
+            pass
+
+    @EventHandler()
+    class SecondEventHandler:
+        @on_event(SampleIntegrationEvent)
+        async def handle_integration_event(self, event: SampleIntegrationEvent) -> None:
+            pass
+
+    mock_async_consumer = Mock(spec=IAsyncEventConsumer)
+    mock_container = Mock()
+    mock_container.get.return_value = mock_async_consumer
+    mock_container.get_or_none.return_value = None
+    mock_context = Mock(spec=ApplicationContext)
+    mock_context.get_or_none.return_value = None
+
+    post_processor = RabbitMQPostProcessor()
+    post_processor.set_container(mock_container)
+    post_processor.set_application_context(mock_context)
+    post_processor.post_process(FirstEventHandler())
+    post_processor.post_process(SecondEventHandler())
+
+    mock_container.get.assert_called_once_with(IAsyncEventConsumer)
+    assert [
+        len(call.args[0]) for call in mock_async_consumer.register_many.call_args_list
+    ] == [2, 1]
+
+
 # ---------------------------------------------------------------------------
 # Propagator injection tests
 # ---------------------------------------------------------------------------
@@ -490,6 +667,18 @@ def test_rabbitmq_post_processor_with_tracing_available_expect_propagator_inject
         def handle_integration_event(self, event: SampleIntegrationEvent) -> None:
             pass
 
+        @on_event(SampleIntegrationEvent)
+        async def handle_integration_event_async(
+            self, event: SampleIntegrationEvent
+        ) -> None:
+            pass
+
+        @on_event(SampleIntegrationEvent)
+        async def handle_integration_event_async_again(
+            self, event: SampleIntegrationEvent
+        ) -> None:
+            pass
+
     mock_propagator = Mock(spec=ITracePropagator)
     mock_consumer = Mock()
     mock_async_consumer = Mock()
@@ -588,3 +777,58 @@ def test_rabbitmq_post_processor_with_tracing_but_no_set_propagator_expect_skipp
 
     assert not hasattr(mock_consumer, "set_propagator")
     assert not hasattr(mock_async_consumer, "set_propagator")
+
+
+def test_rabbitmq_post_processor_info_enabled_expect_route_logged(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """INFO가 켜져 있으면 등록된 route를 지연 포맷팅으로 기록함을 검증한다."""
+
+    @EventHandler()
+    class SampleEventHandler:
+        @on_event(SampleIntegrationEvent)
+        def handle_integration_event(self, event: SampleIntegrationEvent) -> None:
+            pass
+
+    mock_container = Mock()
+    mock_container.get.return_value = Mock(spec=IEventConsumer)
+    mock_container.get_or_none.return_value = None
+    mock_context = Mock(spec=ApplicationContext)
+    mock_context.get_or_none.return_value = None
+
+    post_processor = RabbitMQPostProcessor()
+    post_processor.set_container(mock_container)
+    post_processor.set_application_context(mock_context)
+    with caplog.at_level(INFO, logger="spakky.plugins.rabbitmq.post_processor"):
+        post_processor.post_process(SampleEventHandler())
+
+    assert [record.getMessage() for record in caplog.records] == [
+        "[RabbitMQPostProcessor] SampleIntegrationEvent -> "
+        f"{SampleEventHandler.handle_integration_event.__qualname__}"
+    ]
+
+
+def test_rabbitmq_post_processor_info_disabled_expect_no_route_log(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """INFO가 꺼져 있으면 route 로그를 남기지 않음을 검증한다."""
+
+    @EventHandler()
+    class SampleEventHandler:
+        @on_event(SampleIntegrationEvent)
+        def handle_integration_event(self, event: SampleIntegrationEvent) -> None:
+            pass
+
+    mock_container = Mock()
+    mock_container.get.return_value = Mock(spec=IEventConsumer)
+    mock_container.get_or_none.return_value = None
+    mock_context = Mock(spec=ApplicationContext)
+    mock_context.get_or_none.return_value = None
+
+    post_processor = RabbitMQPostProcessor()
+    post_processor.set_container(mock_container)
+    post_processor.set_application_context(mock_context)
+    with caplog.at_level(WARNING, logger="spakky.plugins.rabbitmq.post_processor"):
+        post_processor.post_process(SampleEventHandler())
+
+    assert caplog.records == []
@@ -4,9 +4,10 @@ Automatically discovers and registers CLI commands from @CliController
 decorated classes, with support for both sync and async command handlers.
 """
 
+import asyncio
 from functools import wraps
-from inspect import Parameter, Signature, getmembers, iscoroutinefunction, signature
-from logging import getLogger
+from inspect import Parameter, Signature, iscoroutinefunction, signature
+from logging import INFO, getLogger
 import os
 from typing import Any, Never, cast
 from collections.abc import Callable
@@ -40,7 +41,6 @@ from spakky.core.pod.interfaces.post_processor import IPostProcessor
 from typing import override
 
 from spakky.plugins.typer.stereotypes.cli_controller import CliController, TyperCommand
-from spakky.plugins.typer.utils.asyncio import run_async
 from typer import Exit, Option, Typer, echo
 from typer.models import OptionInfo
 
@@ -86,6 +86,22 @@ def _with_auth_token_option(method: Callable[..., object]) -> Signature:
     )
 
 
+def _command_names(controller_type: type[object]) -> list[str]:
+    # Class dicts are walked directly instead of getmembers(), which resolves
+    # every attribute (dunders and descriptors included) on the instance.
+    seen_names: set[str] = set()
+    names: list[str] = []
+    for klass in controller_type.__mro__[:-1]:
+        for name, member in vars(klass).items():
+            if name in seen_names:
+                continue
+            seen_names.add(name)
+            if callable(member) and TyperCommand.exists(member):
+                names.append(name)
+    # Sorted like getmembers() so commands keep their registration order.
+    return sorted(names)
+
+
 def _invocation(controller_type: type[object], method_name: str) -> AuthInvocation:
     return AuthInvocation(
         boundary="CLI",
@@ -160,7 +176,7 @@ class TyperCLIPostProcessor(IPostProcessor, IContainerAware, IApplicationContext
         """Register commands from CLI controllers.
 
         Scans the controller for methods decorated with @command and registers
-        them as Typer commands. Automatically wraps async methods with run_async.
+        them as Typer commands. Async methods are run in a fresh event loop.
 
         Args:
             pod: The Pod to process, potentially a CLI controller.
@@ -172,121 +188,142 @@ class TyperCLIPostProcessor(IPostProcessor, IContainerAware, IApplicationContext
             return pod
         controller = CliController.get(pod)
         command_group: Typer = Typer(name=controller.group_name)
-        for name, method in getmembers(pod, callable):
-            command: TyperCommand | None = TyperCommand.get_or_none(method)
-            if command is not None:
-                auth_metadata = get_effective_auth_metadata(
-                    method,
-                    owner_type=controller.type_,
-                )
-                existing_auth_token_parameter = _existing_auth_token_parameter(
-                    signature(method)
-                )
-                # pylint: disable=line-too-long
+        log_commands = logger.isEnabledFor(INFO)
+        processor_name = type(self).__name__
+        singleton = controller.scope is Pod.Scope.SINGLETON
+        # Bound command methods of a singleton controller, filled on first use
+        # so the container hands out the final (possibly aspect-proxied) pod.
+        bound_methods: dict[str, Callable[..., Any]] = {}
+        for name in _command_names(controller.type_):
+            # 프레임워크 내부: 커맨드로 표시된 메서드만 bound method로 조회
+            method = getattr(pod, name)  # command decorator method lookup
+            command: TyperCommand = TyperCommand.get(method)
+            auth_metadata = get_effective_auth_metadata(
+                method,
+                owner_type=controller.type_,
+            )
+            existing_auth_token_parameter = _existing_auth_token_parameter(
+                signature(method)
+            )
+            is_async = iscoroutinefunction(method)
+            if log_commands:
                 logger.info(
-                    f"[{type(self).__name__}] {command.name!r} -> {'async' if iscoroutinefunction(method) else ''} {method.__qualname__}"
+                    "[%s] %r -> %s %s",
+                    processor_name,
+                    command.name,
+                    "async" if is_async else "",
+                    method.__qualname__,
                 )
 
-                @wraps(method)
-                def endpoint(
-                    *args: Any,
-                    method_name: str = name,
-                    controller_type: type[object] = controller.type_,
-                    container: IContainer = self.__container,
-                    protected: bool = auth_metadata.protected,
-                    auth_token_parameter: str | None = existing_auth_token_parameter,
-                    **kwargs: Any,
-                ) -> Any:
-                    auth_token = (
-                        kwargs.get(auth_token_parameter)
-                        if auth_token_parameter is not None
-                        else kwargs.pop(AUTH_TOKEN_OPTION_PARAMETER, None)
-                    )
-                    if auth_token is None:
-                        auth_token = os.environ.get(AUTH_TOKEN_ENV_VAR)
-                    # CLI invocations often share the same interpreter session,
-                    # so purge any context-scoped Pods to avoid cross-command leaks.
-                    self.__application_context.clear_context()
-                    invocation = _invocation(controller_type, method_name)
-                    if isinstance(auth_token, str) and auth_token:
-                        provider = container.get_or_none(IAuthenticationProvider)
-                        if provider is None:
-                            if protected:
-                                _exit(
-                                    AuthorizationDecision.error(
-                                        AuthorizationReasonCode.VERIFICATION_PROVIDER_UNAVAILABLE
-                                    )
-                                )
-                        else:
-                            try:
-                                auth_context = provider.authenticate(
-                                    _carrier(auth_token),
-                                    invocation,
+            @wraps(method)
+            def endpoint(
+                *args: Any,
+                method_name: str = name,
+                is_async: bool = is_async,
+                singleton: bool = singleton,
+                bound_methods: dict[str, Callable[..., Any]] = bound_methods,
+                controller_type: type[object] = controller.type_,
+                container: IContainer = self.__container,
+                protected: bool = auth_metadata.protected,
+                auth_token_parameter: str | None = existing_auth_token_parameter,
+                **kwargs: Any,
+            ) -> Any:
+                auth_token = (
+                    kwargs.get(auth_token_parameter)
+                    if auth_token_parameter is not None
+                    else kwargs.pop(AUTH_TOKEN_OPTION_PARAMETER, None)
+                )
+                if auth_token is None:
+                    auth_token = os.environ.get(AUTH_TOKEN_ENV_VAR)
+                # CLI invocations often share the same interpreter session,
+                # so purge any context-scoped Pods to avoid cross-command leaks.
+                self.__application_context.clear_context()
+                invocation = _invocation(controller_type, method_name)
+                if isinstance(auth_token, str) and auth_token:
+                    provider = container.get_or_none(IAuthenticationProvider)
+                    if provider is None:
+                        if protected:
+                            _exit(
+                                AuthorizationDecision.error(
+                                    AuthorizationReasonCode.VERIFICATION_PROVIDER_UNAVAILABLE
                                 )
-                            except AuthVerificationProviderUnavailableError:
-                                _exit(
-                                    AuthorizationDecision.error(
-                                        AuthorizationReasonCode.VERIFICATION_PROVIDER_UNAVAILABLE
-                                    )
+                            )
+                    else:
+                        try:
+                            auth_context = provider.authenticate(
+                                _carrier(auth_token),
+                                invocation,
+                            )
+                        except AuthVerificationProviderUnavailableError:
+                            _exit(
+                                AuthorizationDecision.error(
+                                    AuthorizationReasonCode.VERIFICATION_PROVIDER_UNAVAILABLE
                                 )
-                            except AuthenticationError:
-                                _exit(
-                                    AuthorizationDecision.challenge(
-                                        AuthorizationReasonCode.INVALID_CREDENTIAL
-                                    )
+                            )
+                        except AuthenticationError:
+                            _exit(
+                                AuthorizationDecision.challenge(
+                                    AuthorizationReasonCode.INVALID_CREDENTIAL
                                 )
-                            store_auth_context(self.__application_context, auth_context)
-                    elif protected:
-                        _exit(
-                            AuthorizationDecision.challenge(
-                                AuthorizationReasonCode.MISSING_CREDENTIAL
                             )
+                        store_auth_context(self.__application_context, auth_context)
+                elif protected:
+                    _exit(
+                        AuthorizationDecision.challenge(
+                            AuthorizationReasonCode.MISSING_CREDENTIAL
                         )
+                    )
+                method_to_call = bound_methods.get(method_name)
+                if method_to_call is None:
                     controller_instance = container.get(controller_type)
                     # 프레임워크 내부: CLI 커맨드 메서드 동적 디스패치
                     method_to_call = getattr(  # command decorator method lookup
                         controller_instance, method_name
                     )
-                    if iscoroutinefunction(method_to_call):
-                        method_to_call = run_async(method_to_call)
-                    try:
-                        return method_to_call(*args, **kwargs)
-                    except AuthContextNotFoundError:
-                        _exit(
-                            AuthorizationDecision.challenge(
-                                AuthorizationReasonCode.MISSING_CREDENTIAL
-                            )
+                    if singleton:
+                        bound_methods[method_name] = method_to_call
+                try:
+                    if is_async:
+                        # The coroutine is run directly; wrapping the freshly
+                        # bound method with run_async would allocate per call.
+                        return asyncio.run(method_to_call(*args, **kwargs))
+                    return method_to_call(*args, **kwargs)
+                except AuthContextNotFoundError:
+                    _exit(
+                        AuthorizationDecision.challenge(
+                            AuthorizationReasonCode.MISSING_CREDENTIAL
                         )
-                    except AuthRequirementProviderUnavailableError:
-                        _exit(
-                            AuthorizationDecision.error(
-                                AuthorizationReasonCode.VERIFICATION_PROVIDER_UNAVAILABLE
-                            )
+                    )
+                except AuthRequirementProviderUnavailableError:
+                    _exit(
+                        AuthorizationDecision.error(
+                            AuthorizationReasonCode.VERIFICATION_PROVIDER_UNAVAILABLE
                         )
-                    except AuthRequirementDeniedError as error:
-                        _exit(
-                            error.decision
-                            if error.decision is not None
-                            else AuthorizationDecision.deny(
-                                AuthorizationReasonCode.POLICY_DENIED
-                            )
+                    )
+                except AuthRequirementDeniedError as error:
+                    _exit(
+                        error.decision
+                        if error.decision is not None
+                        else AuthorizationDecision.deny(
+                            AuthorizationReasonCode.POLICY_DENIED
                         )
+                    )
 
-                cast(Any, endpoint).__signature__ = _with_auth_token_option(method)
-
-                command_group.command(
-                    name=command.name,
-                    cls=command.cls,
-                    context_settings=command.context_settings,
-                    help=command.help,
-                    epilog=command.epilog,
-                    short_help=command.short_help,
-                    options_metavar=command.options_metavar,
-                    add_help_option=command.add_help_option,
-                    no_args_is_help=command.no_args_is_help,
-                    hidden=command.hidden,
-                    deprecated=command.deprecated,
-                    rich_help_panel=command.rich_help_panel,
-                )(endpoint)
+            cast(Any, endpoint).__signature__ = _with_auth_token_option(method)
+
+            command_group.command(
+                name=command.name,
+                cls=command.cls,
+                context_settings=command.context_settings,
+                help=command.help,
+                epilog=command.epilog,
+                short_help=command.short_help,
+                options_metavar=command.options_metavar,
+                add_help_option=command.add_help_option,
+                no_args_is_help=command.no_args_is_help,
+                hidden=command.hidden,
+                deprecated=command.deprecated,
+                rich_help_panel=command.rich_help_panel,
+            )(endpoint)
         self.__app.add_typer(command_group)
         return pod
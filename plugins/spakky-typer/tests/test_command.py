@@ -1,8 +1,11 @@
 from inspect import signature
 from typing import Literal, override
 
+import logging
+
 from click.testing import Result
-from pytest import MonkeyPatch
+import pytest
+from pytest import LogCaptureFixture, MonkeyPatch
 import spakky.auth
 from spakky.auth import (
     AuthCapability,
@@ -29,7 +32,11 @@ from typer import Option, Typer
 from typer.testing import CliRunner
 
 import spakky.plugins.typer
-from spakky.plugins.typer.post_processor import _with_auth_token_option
+import spakky.plugins.typer.post_processor as post_processor_module
+from spakky.plugins.typer.post_processor import (
+    _command_names,
+    _with_auth_token_option,
+)
 from spakky.plugins.typer.stereotypes.cli_controller import CliController, command
 
 
@@ -448,3 +455,111 @@ def test_existing_auth_token_option_is_preserved_and_used_for_seeding(
     assert result.exit_code == 0
     assert result.output == "cli-user:existing-token\n"
     assert _AUTH_CREDENTIALS[0].material == "existing-token"
+
+
+def test_command_names_overridden_method_expect_subclass_definition_wins() -> None:
+    """하위 클래스가 커맨드가 아닌 메서드로 재정의하면 커맨드 목록에서 제외되는지 검증한다."""
+
+    class BaseCommands:
+        @command("first")
+        def first(self) -> None:
+            return None
+
+        @command("second")
+        def second(self) -> None:
+            return None
+
+    class DerivedCommands(BaseCommands):
+        def first(self) -> None:
+            return None
+
+    assert _command_names(BaseCommands) == ["first", "second"]
+    assert _command_names(DerivedCommands) == ["second"]
+
+
+def test_post_process_info_logging_expect_command_routes_logged(
+    caplog: LogCaptureFixture,
+) -> None:
+    """INFO 로깅이 켜져 있으면 등록된 커맨드 경로가 기록되는지 검증한다."""
+    with caplog.at_level(logging.INFO, logger="spakky.plugins.typer.post_processor"):
+        app, _ = _start_auth_cli(include_auth_plugin=False, provider=None)
+    app.stop()
+
+    assert "'open' ->  AuthBoundaryController.open_command" in caplog.text
+
+
+def test_command_invocation_expect_async_dispatch_resolved_at_registration(
+    cli: Typer,
+    runner: CliRunner,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """커맨드 실행 시 코루틴 여부를 다시 검사하지 않고 등록 시점의 결과를 사용하는지 검증한다."""
+
+    def fail_iscoroutinefunction(_: object) -> bool:
+        pytest.fail("iscoroutinefunction called on invocation")
+
+    monkeypatch.setattr(
+        post_processor_module, "iscoroutinefunction", fail_iscoroutinefunction
+    )
+
+    async_result: Result = runner.invoke(cli, ["dummy-controller", "first-command"])
+    sync_result: Result = runner.invoke(cli, ["dummy-controller", "sync-function"])
+
+    assert async_result.output == "First Command!\n"
+    assert sync_result.output == "It is synchronous!\n"
+
+
+@CliController("counted-singleton")
+class CountedSingletonController:
+    @command("run")
+    def run(self) -> None:
+        print("run")
+
+
+@CliController("counted-prototype", scope=Pod.Scope.PROTOTYPE)
+class CountedPrototypeController:
+    @command("run")
+    def run(self) -> None:
+        print("run")
+
+
+@pytest.mark.parametrize(
+    ("controller_type", "group", "expected_lookups"),
+    [
+        (CountedSingletonController, "counted-singleton", 1),
+        (CountedPrototypeController, "counted-prototype", 2),
+    ],
+)
+def test_command_invoked_twice_expect_controller_lookups_per_scope(
+    runner: CliRunner,
+    monkeypatch: MonkeyPatch,
+    controller_type: type[object],
+    group: str,
+    expected_lookups: int,
+) -> None:
+    """싱글톤 컨트롤러는 bound method를 재사용하고 프로토타입은 호출마다 조회하는지 검증한다."""
+    context = ApplicationContext()
+    app = (
+        SpakkyApplication(context)
+        .load_plugins(include={spakky.plugins.typer.PLUGIN_NAME})
+        .add(_get_auth_cli)
+        .add(controller_type)
+    )
+    app.start()
+    lookups: list[object] = []
+    original_get = context.get
+
+    def counting_get(type_: type[object]) -> object:
+        lookups.append(type_)
+        return original_get(type_)
+
+    try:
+        counted_cli = context.get(type_=Typer)
+        monkeypatch.setattr(context, "get", counting_get)
+        first = runner.invoke(counted_cli, [group, "run"])
+        second = runner.invoke(counted_cli, [group, "run"])
+    finally:
+        app.stop()
+
+    assert first.output == second.output == "run\n"
+    assert len(lookups) == expected_lookups
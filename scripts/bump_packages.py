@@ -33,7 +33,8 @@ import json
 import os
 import re
 import subprocess
-import tomllib
+import sys
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Annotated
 
@@ -47,6 +48,7 @@ from common import (
     ScriptError,
     console,
     get_all_packages,
+    load_pyproject,
     print_error,
     print_header,
     print_info,
@@ -54,6 +56,12 @@ from common import (
     run_command,
 )
 
+# The script already runs inside the workspace environment (``uv run python``),
+# so commitizen is started from this interpreter rather than through another
+# ``uv run`` that would re-resolve the environment on every call.
+COMMITIZEN = (sys.executable, "-m", "commitizen")
+BUMP_VERSION_PATTERN = re.compile(r"bump: version [\d.]+ → ([\d.]+)")
+
 app = typer.Typer(
     help="Coordinate version bumps across the workspace.",
     no_args_is_help=False,
@@ -74,15 +82,6 @@ class BumpError(ScriptError):
         super().__init__()
 
 
-class PatternNotFoundError(BumpError):
-    """Raised when a regex pattern is not found in a file."""
-
-    def __init__(self, pattern: str, path: Path) -> None:
-        self.pattern = pattern
-        self.path = path
-        super().__init__(f"Pattern '{pattern}' not found in {path}")
-
-
 # -----------------------------------------------------------------------------
 # Package Categorization
 # -----------------------------------------------------------------------------
@@ -98,8 +97,7 @@ def get_package_dependencies(
     """
     pyproject_path = pkg.full_path / "pyproject.toml"
 
-    with open(pyproject_path, "rb") as f:
-        config = tomllib.load(f)
+    config = load_pyproject(pyproject_path)
 
     project = config.get("project", {})
     return {
@@ -108,16 +106,22 @@ def get_package_dependencies(
     }
 
 
-def categorize_packages() -> tuple[list[PackageInfo], list[PackageInfo]]:
+def categorize_packages(
+    packages: list[PackageInfo] | None = None,
+) -> tuple[list[PackageInfo], list[PackageInfo]]:
     """Categorize packages into core and plugin packages.
 
     Core packages: Depend on 'spakky' but are NOT in spakky's optional-dependencies
     Plugin packages: Listed in spakky's optional-dependencies
 
+    Args:
+        packages: Pre-loaded workspace packages (optional).
+
     Returns:
         Tuple of (core_packages, plugin_packages)
     """
-    packages = get_all_packages()
+    if packages is None:
+        packages = get_all_packages()
     packages_by_name = {pkg.name: pkg for pkg in packages}
 
     # Find spakky package
@@ -177,7 +181,7 @@ def get_next_version() -> str | None:
         BumpError: If commitizen fails unexpectedly.
     """
     result = subprocess.run(
-        ["uv", "run", "cz", "bump", "--dry-run", "--yes"],
+        [*COMMITIZEN, "bump", "--dry-run", "--yes"],
         cwd=WORKSPACE_ROOT,
         text=True,
         capture_output=True,
@@ -193,7 +197,7 @@ def get_next_version() -> str | None:
         raise BumpError(result.stderr.strip() or result.stdout.strip())
 
     output = result.stdout + result.stderr
-    match = re.search(r"bump: version [\d.]+ → ([\d.]+)", output)
+    match = BUMP_VERSION_PATTERN.search(output)
     if not match:
         raise BumpError("Unable to parse new version from commitizen output")
 
@@ -210,7 +214,7 @@ def perform_commitizen_bump(new_version: str) -> None:
         BumpError: If commitizen fails.
     """
     result = subprocess.run(
-        ["uv", "run", "cz", "bump", "--yes", "--files-only"],
+        [*COMMITIZEN, "bump", "--yes", "--files-only"],
         cwd=WORKSPACE_ROOT,
         text=True,
         capture_output=True,
@@ -223,71 +227,81 @@ def perform_commitizen_bump(new_version: str) -> None:
     print_success(f"Updated workspace version to {new_version} via commitizen")
 
 
-def replace_pattern(path: Path, pattern: str, replacement: str) -> None:
-    """Replace all occurrences of a regex pattern inside a file.
+def replace_version_constraints(
+    path: Path,
+    package_names: Iterable[str],
+    new_version: str,
+) -> None:
+    """Rewrite ``"<name>>=X.Y.Z"`` constraints for several packages in one pass.
 
-    Args:
-        path: Path to the file.
-        pattern: Regex pattern to search for.
-        replacement: Replacement string.
+    All names are matched by a single compiled alternation, so the file is
+    scanned once and written back only if a constraint changed. Packages
+    without a matching constraint are left alone.
 
-    Raises:
-        PatternNotFoundError: If pattern is not found.
+    Args:
+        path: Path to the pyproject.toml file.
+        package_names: Names of the packages whose constraints are updated.
+        new_version: The version to set for all constraints.
     """
+    names = "|".join(re.escape(name) for name in package_names)
+    if not names:
+        return
+    pattern = re.compile(rf'"({names})>=[\d.]+"')
     content = path.read_text()
-    new_content, count = re.subn(pattern, replacement, content)
-    if count == 0:
-        raise PatternNotFoundError(pattern, path)
-    path.write_text(new_content)
+    new_content = pattern.sub(
+        lambda match: f'"{match.group(1)}>={new_version}"',
+        content,
+    )
+    if new_content != content:
+        path.write_text(new_content)
 
 
-def sync_dependency_versions(new_version: str) -> None:
+def sync_dependency_versions(
+    new_version: str,
+    packages: list[PackageInfo],
+) -> None:
     """Align inter-package version constraints with the new release version.
 
     Args:
         new_version: The version to set for all dependencies.
+        packages: Workspace packages to update.
     """
     print_info("Updating inter-package dependency constraints...")
 
-    packages = get_all_packages()
     packages_by_name = {pkg.name: pkg for pkg in packages}
-    core_packages, plugin_packages = categorize_packages()
+    _, plugin_packages = categorize_packages(packages)
 
     # Get spakky package for updating optional dependencies
+    # Plugins may not be in optional deps yet; those are skipped
     spakky_pkg = packages_by_name.get("spakky")
     if spakky_pkg:
-        core_pyproject = spakky_pkg.full_path / "pyproject.toml"
-        for plugin in plugin_packages:
-            try:
-                pattern = rf'"{plugin.name}>=([\d.]+)"'
-                replacement = f'"{plugin.name}>={new_version}"'
-                replace_pattern(core_pyproject, pattern, replacement)
-            except PatternNotFoundError:
-                pass  # Plugin may not be in optional deps yet
+        replace_version_constraints(
+            spakky_pkg.full_path / "pyproject.toml",
+            (plugin.name for plugin in plugin_packages),
+            new_version,
+        )
 
     # Update each package's dependencies with proper version constraints
     for pkg in packages:
         if pkg.name == "spakky":
             continue
 
-        package_pyproject = pkg.full_path / "pyproject.toml"
         deps = get_package_dependencies(pkg)
         dependencies = deps["dependencies"]
 
         if not isinstance(dependencies, list):
             continue
 
-        for dep in dependencies:
-            dep_name = (
-                dep.split(">=")[0].split("==")[0].split("[")[0].strip().strip('"')
-            )
-            if dep_name in packages_by_name:
-                try:
-                    pattern = rf'"{dep_name}>=([\d.]+)"'
-                    replacement = f'"{dep_name}>={new_version}"'
-                    replace_pattern(package_pyproject, pattern, replacement)
-                except PatternNotFoundError:
-                    pass  # Dependency may use different format
+        dep_names = {
+            dep.split(">=")[0].split("==")[0].split("[")[0].strip().strip('"')
+            for dep in dependencies
+        }
+        # Dependencies using a different constraint format are skipped
+        replace_version_constraints(
+            pkg.full_path / "pyproject.toml",
+            sorted(dep_names & packages_by_name.keys()),
+            new_version,
+        )
 
 
 # -----------------------------------------------------------------------------
@@ -317,14 +331,15 @@ entire workspace.
     changelog_path.write_text(content)
 
 
-def refresh_changelogs(version: str) -> None:
+def refresh_changelogs(version: str, packages: list[PackageInfo]) -> None:
     """Regenerate changelog stubs for every package.
 
     Args:
         version: The version being released.
+        packages: Workspace packages to write changelogs for.
     """
     print_info("Refreshing package changelog stubs...")
-    for pkg in get_all_packages():
+    for pkg in packages:
         write_changelog(pkg, version)
 
 
@@ -335,7 +350,7 @@ def refresh_changelogs(version: str) -> None:
 
 def stage_all_changes() -> None:
     """Stage all changes for commit."""
-    run_command(["git", "add", "-A"], cwd=WORKSPACE_ROOT)
+    run_command(["git", "add", "-A"], cwd=WORKSPACE_ROOT, capture=False)
 
 
 def create_release_commit(version: str) -> None:
@@ -346,7 +361,13 @@ def create_release_commit(version: str) -> None:
     """
     message_lines = [f"chore(release): v{version}", "", f"- workspace: v{version}"]
     commit_message = "\n".join(message_lines)
-    run_command(["git", "commit", "-m", commit_message], cwd=WORKSPACE_ROOT)
+    # Output is not inspected, so git (and its hooks) write to the terminal
+    # directly instead of through pipes drained by Python.
+    run_command(
+        ["git", "commit", "-m", commit_message],
+        cwd=WORKSPACE_ROOT,
+        capture=False,
+    )
     print_success(f"Created release commit for v{version}")
 
 
@@ -359,6 +380,7 @@ def create_release_tag(version: str) -> None:
     run_command(
         ["git", "tag", "-a", f"v{version}", "-m", f"Release v{version}"],
         cwd=WORKSPACE_ROOT,
+        capture=False,
     )
     print_success(f"Created tag v{version}")
 
@@ -368,18 +390,17 @@ def create_release_tag(version: str) -> None:
 # -----------------------------------------------------------------------------
 
 
-def write_github_output(key: str, value: str) -> None:
-    """Write a key-value pair to GitHub Actions output.
+def write_github_outputs(outputs: dict[str, str]) -> None:
+    """Write key-value pairs to GitHub Actions output in a single append.
 
     Args:
-        key: Output key name.
-        value: Output value.
+        outputs: Output key names mapped to their values.
     """
     output_path = os.environ.get("GITHUB_OUTPUT")
     if not output_path:
         return
     with open(output_path, "a", encoding="utf-8") as file:
-        file.write(f"{key}={value}\n")
+        file.writelines(f"{key}={value}\n" for key, value in outputs.items())
 
 
 # -----------------------------------------------------------------------------
@@ -421,9 +442,13 @@ def main(
             print_info("Dry run - no files modified")
             raise typer.Exit(0)
 
+        # The workspace layout does not change during a release, so the
+        # member pyproject files are parsed once and shared by every step.
+        packages = get_all_packages()
+
         perform_commitizen_bump(next_version)
-        sync_dependency_versions(next_version)
-        refresh_changelogs(next_version)
+        sync_dependency_versions(next_version, packages)
+        refresh_changelogs(next_version, packages)
 
         stage_all_changes()
         create_release_commit(next_version)
@@ -431,9 +456,12 @@ def main(
         if tag:
             create_release_tag(next_version)
 
-        packages = get_all_packages()
-        write_github_output("released_version", next_version)
-        write_github_output("released_packages", json.dumps([p.name for p in packages]))
+        write_github_outputs(
+            {
+                "released_version": next_version,
+                "released_packages": json.dumps([p.name for p in packages]),
+            }
+        )
 
         print_header("Release Artifacts Generated")
 
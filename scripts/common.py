@@ -42,6 +42,7 @@ from lib import (
     get_staged_files,
     get_upstream_branch,
     get_workspace_members,
+    load_pyproject,
     print_error,
     print_header,
     print_info,
@@ -90,4 +91,5 @@ __all__ = [
     "get_package_by_path",
     "get_package_info",
     "get_workspace_members",
+    "load_pyproject",
 ]
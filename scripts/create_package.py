@@ -20,7 +20,6 @@ Usage:
 from __future__ import annotations
 
 import re
-import tomllib
 from enum import Enum
 from pathlib import Path
 from typing import Annotated
@@ -34,6 +33,7 @@ from common import (
     ScriptError,
     console,
     get_all_packages,
+    load_pyproject,
     print_error,
     print_header,
     print_info,
@@ -91,8 +91,7 @@ def get_current_version() -> str:
         Current version string.
     """
     pyproject_path = WORKSPACE_ROOT / "pyproject.toml"
-    with open(pyproject_path, "rb") as f:
-        config = tomllib.load(f)
+    config = load_pyproject(pyproject_path)
     return config.get("project", {}).get("version", "0.0.1")
 
 
@@ -16,6 +16,7 @@ Output:
 from __future__ import annotations
 
 import json
+import sys
 from typing import Annotated
 
 import typer
@@ -71,30 +72,32 @@ def main(
             err_console.print(f"[dim]Comparing {base_ref}...{head_ref}[/]")
             err_console.print(f"[dim]Found {len(changed_files)} changed files[/]")
 
-        changed_packages = get_changed_packages(changed_files)
-        changed_package_names = {pkg.name for pkg in changed_packages}
-
-        # If core framework changes, test everything
-        if CORE_PACKAGE_NAME in changed_package_names:
-            if verbose:
-                err_console.print(
-                    f"[yellow]Core package '{CORE_PACKAGE_NAME}' changed, "
-                    "testing all packages[/]"
-                )
-            changed_package_names = all_package_names
-
-        # If root config files change, test everything
+        # If root config files change, test everything; checked first so the
+        # package matching and dependency graph are skipped entirely
         if changed_files & ROOT_FILES_TRIGGER_ALL:
             if verbose:
                 err_console.print(
                     "[yellow]Root config files changed, testing all packages[/]"
                 )
             changed_package_names = all_package_names
-
-        # Output JSON for GitHub Actions matrix (use print, not console.print
-        # to avoid Rich wrapping long lines which breaks GitHub Actions output)
+        else:
+            changed_packages = get_changed_packages(changed_files)
+            changed_package_names = {pkg.name for pkg in changed_packages}
+
+            # If core framework changes, test everything
+            if CORE_PACKAGE_NAME in changed_package_names:
+                if verbose:
+                    err_console.print(
+                        f"[yellow]Core package '{CORE_PACKAGE_NAME}' changed, "
+                        "testing all packages[/]"
+                    )
+                changed_package_names = all_package_names
+
+        # Output compact JSON for GitHub Actions matrix (write to stdout, not
+        # console.print, to avoid Rich wrapping long lines which breaks GitHub
+        # Actions output)
         result = sorted(changed_package_names)
-        print(json.dumps(result))
+        sys.stdout.write(json.dumps(result, separators=(",", ":")) + "\n")
 
         if verbose:
             err_console.print(f"[dim]Output: {len(result)} packages[/]")
@@ -59,6 +59,7 @@ from lib.workspace import (
     get_package_by_path,
     get_package_info,
     get_workspace_members,
+    load_pyproject,
 )
 
 __all__ = [
@@ -99,4 +100,5 @@ __all__ = [
     "get_package_by_path",
     "get_package_info",
     "get_workspace_members",
+    "load_pyproject",
 ]
@@ -3,12 +3,19 @@
 from __future__ import annotations
 
 import subprocess
+from pathlib import PurePosixPath
 
 from lib.config import WORKSPACE_ROOT
 from lib.models import PackageInfo
 from lib.workspace import get_all_packages
 
 
+def _split_paths(output: str) -> set[str]:
+    # -z output is NUL-terminated and leaves paths unquoted, so names with
+    # spaces or non-ASCII characters come through verbatim.
+    return {path for path in output.split("\0") if path}
+
+
 def get_staged_files() -> set[str]:
     """Get list of files staged for commit.
 
@@ -16,7 +23,7 @@ def get_staged_files() -> set[str]:
         Set of file paths relative to workspace root.
     """
     result = subprocess.run(
-        ["git", "diff", "--cached", "--name-only", "--diff-filter=ACMR"],
+        ["git", "diff", "--cached", "--name-only", "-z", "--diff-filter=ACMR"],
         capture_output=True,
         text=True,
         cwd=WORKSPACE_ROOT,
@@ -26,7 +33,7 @@ def get_staged_files() -> set[str]:
     if result.returncode != 0:
         return set()
 
-    return set(result.stdout.strip().split("\n")) if result.stdout.strip() else set()
+    return _split_paths(result.stdout)
 
 
 def get_upstream_branch() -> str:
@@ -58,7 +65,7 @@ def get_files_to_push() -> set[str]:
     upstream = get_upstream_branch()
 
     result = subprocess.run(
-        ["git", "diff", "--name-only", f"{upstream}..HEAD"],
+        ["git", "diff", "--name-only", "-z", f"{upstream}..HEAD"],
         capture_output=True,
         text=True,
         cwd=WORKSPACE_ROOT,
@@ -68,14 +75,14 @@ def get_files_to_push() -> set[str]:
     if result.returncode != 0:
         # Fallback: get all staged + unstaged changes
         result = subprocess.run(
-            ["git", "diff", "--name-only", "HEAD"],
+            ["git", "diff", "--name-only", "-z", "HEAD"],
             capture_output=True,
             text=True,
             cwd=WORKSPACE_ROOT,
             check=False,
         )
 
-    return set(result.stdout.strip().split("\n")) if result.stdout.strip() else set()
+    return _split_paths(result.stdout)
 
 
 def get_changed_files_between(base_ref: str, head_ref: str) -> set[str]:
@@ -90,7 +97,7 @@ def get_changed_files_between(base_ref: str, head_ref: str) -> set[str]:
     """
     # Try 3 dots first (merge base comparison)
     result = subprocess.run(
-        ["git", "diff", "--name-only", f"{base_ref}...{head_ref}"],
+        ["git", "diff", "--name-only", "-z", f"{base_ref}...{head_ref}"],
         capture_output=True,
         text=True,
         cwd=WORKSPACE_ROOT,
@@ -100,7 +107,7 @@ def get_changed_files_between(base_ref: str, head_ref: str) -> set[str]:
     if result.returncode != 0:
         # Try 2 dots (direct comparison)
         result = subprocess.run(
-            ["git", "diff", "--name-only", f"{base_ref}..{head_ref}"],
+            ["git", "diff", "--name-only", "-z", f"{base_ref}..{head_ref}"],
             capture_output=True,
             text=True,
             cwd=WORKSPACE_ROOT,
@@ -110,14 +117,14 @@ def get_changed_files_between(base_ref: str, head_ref: str) -> set[str]:
     if result.returncode != 0:
         # Final fallback
         result = subprocess.run(
-            ["git", "diff", "--name-only", "HEAD"],
+            ["git", "diff", "--name-only", "-z", "HEAD"],
             capture_output=True,
             text=True,
             cwd=WORKSPACE_ROOT,
             check=False,
         )
 
-    return set(result.stdout.strip().split("\n")) if result.stdout.strip() else set()
+    return _split_paths(result.stdout)
 
 
 def get_changed_packages(changed_files: set[str]) -> list[PackageInfo]:
@@ -136,12 +143,16 @@ def get_changed_packages(changed_files: set[str]) -> list[PackageInfo]:
     from lib.workspace import build_reverse_dependency_graph, get_dependent_packages
 
     all_packages = get_all_packages()
-    directly_changed: set[str] = set()
-
-    for pkg in all_packages:
-        path_prefix = str(pkg.path) + "/"
-        if any(f.startswith(path_prefix) for f in changed_files):
-            directly_changed.add(pkg.name)
+    # Collect every directory containing a changed file in one pass, so each
+    # package is a set lookup instead of a scan over all changed files.
+    changed_dirs = {
+        parent.as_posix()
+        for changed_file in changed_files
+        for parent in PurePosixPath(changed_file).parents
+    }
+    directly_changed = {
+        pkg.name for pkg in all_packages if pkg.path.as_posix() in changed_dirs
+    }
 
     # If core 'spakky' package changed, test all packages (shortcut)
     core_package_name = "spakky"
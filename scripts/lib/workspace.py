@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import tomllib
+from functools import cache
 from pathlib import Path
+from typing import Any
 
 from lib.config import WORKSPACE_ROOT
 from lib.errors import (
@@ -14,6 +16,30 @@ from lib.errors import (
 from lib.models import PackageInfo
 
 
+@cache
+def _parse_pyproject(path: Path, mtime_ns: int) -> dict[str, Any]:
+    # mtime_ns is only part of the cache key: rewriting a file (e.g. during a
+    # version bump) changes it, so the next load parses the new content.
+    with open(path, "rb") as f:
+        return tomllib.load(f)
+
+
+def load_pyproject(path: Path) -> dict[str, Any]:
+    """Parse a pyproject.toml file, reusing the previous parse if unchanged.
+
+    Parses are cached per path and modification time, so repeated workspace
+    scans within one script run read each file once. The returned mapping is
+    shared between callers and must not be modified.
+
+    Args:
+        path: Path to the pyproject.toml file.
+
+    Returns:
+        The parsed TOML document.
+    """
+    return _parse_pyproject(path, path.stat().st_mtime_ns)
+
+
 def get_workspace_members() -> list[str]:
     """Read workspace member paths from root pyproject.toml.
 
@@ -27,11 +53,10 @@ def get_workspace_members() -> list[str]:
     """
     pyproject_path = WORKSPACE_ROOT / "pyproject.toml"
 
-    if not pyproject_path.exists():
-        raise PyprojectNotFoundError(pyproject_path)
-
-    with open(pyproject_path, "rb") as f:
-        pyproject = tomllib.load(f)
+    try:
+        pyproject = load_pyproject(pyproject_path)
+    except FileNotFoundError as e:
+        raise PyprojectNotFoundError(pyproject_path) from e
 
     members = (
         pyproject.get("tool", {}).get("uv", {}).get("workspace", {}).get("members", [])
@@ -54,12 +79,13 @@ def get_package_info(member_path: str) -> PackageInfo | None:
     """
     pyproject_path = WORKSPACE_ROOT / member_path / "pyproject.toml"
 
-    if not pyproject_path.exists():
+    # load_pyproject stats the file anyway, so a missing file is detected
+    # there instead of with a separate exists() probe.
+    try:
+        config = load_pyproject(pyproject_path)
+    except FileNotFoundError:
         return None
 
-    with open(pyproject_path, "rb") as f:
-        config = tomllib.load(f)
-
     name = config.get("project", {}).get("name", "")
     if not name:
         return None
@@ -125,11 +151,15 @@ def get_package_by_path(path: str) -> PackageInfo:
     return info
 
 
-def get_package_dependencies(pkg: PackageInfo) -> set[str]:
+def get_package_dependencies(
+    pkg: PackageInfo,
+    workspace_names: set[str] | None = None,
+) -> set[str]:
     """Get the workspace package dependencies for a package.
 
     Args:
         pkg: PackageInfo instance.
+        workspace_names: Pre-computed names of all workspace packages (optional).
 
     Returns:
         Set of workspace package names that this package depends on.
@@ -138,14 +168,17 @@ def get_package_dependencies(pkg: PackageInfo) -> set[str]:
 
     pyproject_path = WORKSPACE_ROOT / pkg.path / "pyproject.toml"
 
-    if not pyproject_path.exists():
+    try:
+        config = load_pyproject(pyproject_path)
+    except FileNotFoundError:
         return set()
 
-    with open(pyproject_path, "rb") as f:
-        config = tomllib.load(f)
-
     deps = config.get("project", {}).get("dependencies", [])
-    all_packages = {p.name for p in get_all_packages()}
+    all_packages = (
+        workspace_names
+        if workspace_names is not None
+        else {p.name for p in get_all_packages()}
+    )
     workspace_deps: set[str] = set()
 
     for dep in deps:
@@ -169,9 +202,10 @@ def build_reverse_dependency_graph() -> dict[str, set[str]]:
     """
     packages = get_all_packages()
     reverse_deps: dict[str, set[str]] = {pkg.name: set() for pkg in packages}
+    workspace_names = set(reverse_deps)
 
     for pkg in packages:
-        deps = get_package_dependencies(pkg)
+        deps = get_package_dependencies(pkg, workspace_names)
         for dep in deps:
             if dep in reverse_deps:
                 reverse_deps[dep].add(pkg.name)